@@ -0,0 +1,27 @@
+"""
+Provide implementation of block producers responses cache.
+"""
+from django.conf import settings
+from django.core.cache import caches
+
+from generic.cache import VersionedCache
+
+DIRECTORY_VERSION_NAME = 'block-producers'
+
+RESPONSES_CACHE = VersionedCache(cache=caches['responses'], time_to_live=settings.RESPONSES_CACHE_TIME_TO_LIVE)
+
+
+def get_block_producer_version_name(identifier):
+    """
+    Get name of the version of block producer by its identifier.
+    """
+    return f'block-producer:{identifier}'
+
+
+def invalidate_block_producers_responses(identifiers):
+    """
+    Invalidate cached responses with block producers by their identifiers, including all directory listings.
+    """
+    RESPONSES_CACHE.bump(
+        DIRECTORY_VERSION_NAME, *[get_block_producer_version_name(identifier) for identifier in identifiers],
+    )
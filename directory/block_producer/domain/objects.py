@@ -5,7 +5,6 @@ from block_producer.domain.errors import (
     BlockProducerDoesNotExistForSpecifiedUsername,
     BlockProducerWithSpecifiedIdentifierDoesNotExistError,
 )
-from user.domain.errors import UserWithSpecifiedEmailAddressDoesNotExistError
 
 
 class CreateBlockProducer:
@@ -13,21 +12,17 @@ class CreateBlockProducer:
     Create block producer implementation.
     """
 
-    def __init__(self, user, block_producer):
+    def __init__(self, block_producer):
         """
         Constructor.
         """
-        self.user = user
         self.block_producer = block_producer
 
-    def do(self, user_email, info):
+    def do(self, user_id, info):
         """
-        Create a block producer.
+        Create a block producer by the authenticated user.
         """
-        if not self.user.does_exist_by_email(email=user_email):
-            raise UserWithSpecifiedEmailAddressDoesNotExistError
-
-        self.block_producer.create(email=user_email, info=info)
+        self.block_producer.create(user_id=user_id, info=info)
 
 
 class UpdateBlockProducer:
@@ -35,24 +30,20 @@ class UpdateBlockProducer:
     Update block producer implementation.
     """
 
-    def __init__(self, user, block_producer):
+    def __init__(self, block_producer):
         """
         Constructor.
         """
-        self.user = user
         self.block_producer = block_producer
 
-    def do(self, user_email, block_producer_id, info):
+    def do(self, user_id, block_producer_id, info):
         """
-        Update block producer.
+        Update block producer of the authenticated user.
         """
-        if not self.user.does_exist_by_email(email=user_email):
-            raise UserWithSpecifiedEmailAddressDoesNotExistError
-
         if not self.block_producer.does_exist(identifier=block_producer_id):
             raise BlockProducerWithSpecifiedIdentifierDoesNotExistError
 
-        self.block_producer.update(email=user_email, identifier=block_producer_id, info=info)
+        self.block_producer.update(user_id=user_id, identifier=block_producer_id, info=info)
 
 
 class LikeBlockProducer:
@@ -60,29 +51,24 @@ class LikeBlockProducer:
     Liking block producer implementation.
     """
 
-    def __init__(self, user, block_producer, block_producer_like):
+    def __init__(self, block_producer_like):
         """
         Constructor.
         """
-        self.user = user
-        self.block_producer = block_producer
         self.block_producer_like = block_producer_like
 
-    def do(self, user_email, block_producer_id):
+    def do(self, user_id, block_producer_id):
         """
-        To like a block producer.
+        To like a block producer, or to unlike it if it is already liked by the authenticated user.
+
+        Returns the like state of the block producer.
         """
-        if not self.user.does_exist_by_email(email=user_email):
-            raise UserWithSpecifiedEmailAddressDoesNotExistError
+        like_state = self.block_producer_like.toggle(user_id=user_id, block_producer_id=block_producer_id)
 
-        if not self.block_producer.does_exist(identifier=block_producer_id):
+        if like_state is None:
             raise BlockProducerWithSpecifiedIdentifierDoesNotExistError
 
-        if self.block_producer_like.does_exist(user_email=user_email, block_producer_id=block_producer_id):
-            self.block_producer_like.remove(user_email=user_email, block_producer_id=block_producer_id)
-
-        else:
-            self.block_producer_like.put(user_email=user_email, block_producer_id=block_producer_id)
+        return like_state
 
 
 class CommentBlockProducer:
@@ -90,25 +76,21 @@ class CommentBlockProducer:
     Commenting block producer implementation.
     """
 
-    def __init__(self, user, block_producer, block_producer_comment):
+    def __init__(self, block_producer, block_producer_comment):
         """
         Constructor.
         """
-        self.user = user
         self.block_producer = block_producer
         self.block_producer_comment = block_producer_comment
 
-    def do(self, user_email, block_producer_id, text):
+    def do(self, user_id, block_producer_id, text):
         """
-        To comment a block producer.
+        To comment a block producer by the authenticated user.
         """
-        if not self.user.does_exist_by_email(email=user_email):
-            raise UserWithSpecifiedEmailAddressDoesNotExistError
-
         if not self.block_producer.does_exist(identifier=block_producer_id):
             raise BlockProducerWithSpecifiedIdentifierDoesNotExistError
 
-        self.block_producer_comment.create(user_email=user_email, block_producer_id=block_producer_id, text=text)
+        self.block_producer_comment.create(user_id=user_id, block_producer_id=block_producer_id, text=text)
 
 
 class GetBlockProducer:
@@ -126,11 +108,11 @@ class GetBlockProducer:
         """
         Get block producer by its identifier.
         """
-        if not self.block_producer.does_exist(identifier=block_producer_id):
+        try:
+            return self.block_producer.get(identifier=block_producer_id)
+        except self.block_producer.DoesNotExist:
             raise BlockProducerWithSpecifiedIdentifierDoesNotExistError
 
-        return self.block_producer.get(identifier=block_producer_id)
-
 
 class GetUserLastBlockProducer:
     """
@@ -166,11 +148,65 @@ class GetBlockProducers:
         """
         self.block_producer = block_producer
 
-    def do(self):
+    def do(
+        self,
+        limit=None,
+        cursor=None,
+        with_counts=False,
+        with_is_liked=False,
+        user_id=None,
+        streamed=False,
+    ):
         """
         Get block producers.
+
+        Returns block producers and the cursor of the next page.
+        """
+        return self.block_producer.get_all(
+            limit=limit,
+            cursor=cursor,
+            with_counts=with_counts,
+            with_is_liked=with_is_liked,
+            user_id=user_id,
+            streamed=streamed,
+        )
+
+
+class GetBlockProducersByIdentifiers:
+    """
+    Get block producers by identifiers implementation.
+    """
+
+    def __init__(self, block_producer):
+        """
+        Constructor.
+        """
+        self.block_producer = block_producer
+
+    def do(self, block_producer_ids, with_counts=False, with_is_liked=False, user_id=None):
+        """
+        Get block producers by their identifiers.
+
+        Returns block producers keyed by their identifiers in the requested order and identifiers of block producers
+        which do not exist.
         """
-        return self.block_producer.get_all()
+        block_producers = self.block_producer.get_by_identifiers(
+            identifiers=block_producer_ids,
+            with_counts=with_counts,
+            with_is_liked=with_is_liked,
+            user_id=user_id,
+        )
+
+        found_block_producers = {
+            block_producer_id: block_producers[block_producer_id]
+            for block_producer_id in block_producer_ids if block_producer_id in block_producers
+        }
+
+        not_found_block_producer_ids = [
+            block_producer_id for block_producer_id in block_producer_ids if block_producer_id not in block_producers
+        ]
+
+        return found_block_producers, not_found_block_producer_ids
 
 
 class SearchBlockProducer:
@@ -184,11 +220,44 @@ class SearchBlockProducer:
         """
         self.block_producer = block_producer
 
-    def do(self, phrase):
+    def do(self, phrase, limit=None, cursor=None):
         """
         Search block producers by phrase.
+
+        Returns found block producers and the cursor of the next page.
         """
-        return self.block_producer.search(phrase=phrase)
+        return self.block_producer.search(phrase=phrase, limit=limit, cursor=cursor)
+
+
+class SuggestBlockProducers:
+    """
+    Suggest block producers implementation.
+    """
+
+    def __init__(self, block_producer, block_producers_version, cache):
+        """
+        Constructor.
+        """
+        self.block_producer = block_producer
+        self.block_producers_version = block_producers_version
+        self.cache = cache
+
+    def do(self, prefix, limit):
+        """
+        Get block producers suggestions by prefix.
+
+        Suggestions for the recent prefixes are served from the cache while the version of block producers is not
+        bumped, so changes made in any process are suggested at once.
+        """
+        key = (self.block_producers_version.get(), prefix.lower(), limit)
+
+        suggestions = self.cache.get(key)
+
+        if suggestions is None:
+            suggestions = self.block_producer.suggest(prefix=prefix, limit=limit)
+            self.cache.set(key, suggestions)
+
+        return suggestions
 
 
 class GetBlockProducerComments:
@@ -203,14 +272,44 @@ class GetBlockProducerComments:
         self.block_producer = block_producer
         self.block_producer_comment = block_producer_comment
 
-    def do(self, block_producer_id):
+    def do(self, block_producer_id, streamed=False):
         """
         Get block producer's comments.
         """
         if not self.block_producer.does_exist(identifier=block_producer_id):
             raise BlockProducerWithSpecifiedIdentifierDoesNotExistError
 
-        return self.block_producer_comment.get_all(block_producer_id=block_producer_id)
+        return self.block_producer_comment.get_all(block_producer_id=block_producer_id, streamed=streamed)
+
+
+class GetBlockProducerCommentsPage:
+    """
+    Getting page of block producer's comments implementation.
+    """
+
+    def __init__(self, block_producer, block_producer_comment):
+        """
+        Constructor.
+        """
+        self.block_producer = block_producer
+        self.block_producer_comment = block_producer_comment
+
+    def do(self, block_producer_id, limit=None, cursor=None):
+        """
+        Get page of block producer's comments.
+
+        Returns comments, the cursor of the next page and the total number of block producer's comments.
+        """
+        try:
+            comments_number = self.block_producer.get_comments_number(identifier=block_producer_id)
+        except self.block_producer.DoesNotExist:
+            raise BlockProducerWithSpecifiedIdentifierDoesNotExistError
+
+        block_producer_comments, next_cursor = self.block_producer_comment.get_page(
+            block_producer_id=block_producer_id, limit=limit, cursor=cursor,
+        )
+
+        return block_producer_comments, next_cursor, comments_number
 
 
 class GetBlockProducerLikes:
@@ -225,14 +324,14 @@ class GetBlockProducerLikes:
         self.block_producer = block_producer
         self.block_producer_like = block_producer_like
 
-    def do(self, block_producer_id):
+    def do(self, block_producer_id, limit=None, streamed=False):
         """
-        Get block producer's likes.
+        Get block producer's likes, the newest first.
         """
         if not self.block_producer.does_exist(identifier=block_producer_id):
             raise BlockProducerWithSpecifiedIdentifierDoesNotExistError
 
-        return self.block_producer_like.get_all(block_producer_id=block_producer_id)
+        return self.block_producer_like.get_all(block_producer_id=block_producer_id, limit=limit, streamed=streamed)
 
 
 class GetBlockProducerCommentsNumber:
@@ -278,20 +377,16 @@ class DeleteBlockProducer:
     Delete block producer implementation.
     """
 
-    def __init__(self, user, block_producer):
+    def __init__(self, block_producer):
         """
         Constructor.
         """
-        self.user = user
         self.block_producer = block_producer
 
-    def do(self, user_email, block_producer_id):
+    def do(self, block_producer_id):
         """
         Delete block producer by its identifier.
         """
-        if not self.user.does_exist_by_email(email=user_email):
-            raise UserWithSpecifiedEmailAddressDoesNotExistError
-
         if not self.block_producer.does_exist(identifier=block_producer_id):
             raise BlockProducerWithSpecifiedIdentifierDoesNotExistError
 
@@ -2,6 +2,7 @@
 Provide implementation of block producer data transfer object.
 """
 from dataclasses import dataclass
+from typing import Optional
 
 from dataclasses_json import dataclass_json
 
@@ -40,3 +41,29 @@ class BlockProducerDto:
     slack_url: str = ''
     wikipedia_url: str = ''
     steemit_url: str = ''
+
+
+@dataclass_json
+@dataclass
+class BlockProducerWithStatisticsDto(BlockProducerDto):
+    """
+    Block producer with likes and comments statistics data transfer object implementation.
+
+    Statistics which are not requested are None.
+    """
+
+    likes: Optional[int] = None
+    comments: Optional[int] = None
+    is_liked: Optional[bool] = None
+
+
+@dataclass_json
+@dataclass
+class BlockProducerSuggestionDto:
+    """
+    Block producer suggestion data transfer object implementation.
+    """
+
+    id: int
+    name: str
+    logo_url: str
@@ -1,6 +1,7 @@
 """
 Provide implementation of block producer's like data transfer object.
 """
+import typing
 from dataclasses import dataclass
 
 from dataclasses_json import dataclass_json
@@ -21,6 +22,8 @@ class BlockProducerLikeDto:
 
     user: UserDtoWithoutEmail
 
+    created_at: typing.Any
+
 
 @dataclass_json
 @dataclass
@@ -31,3 +34,14 @@ class BlockProducerLikeNumberDto:
 
     block_producer_id: int
     likes: int
+
+
+@dataclass_json
+@dataclass
+class BlockProducerLikeStateDto:
+    """
+    Block producer like state data transfer object implementation.
+    """
+
+    is_liked: bool
+    likes: int
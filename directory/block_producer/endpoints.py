@@ -8,6 +8,7 @@ from block_producer.views.block_producer import (
     BlockProducerCollection,
     BlockProducerSearchCollection,
     BlockProducerSingle,
+    BlockProducerSuggestCollection,
 )
 from block_producer.views.comment import (
     BlockProducerCommentCollection,
@@ -21,6 +22,7 @@ from block_producer.views.like import (
 block_producer_endpoints = [
     path('', BlockProducerCollection.as_view()),
     path('search/', BlockProducerSearchCollection.as_view()),
+    path('search/suggest/', BlockProducerSuggestCollection.as_view()),
     path('<int:block_producer_id>/', BlockProducerSingle.as_view()),
     path('<int:block_producer_id>/comments/', BlockProducerCommentCollection.as_view()),
     path('comments/numbers/', BlockProducerCommentNumberCollection.as_view()),
@@ -1,8 +1,23 @@
 """
 Provide implementation of operation with block producer forms.
 """
+import re
+
 from django import forms
 
+from generic.pagination import MAX_PAGE_SIZE
+
+MAX_SUGGESTIONS_NUMBER = 20
+
+# Shorter prefixes have no trigrams to be looked up by the trigram indexes, so they would scan all block producers.
+MIN_SUGGESTION_PREFIX_LENGTH = 3
+
+MAX_IDENTIFIERS_NUMBER = 100
+
+INCLUDE_COUNTS = 'counts'
+INCLUDE_LIKED_BY_ME = 'liked_by_me'
+INCLUDE_CHOICES = (INCLUDE_COUNTS, INCLUDE_LIKED_BY_ME)
+
 
 class CreateBlockProducerForm(forms.Form):
     """
@@ -67,3 +82,102 @@ class UploadBlockProducerAvatarForm(forms.Form):
 
     title = forms.CharField(max_length=150)
     file = forms.FileField()
+
+
+class SuggestBlockProducersForm(forms.Form):
+    """
+    Suggest block producers form implementation.
+    """
+
+    prefix = forms.CharField(min_length=MIN_SUGGESTION_PREFIX_LENGTH, max_length=50)
+    limit = forms.IntegerField(required=False, min_value=1, max_value=MAX_SUGGESTIONS_NUMBER)
+
+
+class PaginationForm(forms.Form):
+    """
+    Paginate block producers form implementation.
+    """
+
+    limit = forms.IntegerField(required=False, min_value=1, max_value=MAX_PAGE_SIZE)
+    cursor = forms.CharField(required=False, max_length=200)
+
+
+class StreamingForm(forms.Form):
+    """
+    Stream collection form implementation.
+    """
+
+    stream = forms.BooleanField(required=False)
+
+
+class GetBlockProducerCommentsForm(PaginationForm, StreamingForm):
+    """
+    Get block producer's comments form implementation.
+    """
+
+
+class GetBlockProducerLikesForm(StreamingForm):
+    """
+    Get block producer's likes form implementation.
+    """
+
+    limit = forms.IntegerField(required=False, min_value=1, max_value=MAX_PAGE_SIZE)
+
+
+class GetBlockProducersForm(PaginationForm, StreamingForm):
+    """
+    Get block producers form implementation.
+    """
+
+    include = forms.CharField(required=False, max_length=100)
+    ids = forms.CharField(required=False, max_length=1000)
+
+    def clean_include(self):
+        """
+        Split comma-separated statistics to include to block producers.
+        """
+        include = [item.strip() for item in self.cleaned_data.get('include').split(',') if item.strip()]
+
+        for item in include:
+            if item not in INCLUDE_CHOICES:
+                raise forms.ValidationError(f'Select a valid choice. {item} is not one of the available choices.')
+
+        return include
+
+    def clean_ids(self):
+        """
+        Split comma-separated identifiers of block producers to get, skipping repeated ones.
+        """
+        ids = []
+
+        for item in self.cleaned_data.get('ids').split(','):
+            item = item.strip()
+
+            if not item:
+                continue
+
+            if not re.fullmatch(r'[0-9]+', item):
+                raise forms.ValidationError(f'Enter a whole number. {item} is not an identifier.')
+
+            if int(item) not in ids:
+                ids.append(int(item))
+
+        if len(ids) > MAX_IDENTIFIERS_NUMBER:
+            raise forms.ValidationError(
+                f'Ensure this value has at most {MAX_IDENTIFIERS_NUMBER} identifiers (it has {len(ids)}).',
+            )
+
+        return ids
+
+    def clean(self):
+        """
+        Ensure block producers are got either by identifiers or by pages.
+        """
+        cleaned_data = super().clean()
+
+        if cleaned_data.get('ids') and (
+            cleaned_data.get('limit') is not None or cleaned_data.get('cursor') or cleaned_data.get('stream')
+        ):
+            raise forms.ValidationError('Identifiers cannot be combined with limit, cursor or stream.')
+
+        return cleaned_data
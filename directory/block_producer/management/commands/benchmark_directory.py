@@ -0,0 +1,178 @@
+"""
+Provide command to benchmark the directory API against the current database.
+"""
+import json
+from statistics import median
+
+from django.core.cache import caches
+from django.core.management.base import (
+    BaseCommand,
+    CommandError,
+)
+from django.test import Client
+
+from block_producer.management.commands.generate_directory import (
+    DEFAULT_PASSWORD,
+    DEFAULT_PREFIX,
+)
+from block_producer.models import (
+    BlockProducer,
+    BlockProducerComment,
+    BlockProducerLike,
+)
+from block_producer.views.block_producer import SUGGESTIONS_CACHE
+from generic.budgets import request_endpoint
+from generic.jwt import TOKEN_VERSIONS_CACHE
+from user.models import User
+
+DEFAULT_REPEATS = 5
+
+
+def get_scenarios(block_producer_id, username, password, phrase):
+    """
+    Get names, methods, paths and data of requests to benchmark.
+    """
+    return (
+        ('listing', 'GET', '/block-producers/', None),
+        ('listing_page', 'GET', '/block-producers/?limit=20', None),
+        ('listing_with_counts', 'GET', '/block-producers/?limit=20&include=counts', None),
+        ('listing_streamed', 'GET', '/block-producers/?stream=true', None),
+        ('search', 'GET', f'/block-producers/search/?phrase={phrase}&limit=20', None),
+        ('detail', 'GET', f'/block-producers/{block_producer_id}/', None),
+        ('comments', 'GET', f'/block-producers/{block_producer_id}/comments/', None),
+        ('likes', 'GET', f'/block-producers/{block_producer_id}/likes/', None),
+        ('comments_numbers', 'GET', '/block-producers/comments/numbers/', None),
+        ('likes_numbers', 'GET', '/block-producers/likes/numbers/', None),
+        (
+            'login', 'POST', '/authentication/token/obtaining/',
+            {'username_or_email': username, 'password': password},
+        ),
+    )
+
+
+def clear_caches():
+    """
+    Clear caches of responses and of data used by endpoints, so every request is served from the database.
+    """
+    caches['responses'].clear()
+    TOKEN_VERSIONS_CACHE.clear()
+    SUGGESTIONS_CACHE.clear()
+
+
+def compare(report, baseline):
+    """
+    Compare scenarios of the report with the same scenarios of the baseline.
+
+    Returns lines with median times, their change in percents and numbers of queries.
+    """
+    lines = [f'{"scenario":<20} {"baseline, ms":>13} {"current, ms":>12} {"change":>8} {"queries":>10}']
+
+    for name, scenario in report.get('scenarios').items():
+        baseline_scenario = baseline.get('scenarios', {}).get(name)
+
+        if baseline_scenario is None:
+            lines.append(f'{name:<20} {"-":>13} {scenario.get("median_milliseconds"):>12.1f}')
+            continue
+
+        baseline_milliseconds = baseline_scenario.get('median_milliseconds')
+        change = (scenario.get('median_milliseconds') - baseline_milliseconds) / baseline_milliseconds * 100
+        queries = f'{baseline_scenario.get("queries")} -> {scenario.get("queries")}'
+
+        lines.append(
+            f'{name:<20} {baseline_milliseconds:>13.1f} {scenario.get("median_milliseconds"):>12.1f} '
+            f'{change:>+7.1f}% {queries:>10}',
+        )
+
+    return lines
+
+
+class Command(BaseCommand):
+    """
+    Request listing, search, detail, comments, likes, numbers and login endpoints through the test client.
+
+    Caches are cleared before every request, so the database work is measured. Results are written as JSON
+    with sorted keys, so reports of different runs can be diffed or compared with the baseline report. Responses
+    of failed requests are not benchmarked, the command is stopped with the error instead.
+    """
+
+    help = 'Benchmark the directory API against the current database.'
+
+    def add_arguments(self, parser):
+        """
+        Add command arguments.
+        """
+        parser.add_argument('--repeats', type=int, default=DEFAULT_REPEATS)
+        parser.add_argument('--block-producer-id', type=int, default=None)
+        parser.add_argument('--username', default=f'{DEFAULT_PREFIX}-1')
+        parser.add_argument('--password', default=DEFAULT_PASSWORD)
+        parser.add_argument('--phrase', default='validator')
+        parser.add_argument('--output', default=None, help='Path to write the JSON report to.')
+        parser.add_argument('--baseline', default=None, help='Path of the JSON report to compare with.')
+
+    def handle(self, *args, **options):
+        """
+        Handle the command.
+        """
+        block_producer_id = options.get('block_producer_id') or \
+            BlockProducer.objects.order_by('-likes_count', 'id').values_list('id', flat=True).first()
+
+        if block_producer_id is None:
+            raise CommandError('There are no block producers, generate them with generate_directory command.')
+
+        client = Client()
+
+        scenarios = get_scenarios(
+            block_producer_id=block_producer_id,
+            username=options.get('username'),
+            password=options.get('password'),
+            phrase=options.get('phrase'),
+        )
+
+        report = {
+            'dataset': {
+                'users': User.objects.count(),
+                'block_producers': BlockProducer.objects.count(),
+                'likes': BlockProducerLike.objects.count(),
+                'comments': BlockProducerComment.objects.count(),
+            },
+            'scenarios': {},
+        }
+
+        for name, method, path, data in scenarios:
+            durations = []
+
+            for _ in range(options.get('repeats')):
+                clear_caches()
+                response, queries, milliseconds = request_endpoint(client=client, method=method, path=path, data=data)
+
+                if not 200 <= response.status_code < 300:
+                    raise CommandError(
+                        f'Scenario {name} has failed by {method} {path} with status code {response.status_code}, '
+                        f'so it cannot be benchmarked.',
+                    )
+
+                durations.append(milliseconds)
+
+            report['scenarios'][name] = {
+                'method': method,
+                'path': path,
+                'status_code': response.status_code,
+                'queries': queries,
+                'median_milliseconds': round(median(durations), 3),
+                'min_milliseconds': round(min(durations), 3),
+            }
+
+        serialized_report = json.dumps(report, indent=4, sort_keys=True)
+
+        if options.get('output'):
+            with open(options.get('output'), 'w') as file:
+                file.write(serialized_report + '\n')
+        else:
+            self.stdout.write(serialized_report)
+
+        if options.get('baseline'):
+            with open(options.get('baseline')) as file:
+                baseline = json.load(file)
+
+            for line in compare(report=report, baseline=baseline):
+                self.stdout.write(line)
@@ -0,0 +1,118 @@
+"""
+Provide command to benchmark full-text search of block producers.
+"""
+import random
+import time
+from statistics import median
+
+from django.contrib.postgres.search import (
+    SearchQuery,
+    SearchRank,
+    SearchVector,
+)
+from django.core.management.base import BaseCommand
+from django.db import (
+    connection,
+    transaction,
+)
+from django.db.models import F
+
+from block_producer.models import BlockProducer
+from user.models import User
+
+WORDS = (
+    'block', 'producer', 'node', 'validator', 'stake', 'network', 'team', 'infrastructure', 'community', 'security',
+    'governance', 'protocol', 'consensus', 'reward', 'uptime', 'datacenter', 'europe', 'asia', 'america', 'ukraine',
+    'canada', 'japan', 'germany', 'founded', 'entrepreneurs', 'engineers', 'reliable', 'transparent', 'open', 'source',
+)
+
+
+class Command(BaseCommand):
+    """
+    Compare search by the vector built at query time to search by the stored search document.
+
+    Synthetic block producers are created in a transaction which is rolled back after the measurement.
+    """
+
+    help = 'Benchmark full-text search of block producers on synthetic data.'
+
+    def add_arguments(self, parser):
+        """
+        Add command arguments.
+        """
+        parser.add_argument('--sizes', nargs='+', type=int, default=[10000, 100000])
+        parser.add_argument('--phrase', default='validator japan')
+        parser.add_argument('--repeats', type=int, default=5)
+        parser.add_argument('--description-words', type=int, default=300)
+
+    def handle(self, *args, **options):
+        """
+        Handle the command.
+        """
+        phrase = options.get('phrase')
+
+        search_vector = SearchVector('name', weight='A') + \
+            SearchVector('location', weight='B') + \
+            SearchVector('short_description', weight='B') + \
+            SearchVector('full_description', weight='B')
+
+        self.stdout.write(f'{"block producers":>16} {"query time vector, ms":>22} {"stored document, ms":>20}')
+
+        for size in options.get('sizes'):
+
+            with transaction.atomic():
+                create_block_producers(number=size, description_words=options.get('description_words'))
+
+                with connection.cursor() as cursor:
+                    cursor.execute('ANALYZE block_producer_blockproducer')
+
+                query_time_vector = measure(repeats=options.get('repeats'), query=lambda: list(
+                    BlockProducer.objects.annotate(
+                        search=search_vector,
+                    ).filter(search=SearchQuery(phrase)).order_by('-created_at').values_list('id', flat=True),
+                ))
+
+                stored_document = measure(repeats=options.get('repeats'), query=lambda: list(
+                    BlockProducer.objects.annotate(
+                        rank=SearchRank(F('search_document'), SearchQuery(phrase)),
+                    ).filter(search_document=SearchQuery(phrase)).order_by('-rank').values_list('id', flat=True),
+                ))
+
+                self.stdout.write(f'{size:>16} {query_time_vector:>22.1f} {stored_document:>20.1f}')
+
+                transaction.set_rollback(True)
+
+
+def measure(repeats, query):
+    """
+    Get median time of the query execution in milliseconds.
+    """
+    durations = []
+
+    for _ in range(repeats):
+        start = time.perf_counter()
+        query()
+        durations.append((time.perf_counter() - start) * 1000)
+
+    return median(durations)
+
+
+def create_block_producers(number, description_words, batch_size=5000):
+    """
+    Create specified number of block producers with random names and descriptions.
+    """
+    user = User.objects.create_user(
+        email='benchmark@directory.remme.io', username='benchmark', password='benchmark', is_email_confirmed=True,
+    )
+
+    for batch_start in range(0, number, batch_size):
+        BlockProducer.objects.bulk_create([
+            BlockProducer(
+                user=user,
+                name=f'Block producer {" ".join(random.choices(WORDS, k=2))} {index}',
+                website_url=f'https://bp{index}.com',
+                location=random.choice(WORDS),
+                short_description=' '.join(random.choices(WORDS, k=8))[:100],
+                full_description=' '.join(random.choices(WORDS, k=description_words)),
+            ) for index in range(batch_start, min(batch_start + batch_size, number))
+        ])
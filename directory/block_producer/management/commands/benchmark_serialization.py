@@ -0,0 +1,98 @@
+"""
+Provide command to benchmark serialization of block producers.
+"""
+import json
+import time
+
+from django.core.management.base import BaseCommand
+from django.core.serializers.json import DjangoJSONEncoder
+
+from block_producer.dto.block_producer import BlockProducerDto
+from generic.serialization import serialize
+from user.dto.user import UserDtoWithoutEmail
+
+DEFAULT_SIZES = (1000, 10000)
+DEFAULT_REPEATS = 5
+
+
+def create_block_producers(number):
+    """
+    Create block producers data transfer objects without the database.
+    """
+    user = UserDtoWithoutEmail(
+        id=1,
+        username='martin.fowler',
+        is_email_confirmed=True,
+        is_active=True,
+        is_staff=False,
+        is_superuser=False,
+    )
+
+    return [
+        BlockProducerDto(
+            user=user,
+            user_id=user.id,
+            id=identifier,
+            name=f'Block producer {identifier}',
+            website_url='https://bpcanada.com',
+            short_description='Founded by a team of serial tech entrepreneurs in Canada.',
+            location='Canada',
+            twitter_url='https://twitter.com/bpcanada',
+        ) for identifier in range(1, number + 1)
+    ]
+
+
+def serialize_with_schema(block_producers):
+    """
+    Serialize block producers to JSON the way collection views did before the serialization layer.
+    """
+    serialized_block_producers = json.loads(BlockProducerDto.schema().dumps(block_producers, many=True))
+    return json.dumps({'result': serialized_block_producers}, cls=DjangoJSONEncoder)
+
+
+def serialize_with_converter(block_producers):
+    """
+    Serialize block producers to JSON the way collection views do.
+    """
+    serialized_block_producers = serialize(BlockProducerDto, block_producers)
+    return json.dumps({'result': serialized_block_producers}, cls=DjangoJSONEncoder)
+
+
+class Command(BaseCommand):
+    """
+    Measure per block producer cost of serializing block producers collections to JSON response bodies.
+    """
+
+    help = 'Benchmark serialization of block producers collections.'
+
+    def add_arguments(self, parser):
+        """
+        Add arguments of the command.
+        """
+        parser.add_argument('--sizes', nargs='+', type=int, default=DEFAULT_SIZES)
+        parser.add_argument('--repeats', type=int, default=DEFAULT_REPEATS)
+
+    def handle(self, *args, **options):
+        """
+        Handle the command.
+        """
+        for size in options['sizes']:
+            block_producers = create_block_producers(number=size)
+
+            serialized_with_schema = json.loads(serialize_with_schema(block_producers))
+
+            if serialized_with_schema != json.loads(serialize_with_converter(block_producers)):
+                self.stderr.write(f'Serialized block producers differ for {size} block producers.')
+                return
+
+            for name, function in (('schema', serialize_with_schema), ('converter', serialize_with_converter)):
+                timings = []
+
+                for _ in range(options['repeats']):
+                    started_at = time.perf_counter()
+                    function(block_producers)
+                    timings.append(time.perf_counter() - started_at)
+
+                per_item = min(timings) / size * 1000000
+
+                self.stdout.write(f'{size} block producers, {name}: {per_item:.2f} microseconds per block producer.')
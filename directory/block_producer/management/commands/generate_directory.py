@@ -0,0 +1,212 @@
+"""
+Provide command to generate a large synthetic directory.
+"""
+import random
+import time
+
+from django.contrib.auth.hashers import make_password
+from django.core.management.base import (
+    BaseCommand,
+    CommandError,
+)
+from django.db import transaction
+
+from block_producer.management.commands.benchmark_search import WORDS
+from block_producer.models import (
+    BlockProducer,
+    BlockProducerComment,
+    BlockProducerLike,
+)
+from user.models import (
+    Profile,
+    User,
+)
+
+DEFAULT_PREFIX = 'generated'
+DEFAULT_PASSWORD = 'generated-1337'
+DEFAULT_BATCH_SIZE = 5000
+
+
+def get_batches(number, batch_size):
+    """
+    Get ranges of indexes from zero to the number split by batches of the size.
+    """
+    return [range(start, min(start + batch_size, number)) for start in range(0, number, batch_size)]
+
+
+def generate_users(number, prefix, password, batch_size):
+    """
+    Generate users with profiles, all of them have the same password. Returns identifiers of the users.
+    """
+    encrypted_password = make_password(password)
+    identifiers = []
+
+    for batch in get_batches(number, batch_size):
+        users = User.objects.bulk_create([
+            User(
+                email=f'{prefix}-{index + 1}@directory.remme.io',
+                username=f'{prefix}-{index + 1}',
+                password=encrypted_password,
+                is_email_confirmed=True,
+            ) for index in batch
+        ])
+
+        Profile.objects.bulk_create([
+            Profile(user=user, first_name=random.choice(WORDS).title(), location=random.choice(WORDS).title())
+            for user in users
+        ])
+
+        identifiers += [user.id for user in users]
+
+    return identifiers
+
+
+def generate_block_producers(number, user_identifiers, batch_size):
+    """
+    Generate block producers of the users, numbers of their likes and comments are counted by the database.
+
+    Returns identifiers of the block producers.
+    """
+    identifiers = []
+
+    for batch in get_batches(number, batch_size):
+        block_producers = BlockProducer.objects.bulk_create([
+            BlockProducer(
+                user_id=user_identifiers[index % len(user_identifiers)],
+                name=f'Block producer {" ".join(random.choices(WORDS, k=2))} {index + 1}',
+                website_url=f'https://bp{index + 1}.com',
+                location=random.choice(WORDS).title(),
+                short_description=' '.join(random.choices(WORDS, k=8))[:100],
+                full_description=' '.join(random.choices(WORDS, k=100)),
+            ) for index in batch
+        ])
+
+        identifiers += [block_producer.id for block_producer in block_producers]
+
+    return identifiers
+
+
+def generate_likes(block_producer_identifiers, user_identifiers, likes_number, batch_size):
+    """
+    Generate the number of likes for every block producer, each by a different user.
+    """
+    pairs = (
+        (user_identifiers[(index + offset) % len(user_identifiers)], block_producer_identifier)
+        for index, block_producer_identifier in enumerate(block_producer_identifiers)
+        for offset in range(likes_number)
+    )
+
+    bulk_create(BlockProducerLike, (
+        BlockProducerLike(user_id=user_identifier, block_producer_id=block_producer_identifier)
+        for user_identifier, block_producer_identifier in pairs
+    ), batch_size=batch_size)
+
+
+def generate_comments(block_producer_identifiers, user_identifiers, comments_number, batch_size):
+    """
+    Generate the number of comments for every block producer.
+    """
+    bulk_create(BlockProducerComment, (
+        BlockProducerComment(
+            user_id=user_identifiers[(index + offset) % len(user_identifiers)],
+            block_producer_id=block_producer_identifier,
+            text=' '.join(random.choices(WORDS, k=12)).capitalize() + '.',
+        )
+        for index, block_producer_identifier in enumerate(block_producer_identifiers)
+        for offset in range(comments_number)
+    ), batch_size=batch_size)
+
+
+def bulk_create(model, objects, batch_size):
+    """
+    Create objects from the iterable by batches, so all of them are never held in the memory together.
+    """
+    batch = []
+
+    for object_ in objects:
+        batch.append(object_)
+
+        if len(batch) == batch_size:
+            model.objects.bulk_create(batch)
+            batch = []
+
+    if batch:
+        model.objects.bulk_create(batch)
+
+
+class Command(BaseCommand):
+    """
+    Generate users with profiles, block producers, likes and comments at a configurable scale.
+
+    Rows are inserted by batches in a single transaction, so a failed generation leaves no rows. Likes and comments
+    numbers of block producers are stored consistently with generated likes and comments.
+    """
+
+    help = 'Generate a large synthetic directory.'
+
+    def add_arguments(self, parser):
+        """
+        Add command arguments.
+        """
+        parser.add_argument('--users', type=int, default=1000)
+        parser.add_argument('--block-producers', type=int, default=1000)
+        parser.add_argument('--likes', type=int, default=10, help='Number of likes of every block producer.')
+        parser.add_argument('--comments', type=int, default=10, help='Number of comments of every block producer.')
+        parser.add_argument('--prefix', default=DEFAULT_PREFIX, help='Prefix of usernames and e-mail addresses.')
+        parser.add_argument('--password', default=DEFAULT_PASSWORD)
+        parser.add_argument('--batch-size', type=int, default=DEFAULT_BATCH_SIZE)
+        parser.add_argument('--seed', type=int, default=None, help='Seed of random names and descriptions.')
+
+    def handle(self, *args, **options):
+        """
+        Handle the command.
+        """
+        users_number = options.get('users')
+        likes_number = options.get('likes')
+        prefix = options.get('prefix')
+        batch_size = options.get('batch_size')
+
+        if users_number < 1:
+            raise CommandError('At least one user is required.')
+
+        if likes_number > users_number:
+            raise CommandError('Every like of a block producer is made by a different user, specify more users.')
+
+        if User.objects.filter(username__startswith=f'{prefix}-').exists():
+            raise CommandError(f'Users with the prefix {prefix} already exist, specify another prefix.')
+
+        random.seed(options.get('seed'))
+
+        started_at = time.perf_counter()
+
+        with transaction.atomic():
+            user_identifiers = generate_users(
+                number=users_number, prefix=prefix, password=options.get('password'), batch_size=batch_size,
+            )
+
+            block_producer_identifiers = generate_block_producers(
+                number=options.get('block_producers'),
+                user_identifiers=user_identifiers,
+                batch_size=batch_size,
+            )
+
+            generate_likes(
+                block_producer_identifiers=block_producer_identifiers,
+                user_identifiers=user_identifiers,
+                likes_number=likes_number,
+                batch_size=batch_size,
+            )
+
+            generate_comments(
+                block_producer_identifiers=block_producer_identifiers,
+                user_identifiers=user_identifiers,
+                comments_number=options.get('comments'),
+                batch_size=batch_size,
+            )
+
+        self.stdout.write(
+            f'{users_number} users, {len(block_producer_identifiers)} block producers, '
+            f'{len(block_producer_identifiers) * likes_number} likes and '
+            f'{len(block_producer_identifiers) * options.get("comments")} comments have been generated '
+            f'in {time.perf_counter() - started_at:.1f} seconds.',
+        )
@@ -0,0 +1,31 @@
+"""
+Provide command to repair likes and comments numbers of block producers.
+"""
+from django.core.management.base import BaseCommand
+
+from block_producer.models import BlockProducer
+
+
+class Command(BaseCommand):
+    """
+    Recompute denormalized likes and comments numbers of block producers from likes and comments.
+
+    Numbers are counted by the database, they may drift only if they are changed by hand.
+    """
+
+    help = 'Repair likes and comments numbers of block producers.'
+
+    def handle(self, *args, **options):
+        """
+        Handle the command.
+        """
+        repaired_identifiers = BlockProducer.repair_counters()
+
+        if not repaired_identifiers:
+            self.stdout.write('Likes and comments numbers of block producers are up to date.')
+            return
+
+        self.stdout.write(
+            f'Likes and comments numbers have been repaired for {len(repaired_identifiers)} block producers: '
+            f'{", ".join(str(identifier) for identifier in repaired_identifiers)}.',
+        )
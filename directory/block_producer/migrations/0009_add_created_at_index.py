@@ -0,0 +1,17 @@
+# Generated by Django 2.2.7 on 2026-10-18 06:56
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('block_producer', '0008_increase_text_size'),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name='blockproducer',
+            index=models.Index(fields=['-created_at', '-id'], name='block_producer_created_at_idx'),
+        ),
+    ]
@@ -0,0 +1,56 @@
+# Generated by Django 2.2.7 on 2026-10-18 06:57
+
+import django.contrib.postgres.indexes
+import django.contrib.postgres.search
+from django.db import migrations
+
+SEARCH_DOCUMENT_EXPRESSION = """
+    setweight(to_tsvector(COALESCE({row}name, '')), 'A') ||
+    setweight(to_tsvector(COALESCE({row}location, '')), 'B') ||
+    setweight(to_tsvector(COALESCE({row}short_description, '')), 'B') ||
+    setweight(to_tsvector(COALESCE({row}full_description, '')), 'B')
+"""
+
+CREATE_SEARCH_DOCUMENT_TRIGGER = f"""
+CREATE FUNCTION block_producer_search_document_update() RETURNS trigger AS $$
+BEGIN
+    NEW.search_document := {SEARCH_DOCUMENT_EXPRESSION.format(row='NEW.')};
+    RETURN NEW;
+END
+$$ LANGUAGE plpgsql;
+
+CREATE TRIGGER block_producer_search_document_trigger
+    BEFORE INSERT OR UPDATE OF name, location, short_description, full_description
+    ON block_producer_blockproducer
+    FOR EACH ROW EXECUTE PROCEDURE block_producer_search_document_update();
+
+UPDATE block_producer_blockproducer SET search_document = {SEARCH_DOCUMENT_EXPRESSION.format(row='')};
+"""
+
+DROP_SEARCH_DOCUMENT_TRIGGER = """
+DROP TRIGGER block_producer_search_document_trigger ON block_producer_blockproducer;
+DROP FUNCTION block_producer_search_document_update();
+"""
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('block_producer', '0009_add_created_at_index'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='blockproducer',
+            name='search_document',
+            field=django.contrib.postgres.search.SearchVectorField(editable=False, null=True),
+        ),
+        migrations.RunSQL(
+            sql=CREATE_SEARCH_DOCUMENT_TRIGGER,
+            reverse_sql=DROP_SEARCH_DOCUMENT_TRIGGER,
+        ),
+        migrations.AddIndex(
+            model_name='blockproducer',
+            index=django.contrib.postgres.indexes.GinIndex(fields=['search_document'], name='block_producer_search_idx'),
+        ),
+    ]
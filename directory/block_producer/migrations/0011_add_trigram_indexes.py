@@ -0,0 +1,33 @@
+# Generated by Django 2.2.7 on 2026-10-18 07:20
+
+from django.contrib.postgres.operations import TrigramExtension
+from django.db import migrations
+
+# Indexes are built over the same expressions as case-insensitive lookups use, so they serve `icontains` filters.
+CREATE_TRIGRAM_INDEXES = """
+CREATE INDEX block_producer_name_trgm_idx
+    ON block_producer_blockproducer USING gin (UPPER(name::text) gin_trgm_ops);
+
+CREATE INDEX block_producer_location_trgm_idx
+    ON block_producer_blockproducer USING gin (UPPER(location::text) gin_trgm_ops);
+"""
+
+DROP_TRIGRAM_INDEXES = """
+DROP INDEX block_producer_name_trgm_idx;
+DROP INDEX block_producer_location_trgm_idx;
+"""
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('block_producer', '0010_add_search_document'),
+    ]
+
+    operations = [
+        TrigramExtension(),
+        migrations.RunSQL(
+            sql=CREATE_TRIGRAM_INDEXES,
+            reverse_sql=DROP_TRIGRAM_INDEXES,
+        ),
+    ]
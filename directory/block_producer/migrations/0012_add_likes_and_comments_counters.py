@@ -0,0 +1,47 @@
+# Generated by Django 2.2.7 on 2026-10-18 07:10
+
+from django.db import migrations, models
+
+FILL_COUNTERS = """
+UPDATE block_producer_blockproducer SET
+    likes_count = (
+        SELECT COUNT(*) FROM block_producer_blockproducerlike
+        WHERE block_producer_id = block_producer_blockproducer.id
+    ),
+    comments_count = (
+        SELECT COUNT(*) FROM block_producer_blockproducercomment
+        WHERE block_producer_id = block_producer_blockproducer.id
+    );
+"""
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('block_producer', '0011_add_trigram_indexes'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='blockproducer',
+            name='comments_count',
+            field=models.PositiveIntegerField(default=0, editable=False),
+        ),
+        migrations.AddField(
+            model_name='blockproducer',
+            name='likes_count',
+            field=models.PositiveIntegerField(default=0, editable=False),
+        ),
+        migrations.RunSQL(
+            sql=FILL_COUNTERS,
+            reverse_sql=migrations.RunSQL.noop,
+        ),
+        migrations.AddIndex(
+            model_name='blockproducer',
+            index=models.Index(condition=models.Q(likes_count__gt=0), fields=['id', 'likes_count'], name='block_producer_likes_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='blockproducer',
+            index=models.Index(condition=models.Q(comments_count__gt=0), fields=['id', 'comments_count'], name='block_producer_comments_idx'),
+        ),
+    ]
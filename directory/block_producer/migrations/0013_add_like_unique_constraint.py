@@ -0,0 +1,35 @@
+# Generated by Django 2.2.7 on 2026-10-18 07:14
+
+from django.db import migrations, models
+
+# Duplicated likes could be created by concurrent requests, the earliest like of every user is kept.
+DELETE_DUPLICATED_LIKES = """
+DELETE FROM block_producer_blockproducerlike AS duplicated_like
+USING block_producer_blockproducerlike AS kept_like
+WHERE duplicated_like.user_id = kept_like.user_id
+    AND duplicated_like.block_producer_id = kept_like.block_producer_id
+    AND duplicated_like.id > kept_like.id;
+
+UPDATE block_producer_blockproducer SET likes_count = (
+    SELECT COUNT(*) FROM block_producer_blockproducerlike
+    WHERE block_producer_id = block_producer_blockproducer.id
+);
+"""
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('block_producer', '0012_add_likes_and_comments_counters'),
+    ]
+
+    operations = [
+        migrations.RunSQL(
+            sql=DELETE_DUPLICATED_LIKES,
+            reverse_sql=migrations.RunSQL.noop,
+        ),
+        migrations.AddConstraint(
+            model_name='blockproducerlike',
+            constraint=models.UniqueConstraint(fields=('user', 'block_producer'), name='block_producer_like_unique'),
+        ),
+    ]
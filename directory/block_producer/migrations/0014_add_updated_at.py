@@ -0,0 +1,28 @@
+# Generated by Django 2.2.7 on 2026-10-18 09:02
+
+from django.db import migrations, models
+import django.utils.timezone
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('block_producer', '0013_add_like_unique_constraint'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='blockproducer',
+            name='updated_at',
+            field=models.DateTimeField(auto_now=True, default=django.utils.timezone.now),
+            preserve_default=False,
+        ),
+        migrations.RunSQL(
+            sql='UPDATE block_producer_blockproducer SET updated_at = created_at',
+            reverse_sql=migrations.RunSQL.noop,
+        ),
+        migrations.AddIndex(
+            model_name='blockproducer',
+            index=models.Index(fields=['updated_at'], name='block_producer_updated_at_idx'),
+        ),
+    ]
@@ -0,0 +1,17 @@
+# Generated by Django 2.2.7 on 2026-10-18 07:51
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('block_producer', '0014_add_updated_at'),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name='blockproducercomment',
+            index=models.Index(fields=['block_producer', '-created_at', '-id'], name='block_producer_comment_idx'),
+        ),
+    ]
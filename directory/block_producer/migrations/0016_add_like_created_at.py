@@ -0,0 +1,24 @@
+# Generated by Django 2.2.7 on 2026-10-18 07:53
+
+from django.db import migrations, models
+import django.utils.timezone
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('block_producer', '0015_add_comment_created_at_index'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='blockproducerlike',
+            name='created_at',
+            field=models.DateTimeField(auto_now_add=True, default=django.utils.timezone.now),
+            preserve_default=False,
+        ),
+        migrations.AddIndex(
+            model_name='blockproducerlike',
+            index=models.Index(fields=['block_producer', '-created_at', '-id'], name='block_producer_like_idx'),
+        ),
+    ]
@@ -0,0 +1,80 @@
+# Generated by Django 2.2.7 on 2026-10-18 08:30
+
+from django.db import migrations
+
+# Likes and comments may be created and deleted bypassing the application, e.g. by the admin panel, by loading
+# fixtures or by the cascade of the user deletion, so numbers of them are counted by the database for every row.
+CREATE_COUNTERS_TRIGGERS = """
+CREATE FUNCTION count_block_producer_likes() RETURNS trigger AS $$
+BEGIN
+    IF TG_OP IN ('DELETE', 'UPDATE') THEN
+        UPDATE block_producer_blockproducer SET likes_count = GREATEST(likes_count - 1, 0)
+        WHERE id = OLD.block_producer_id;
+    END IF;
+
+    IF TG_OP IN ('INSERT', 'UPDATE') THEN
+        UPDATE block_producer_blockproducer SET likes_count = likes_count + 1
+        WHERE id = NEW.block_producer_id;
+    END IF;
+
+    RETURN NULL;
+END;
+$$ LANGUAGE plpgsql;
+
+CREATE TRIGGER block_producer_like_counted
+AFTER INSERT OR DELETE ON block_producer_blockproducerlike
+FOR EACH ROW EXECUTE PROCEDURE count_block_producer_likes();
+
+CREATE TRIGGER block_producer_like_moved
+AFTER UPDATE OF block_producer_id ON block_producer_blockproducerlike
+FOR EACH ROW WHEN (OLD.block_producer_id IS DISTINCT FROM NEW.block_producer_id)
+EXECUTE PROCEDURE count_block_producer_likes();
+
+CREATE FUNCTION count_block_producer_comments() RETURNS trigger AS $$
+BEGIN
+    IF TG_OP IN ('DELETE', 'UPDATE') THEN
+        UPDATE block_producer_blockproducer SET comments_count = GREATEST(comments_count - 1, 0)
+        WHERE id = OLD.block_producer_id;
+    END IF;
+
+    IF TG_OP IN ('INSERT', 'UPDATE') THEN
+        UPDATE block_producer_blockproducer SET comments_count = comments_count + 1
+        WHERE id = NEW.block_producer_id;
+    END IF;
+
+    RETURN NULL;
+END;
+$$ LANGUAGE plpgsql;
+
+CREATE TRIGGER block_producer_comment_counted
+AFTER INSERT OR DELETE ON block_producer_blockproducercomment
+FOR EACH ROW EXECUTE PROCEDURE count_block_producer_comments();
+
+CREATE TRIGGER block_producer_comment_moved
+AFTER UPDATE OF block_producer_id ON block_producer_blockproducercomment
+FOR EACH ROW WHEN (OLD.block_producer_id IS DISTINCT FROM NEW.block_producer_id)
+EXECUTE PROCEDURE count_block_producer_comments();
+"""
+
+DROP_COUNTERS_TRIGGERS = """
+DROP TRIGGER block_producer_like_counted ON block_producer_blockproducerlike;
+DROP TRIGGER block_producer_like_moved ON block_producer_blockproducerlike;
+DROP FUNCTION count_block_producer_likes();
+DROP TRIGGER block_producer_comment_counted ON block_producer_blockproducercomment;
+DROP TRIGGER block_producer_comment_moved ON block_producer_blockproducercomment;
+DROP FUNCTION count_block_producer_comments();
+"""
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('block_producer', '0016_add_like_created_at'),
+    ]
+
+    operations = [
+        migrations.RunSQL(
+            sql=CREATE_COUNTERS_TRIGGERS,
+            reverse_sql=DROP_COUNTERS_TRIGGERS,
+        ),
+    ]
@@ -0,0 +1,20 @@
+# Generated by Django 2.2.7 on 2026-10-18 08:32
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('block_producer', '0017_add_counters_triggers'),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='BlockProducersVersion',
+            fields=[
+                ('id', models.AutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('version', models.BigIntegerField(default=0)),
+            ],
+        ),
+    ]
@@ -1,17 +1,55 @@
 """
 Provide database models for block producer.
 """
+import re
+from dataclasses import fields
+from functools import lru_cache
+
 from django.conf import settings
+from django.contrib.postgres.aggregates import StringAgg
+from django.contrib.postgres.indexes import GinIndex
 from django.contrib.postgres.search import (
     SearchQuery,
-    SearchVector,
+    SearchRank,
+    SearchVectorField,
+    TrigramSimilarity,
+)
+from django.db import (
+    connection,
+    models,
+    transaction,
+)
+from django.db.models import (
+    BooleanField,
+    Case,
+    CharField,
+    Exists,
+    F,
+    Func,
+    IntegerField,
+    OuterRef,
+    Q,
+    Value,
+    When,
+)
+from django.db.models.functions import (
+    Cast,
+    Concat,
+)
+from django.db.models.signals import (
+    post_delete,
+    post_save,
 )
-from django.db import models
-from django.db.models import Count
-from django.db.models.signals import post_save
 from django.dispatch import receiver
-
-from block_producer.dto.block_producer import BlockProducerDto
+from django.utils import timezone
+from django.utils.dateparse import parse_datetime
+
+from block_producer.cache import invalidate_block_producers_responses
+from block_producer.dto.block_producer import (
+    BlockProducerDto,
+    BlockProducerSuggestionDto,
+    BlockProducerWithStatisticsDto,
+)
 from block_producer.dto.comment import (
     BlockProducerCommentDto,
     BlockProducerCommentNumberDto,
@@ -19,16 +57,27 @@ from block_producer.dto.comment import (
 from block_producer.dto.like import (
     BlockProducerLikeDto,
     BlockProducerLikeNumberDto,
+    BlockProducerLikeStateDto,
+)
+from generic.pagination import (
+    DEFAULT_PAGE_SIZE,
+    decode_cursor,
+    encode_cursor,
+    get_descending_keyset_filter,
+)
+from generic.serialization import (
+    Projection,
+    get_schema,
 )
+from generic.streaming import STREAMING_CHUNK_SIZE
 from services.constants import (
     EmailBody,
     EmailSubject,
 )
 from services.email import Email
-from user.models import (
-    User,
-    Profile,
-)
+from user.dto.user import UserDtoWithoutEmail
+from user.models import User
+from user.signals import users_changed
 
 BLOCK_PRODUCER_STATUS_MODERATION = 'moderation'
 BLOCK_PRODUCER_STATUS_DECLINED = 'declined'
@@ -40,6 +89,85 @@ BLOCK_PRODUCER_STATUSES = (
     (BLOCK_PRODUCER_STATUS_ACTIVE, BLOCK_PRODUCER_STATUS_ACTIVE),
 )
 
+BLOCK_PRODUCER_FIELDS = tuple(field.name for field in fields(BlockProducerDto) if field.name != 'user')
+BLOCK_PRODUCER_USER_FIELDS = tuple(field.name for field in fields(UserDtoWithoutEmail))
+
+BLOCK_PRODUCER_STATISTICS_FIELDS = tuple(
+    field.name for field in fields(BlockProducerWithStatisticsDto)
+    if field.name not in BLOCK_PRODUCER_FIELDS and field.name != 'user'
+)
+
+BLOCK_PRODUCER_LIKE_PROJECTION = Projection(BlockProducerLikeDto)
+BLOCK_PRODUCER_LIKES_ORDERING = ('-created_at', '-id')
+BLOCK_PRODUCER_COMMENT_PROJECTION = Projection(
+    BlockProducerCommentDto, lookups={'profile_avatar_url': 'user__profile__avatar_url'},
+)
+BLOCK_PRODUCER_COMMENTS_ORDERING = ('created_at', 'id')
+BLOCK_PRODUCER_COMMENTS_CURSOR_PARSERS = (parse_datetime, int)
+
+BLOCK_PRODUCERS_ORDERING = ('created_at', 'id')
+BLOCK_PRODUCERS_CURSOR_PARSERS = (parse_datetime, int)
+
+FOUND_BLOCK_PRODUCERS_ORDERING = ('rank', 'created_at', 'id')
+FOUND_BLOCK_PRODUCERS_CURSOR_PARSERS = (int, parse_datetime, int)
+SEARCH_RANK_PRECISION = 1000000
+
+# Deletes the like if it exists or creates it otherwise, then gets the like state and the likes number of the block
+# producer counted by the database trigger. Both statements are sent at once and run in a single transaction.
+# If a concurrent toggle creates the like first, the insert does nothing and the like is reported as existing.
+# Nothing is returned if the block producer does not exist.
+TOGGLE_BLOCK_PRODUCER_LIKE = """
+WITH deleted_like AS (
+    DELETE FROM block_producer_blockproducerlike
+    WHERE user_id = %(user_id)s AND block_producer_id = %(block_producer_id)s
+    RETURNING id
+)
+INSERT INTO block_producer_blockproducerlike (user_id, block_producer_id, created_at)
+SELECT %(user_id)s, id, %(created_at)s FROM block_producer_blockproducer
+WHERE id = %(block_producer_id)s AND NOT EXISTS (SELECT 1 FROM deleted_like)
+ON CONFLICT (user_id, block_producer_id) DO NOTHING;
+
+SELECT EXISTS (
+    SELECT 1 FROM block_producer_blockproducerlike
+    WHERE user_id = %(user_id)s AND block_producer_id = %(block_producer_id)s
+), likes_count
+FROM block_producer_blockproducer
+WHERE id = %(block_producer_id)s
+"""
+
+# Sets the counter of block producers, which differs from the number of rows of the counted table, to the number.
+REPAIR_BLOCK_PRODUCERS_COUNTER = """
+UPDATE block_producer_blockproducer AS repaired
+SET {counter} = COALESCE(counted.number, 0)
+FROM block_producer_blockproducer AS block_producer
+LEFT JOIN (
+    SELECT block_producer_id, COUNT(*) AS number FROM {counted_table} GROUP BY block_producer_id
+) AS counted ON counted.block_producer_id = block_producer.id
+WHERE repaired.id = block_producer.id AND repaired.{counter} <> COALESCE(counted.number, 0)
+RETURNING repaired.id
+"""
+
+
+BLOCK_PRODUCERS_VERSION_IDENTIFIER = 1
+
+BUMP_BLOCK_PRODUCERS_VERSION = """
+INSERT INTO block_producer_blockproducersversion (id, version) VALUES (%(identifier)s, 1)
+ON CONFLICT (id) DO UPDATE SET version = block_producer_blockproducersversion.version + 1
+"""
+
+
+@lru_cache(maxsize=None)
+def get_block_producer_projection(statistics=()):
+    """
+    Get projection of block producers rows with specified statistics.
+    """
+    if not statistics:
+        return Projection(BlockProducerDto)
+
+    excluded_statistics = tuple(field for field in BLOCK_PRODUCER_STATISTICS_FIELDS if field not in statistics)
+    return Projection(BlockProducerWithStatisticsDto, exclude=excluded_statistics)
+
+
 STATUS_TYPE = {
     'active': [
         EmailSubject.BLOCK_PRODUCER_ACTIVE.value,
@@ -69,6 +197,7 @@ class BlockProducer(models.Model):
     status = models.CharField(max_length=10, choices=BLOCK_PRODUCER_STATUSES, default=BLOCK_PRODUCER_STATUS_MODERATION)
     status_description = models.TextField(max_length=10000, blank=True)
     created_at = models.DateTimeField(auto_now_add=True)
+    updated_at = models.DateTimeField(auto_now=True)
 
     linkedin_url = models.URLField(max_length=200, blank=True)
     twitter_url = models.URLField(max_length=200, blank=True)
@@ -81,6 +210,28 @@ class BlockProducer(models.Model):
     wikipedia_url = models.URLField(max_length=200, blank=True)
     steemit_url = models.URLField(max_length=200, blank=True)
 
+    # Kept up to date by the database trigger, so query set updates refresh it as well.
+    search_document = SearchVectorField(null=True, editable=False)
+
+    # Denormalized numbers of likes and comments, changed in the same transaction as likes and comments are.
+    likes_count = models.PositiveIntegerField(default=0, editable=False)
+    comments_count = models.PositiveIntegerField(default=0, editable=False)
+
+    class Meta:
+        """
+        Meta.
+        """
+
+        indexes = [
+            models.Index(fields=['-created_at', '-id'], name='block_producer_created_at_idx'),
+            models.Index(fields=['updated_at'], name='block_producer_updated_at_idx'),
+            GinIndex(fields=['search_document'], name='block_producer_search_idx'),
+            models.Index(fields=['id', 'likes_count'], condition=Q(likes_count__gt=0), name='block_producer_likes_idx'),
+            models.Index(
+                fields=['id', 'comments_count'], condition=Q(comments_count__gt=0), name='block_producer_comments_idx',
+            ),
+        ]
+
     def __str__(self):
         """
         Get string representation of an object.
@@ -97,119 +248,262 @@ class BlockProducer(models.Model):
 
         return False
 
+    @staticmethod
+    def _to_dto(block_producer_as_dict):
+        """
+        Build block producer data transfer object from a row fetched with the user columns.
+        """
+        user = UserDtoWithoutEmail(**{
+            field: block_producer_as_dict[f'user__{field}'] for field in BLOCK_PRODUCER_USER_FIELDS
+        })
+
+        return BlockProducerDto(user=user, **{field: block_producer_as_dict[field] for field in BLOCK_PRODUCER_FIELDS})
+
+    @classmethod
+    def _get_with_users(cls, block_producers):
+        """
+        Get block producers from query set together with their users in a single joined query.
+
+        Rows are fetched by the lookups of the projection of block producers, as collections of them are.
+        """
+        return [cls._to_dto(row) for row in block_producers.values(*get_block_producer_projection().lookups)]
+
+    @staticmethod
+    def _annotate_statistics(block_producers, with_counts=False, with_is_liked=False, user_id=None):
+        """
+        Annotate query set of block producers with requested statistics.
+
+        Returns the annotated query set and names of the statistics.
+        """
+        statistics = ()
+
+        if with_counts:
+            block_producers = block_producers.annotate(likes=F('likes_count'), comments=F('comments_count'))
+            statistics += ('likes', 'comments')
+
+        if with_is_liked:
+            is_liked = Value(False, output_field=BooleanField())
+
+            if user_id is not None:
+                is_liked = Exists(BlockProducerLike.objects.filter(user_id=user_id, block_producer=OuterRef('id')))
+
+            block_producers = block_producers.annotate(is_liked=is_liked)
+            statistics += ('is_liked',)
+
+        return block_producers, statistics
+
+    @classmethod
+    def _get_page(
+        cls,
+        block_producers,
+        limit,
+        cursor,
+        ordering=BLOCK_PRODUCERS_ORDERING,
+        cursor_parsers=BLOCK_PRODUCERS_CURSOR_PARSERS,
+        statistics=(),
+        streamed=False,
+    ):
+        """
+        Get page of block producers from query set in descending order by specified fields.
+
+        The page begins right after the row the cursor was built from, so its cost does not depend on its depth
+        and rows inserted meanwhile do not shift it. If neither the limit nor the cursor is specified,
+        all block producers are returned. Returns block producers and the cursor of the next page.
+
+        Block producers are returned as serialized data transfer objects built from rows directly. If all block
+        producers are streamed, they are built lazily from rows fetched by chunks.
+        """
+        descending_ordering = [f'-{field}' for field in ordering]
+        block_producers = block_producers.order_by(*descending_ordering)
+
+        projection = get_block_producer_projection(statistics=statistics)
+        lookups = projection.lookups
+
+        if limit is None and cursor is None:
+            rows = block_producers.values_list(*lookups)
+
+            if streamed:
+                return projection.iterate(rows.iterator(chunk_size=STREAMING_CHUNK_SIZE)), None
+
+            return projection.project(rows), None
+
+        if limit is None:
+            limit = DEFAULT_PAGE_SIZE
+
+        if cursor is not None:
+            cursor_values = decode_cursor(cursor=cursor, parsers=cursor_parsers)
+            block_producers = block_producers.filter(get_descending_keyset_filter(ordering, cursor_values))
+
+        lookups += tuple(field for field in ordering if field not in lookups)
+
+        rows = list(block_producers.values_list(*lookups)[:limit + 1])
+        next_cursor = None
+
+        if len(rows) > limit:
+            rows = rows[:limit]
+            next_cursor = encode_cursor(*[rows[-1][lookups.index(field)] for field in ordering])
+
+        return projection.project(rows), next_cursor
+
     @classmethod
-    def get_all(cls):
+    def get_all(
+        cls,
+        limit=None,
+        cursor=None,
+        with_counts=False,
+        with_is_liked=False,
+        user_id=None,
+        streamed=False,
+    ):
         """
         Get block producers.
+
+        Likes and comments numbers and whether the user with specified identifier liked block producers
+        are fetched in the same query if requested. Returns block producers and the cursor of the next page.
         """
-        block_producers_as_dicts = cls.objects.all().order_by('-created_at').values()
+        block_producers, statistics = cls._annotate_statistics(
+            cls.objects.all(), with_counts=with_counts, with_is_liked=with_is_liked, user_id=user_id,
+        )
 
-        for block_producer in block_producers_as_dicts:
+        return cls._get_page(
+            block_producers, limit=limit, cursor=cursor, statistics=statistics, streamed=streamed,
+        )
 
-            user_identifier = block_producer.get('user_id')
-            user_as_dict = User.objects.filter(id=user_identifier).values().first()
+    @classmethod
+    def get_by_identifiers(cls, identifiers, with_counts=False, with_is_liked=False, user_id=None):
+        """
+        Get block producers by their identifiers in a single query.
 
-            del user_as_dict['password']
-            del user_as_dict['created']
-            del user_as_dict['email']
+        Statistics are fetched in the same query if requested, as for all block producers. Returns block producers
+        keyed by their identifiers, block producers which do not exist are missed.
+        """
+        block_producers, statistics = cls._annotate_statistics(
+            cls.objects.filter(id__in=identifiers),
+            with_counts=with_counts,
+            with_is_liked=with_is_liked,
+            user_id=user_id,
+        )
 
-            block_producer['user'] = user_as_dict
-            del block_producer['created_at']
+        projection = get_block_producer_projection(statistics=statistics)
 
-        return BlockProducerDto.schema().load(block_producers_as_dicts, many=True)
+        return {
+            block_producer.get('id'): block_producer
+            for block_producer in projection.project(block_producers.values_list(*projection.lookups))
+        }
 
     @classmethod
-    def create(cls, email, info):
+    def get_counter_version(cls, counter):
         """
-        Create a block producer with specified information.
+        Get version of likes or comments numbers, which is the digest of numbers of block producers having them.
+
+        Numbers are read from the counter columns they are served from, by the partial index of the counter.
         """
-        user = User.objects.get(email=email)
+        pairs = Concat(Cast('id', CharField()), Value(':'), Cast(counter, CharField()))
+
+        version = cls.objects.filter(**{f'{counter}__gt': 0}).aggregate(
+            digest=Func(StringAgg(pairs, delimiter=',', ordering='id'), function='MD5', output_field=CharField()),
+        )
+        return version.get('digest')
 
+    @classmethod
+    def create(cls, user_id, info):
+        """
+        Create a block producer of the user with specified information.
+        """
         if not info.get('logo_url'):
             del info['logo_url']
 
-        cls.objects.create(user=user, **info)
+        cls.objects.create(user_id=user_id, **info)
 
     @classmethod
-    def update(cls, email, identifier, info):
+    def update(cls, user_id, identifier, info):
         """
-        Update block producer with specified information.
+        Update block producer of the user with specified information.
+
+        Query set updates neither send signals nor change the update time, so it is done here.
         """
-        user = User.objects.get(email=email)
-        cls.objects.filter(user=user, id=identifier).update(**info)
+        cls.objects.filter(user_id=user_id, id=identifier).update(**info, updated_at=timezone.now())
+        invalidate_block_producers(identifiers=[identifier])
 
     @classmethod
     def get(cls, identifier):
         """
         Get block producer by its identifier.
+
+        Raises `DoesNotExist` if there is no block producer with the identifier.
         """
-        block_producer_as_dict = cls.objects.filter(id=identifier).values().first()
+        block_producers = cls._get_with_users(cls.objects.filter(id=identifier))
 
-        user_identifier = block_producer_as_dict.get('user_id')
-        user_as_dict = User.objects.filter(id=user_identifier).values().first()
+        if not block_producers:
+            raise cls.DoesNotExist
 
-        del user_as_dict['password']
-        del user_as_dict['created']
-        del user_as_dict['email']
+        return block_producers[0]
 
-        block_producer_as_dict['user'] = user_as_dict
-        del block_producer_as_dict['created_at']
+    @classmethod
+    def get_comments_number(cls, identifier):
+        """
+        Get the stored comments number of block producer by its identifier.
 
-        return BlockProducerDto(**block_producer_as_dict)
+        Raises `DoesNotExist` if there is no block producer with the identifier.
+        """
+        return cls.objects.values_list('comments_count', flat=True).get(id=identifier)
 
     @classmethod
-    def search(cls, phrase):
+    def search(cls, phrase, limit=None, cursor=None):
         """
         Search block producers by phrase.
+
+        Block producers are ordered by relevance, the rank is scaled to integer to be exactly stored in the cursor.
+        Returns found block producers and the cursor of the next page.
         """
-        search_vector = SearchVector('name', weight='A') + \
-            SearchVector('location', weight='B') + \
-            SearchVector('short_description', weight='B') + \
-            SearchVector('full_description', weight='B')
+        search_query = SearchQuery(phrase)
 
-        block_producers_as_list = cls.objects.annotate(
-            search=search_vector,
-        ).filter(search=SearchQuery(phrase)).order_by('-created_at').values()
+        search_rank = Cast(
+            SearchRank(F('search_document'), search_query) * Value(SEARCH_RANK_PRECISION), output_field=IntegerField(),
+        )
 
-        for block_producer_as_dict in block_producers_as_list:
-            user_identifier = block_producer_as_dict.get('user_id')
+        block_producers = cls.objects.annotate(rank=search_rank).filter(search_document=search_query)
 
-            user_as_dict = User.objects.filter(id=user_identifier).values().first()
+        return cls._get_page(
+            block_producers,
+            limit=limit,
+            cursor=cursor,
+            ordering=FOUND_BLOCK_PRODUCERS_ORDERING,
+            cursor_parsers=FOUND_BLOCK_PRODUCERS_CURSOR_PARSERS,
+        )
 
-            del user_as_dict['password']
-            del user_as_dict['created']
-            del user_as_dict['email']
+    @classmethod
+    def suggest(cls, prefix, limit):
+        """
+        Get block producers suggestions which name or location has a word starting with the prefix.
 
-            del block_producer_as_dict['search']
-            del block_producer_as_dict['created_at']
+        Lookups are served by the trigram indexes, suggestions which name starts with the prefix go first, then they
+        are ordered by the name similarity to the prefix.
+        """
+        word_prefix_pattern = r'\m' + re.escape(prefix)
 
-            block_producer_as_dict['user'] = user_as_dict
+        block_producers = cls.objects.filter(
+            Q(name__iregex=word_prefix_pattern) | Q(location__iregex=word_prefix_pattern),
+        ).annotate(
+            is_name_prefixed=Case(
+                When(name__istartswith=prefix, then=Value(True)), default=Value(False), output_field=BooleanField(),
+            ),
+            similarity=TrigramSimilarity('name', prefix),
+        ).order_by('-is_name_prefixed', '-similarity', 'name', 'id').values('id', 'name', 'logo_url')[:limit]
 
-        return BlockProducerDto.schema().load(block_producers_as_list, many=True)
+        return [BlockProducerSuggestionDto(**block_producer) for block_producer in block_producers]
 
     @classmethod
     def get_last(cls, username):
         """
         Get user's last block producer by username.
         """
-        block_producers_as_dict = cls.objects.filter(user__username=username)
+        block_producers = cls._get_with_users(cls.objects.filter(user__username=username).order_by('-id')[:1])
 
-        if not block_producers_as_dict:
+        if not block_producers:
             return None
 
-        last_block_producer = block_producers_as_dict.values().last()
-
-        user_identifier = last_block_producer.get('user_id')
-        user_as_dict = User.objects.filter(id=user_identifier).values().first()
-
-        del user_as_dict['password']
-        del user_as_dict['created']
-        del user_as_dict['email']
-
-        last_block_producer['user'] = user_as_dict
-        del last_block_producer['created_at']
-
-        return BlockProducerDto(**last_block_producer)
+        return block_producers[0]
 
     @classmethod
     def delete_(cls, identifier):
@@ -218,6 +512,25 @@ class BlockProducer(models.Model):
         """
         cls.objects.filter(id=identifier).delete()
 
+    @classmethod
+    def repair_counters(cls):
+        """
+        Recompute likes and comments numbers of block producers, which differ from the actual ones.
+
+        Every number is repaired by a single set-based statement. Returns identifiers of the repaired block producers.
+        """
+        repaired_identifiers = set()
+
+        with transaction.atomic(), connection.cursor() as cursor:
+            for counted_table, counter in (
+                (BlockProducerLike._meta.db_table, 'likes_count'),
+                (BlockProducerComment._meta.db_table, 'comments_count'),
+            ):
+                cursor.execute(REPAIR_BLOCK_PRODUCERS_COUNTER.format(counted_table=counted_table, counter=counter))
+                repaired_identifiers.update(identifier for identifier, in cursor.fetchall())
+
+        return sorted(repaired_identifiers)
+
     @classmethod
     def get_status_description(cls, email, identifier):
         """
@@ -228,6 +541,86 @@ class BlockProducer(models.Model):
         return block_producer_as_dict.get('status_description')
 
 
+class BlockProducersVersion(models.Model):
+    """
+    Version of block producers collection database model.
+
+    It is a single row, which version is bumped when block producers or their users are changed, so the version
+    of the collection is got by a single primary key lookup instead of aggregating all block producers.
+    """
+
+    version = models.BigIntegerField(default=0)
+
+    @classmethod
+    def get(cls):
+        """
+        Get version of block producers collection.
+        """
+        return cls.objects.filter(id=BLOCK_PRODUCERS_VERSION_IDENTIFIER).values_list('version', flat=True).first() or 0
+
+    @classmethod
+    def bump(cls):
+        """
+        Bump version of block producers collection, the row is created if it does not exist yet.
+        """
+        with connection.cursor() as cursor:
+            cursor.execute(BUMP_BLOCK_PRODUCERS_VERSION, {'identifier': BLOCK_PRODUCERS_VERSION_IDENTIFIER})
+
+
+def invalidate_block_producers(identifiers):
+    """
+    Invalidate cached responses with block producers by their identifiers and bump version of the collection.
+    """
+    invalidate_block_producers_responses(identifiers=identifiers)
+    BlockProducersVersion.bump()
+
+
+@receiver(post_save, sender=BlockProducer)
+@receiver(post_delete, sender=BlockProducer)
+def invalidate_responses_when_changed(sender, instance, **kwargs):
+    """
+    Invalidate cached responses with the block producer if it is created, saved or deleted, e.g. by moderation.
+    """
+    invalidate_block_producers(identifiers=[instance.pk])
+
+
+def invalidate_users_block_producers_responses(lookups):
+    """
+    Invalidate cached responses with block producers of the users selected by the lookups, as users are embedded.
+    """
+    block_producer_identifiers = list(BlockProducer.objects.filter(
+        **{f'user__{lookup}': value for lookup, value in lookups.items()},
+    ).values_list('id', flat=True))
+
+    if block_producer_identifiers:
+        invalidate_block_producers(identifiers=block_producer_identifiers)
+
+
+@receiver(users_changed)
+def invalidate_responses_when_users_changed(sender, lookups, **kwargs):
+    """
+    Invalidate cached responses with block producers of the users changed by query set updates.
+    """
+    invalidate_users_block_producers_responses(lookups=lookups)
+
+
+@receiver(post_save, sender=User)
+def invalidate_responses_when_user_saved(sender, instance, created, update_fields, **kwargs):
+    """
+    Invalidate cached responses with block producers of the user if it is saved, e.g. by the admin panel.
+
+    Saves of specified fields none of which is embedded into block producers, e.g. of the password rehashed on
+    authentication, are skipped.
+    """
+    if created:
+        return
+
+    if update_fields is not None and update_fields.isdisjoint(BLOCK_PRODUCER_USER_FIELDS):
+        return
+
+    invalidate_users_block_producers_responses(lookups={'id': instance.pk})
+
+
 @receiver(post_save, sender=BlockProducer)
 def send_email_when_status_changed(sender, instance, **kwargs):
     """
@@ -259,6 +652,19 @@ class BlockProducerLike(models.Model):
 
     user = models.ForeignKey(User, on_delete=models.CASCADE)
     block_producer = models.ForeignKey(BlockProducer, on_delete=models.CASCADE)
+    created_at = models.DateTimeField(auto_now_add=True)
+
+    class Meta:
+        """
+        Meta.
+        """
+
+        constraints = [
+            models.UniqueConstraint(fields=['user', 'block_producer'], name='block_producer_like_unique'),
+        ]
+        indexes = [
+            models.Index(fields=['block_producer', '-created_at', '-id'], name='block_producer_like_idx'),
+        ]
 
     def __str__(self):
         """
@@ -267,70 +673,68 @@ class BlockProducerLike(models.Model):
         return f'{self.block_producer.name} — {self.user.email}'
 
     @classmethod
-    def does_exist(cls, user_email, block_producer_id):
-        """
-        Check if block producer like exists by user e-mail address and block producer identifier.
+    def toggle(cls, user_id, block_producer_id):
         """
-        user = User.objects.get(email=user_email)
-        block_producer = BlockProducer.objects.get(id=block_producer_id)
+        To like block producer if it is not liked by the user, or to unlike it otherwise.
 
-        if cls.objects.filter(user=user, block_producer=block_producer).exists():
-            return True
-
-        return False
-
-    @classmethod
-    def put(cls, user_email, block_producer_id):
-        """
-        To like to block producer.
+        It is done by a single call, so concurrent toggles neither duplicate likes nor lose likes numbers.
+        Returns the like state, or None if the block producer does not exist.
         """
-        user = User.objects.get(email=user_email)
-        block_producer = BlockProducer.objects.get(id=block_producer_id)
+        with connection.cursor() as cursor:
+            cursor.execute(TOGGLE_BLOCK_PRODUCER_LIKE, {
+                'user_id': user_id,
+                'block_producer_id': block_producer_id,
+                'created_at': timezone.now(),
+            })
 
-        cls.objects.create(user=user, block_producer=block_producer)
+            row = cursor.fetchone()
 
-    @classmethod
-    def remove(cls, user_email, block_producer_id):
-        """
-        To unlike to block producer.
-        """
-        user = User.objects.get(email=user_email)
-        block_producer = BlockProducer.objects.get(id=block_producer_id)
+        if row is None:
+            return None
 
-        block_producer_like = cls.objects.get(user=user, block_producer=block_producer)
-        block_producer_like.delete()
+        is_liked, likes = row
+        return BlockProducerLikeStateDto(is_liked=is_liked, likes=likes)
 
     @classmethod
-    def get_all(cls, block_producer_id):
+    def get_all(cls, block_producer_id, limit=None, streamed=False):
         """
-        Get likes for block producer.
+        Get likes for block producer, the newest first.
+
+        Likes are fetched together with their users in a single query, only the limited number of the newest likes
+        if the limit is specified. Likes are returned as serialized data transfer objects built from rows of
+        the query. If they are streamed, they are built lazily from rows fetched by chunks.
         """
-        block_producer = BlockProducer.objects.get(id=block_producer_id)
+        block_producer_likes = cls.objects.filter(
+            block_producer_id=block_producer_id,
+        ).order_by(*BLOCK_PRODUCER_LIKES_ORDERING)
 
-        block_producer_likes_as_dicts = cls.objects.filter(block_producer=block_producer).values()
+        if limit is not None:
+            block_producer_likes = block_producer_likes[:limit]
 
-        for block_producer_like in block_producer_likes_as_dicts:
-            user_identifier = block_producer_like.get('user_id')
-            user_as_dict = User.objects.filter(id=user_identifier).values().first()
+        rows = block_producer_likes.values_list(*BLOCK_PRODUCER_LIKE_PROJECTION.lookups)
 
-            del user_as_dict['password']
-            del user_as_dict['created']
-            del user_as_dict['email']
+        if streamed:
+            return BLOCK_PRODUCER_LIKE_PROJECTION.iterate(rows.iterator(chunk_size=STREAMING_CHUNK_SIZE))
 
-            block_producer_like['user'] = user_as_dict
+        return BLOCK_PRODUCER_LIKE_PROJECTION.project(rows)
 
-        return BlockProducerLikeDto.schema().load(block_producer_likes_as_dicts, many=True)
+    @classmethod
+    def get_version(cls):
+        """
+        Get version of likes numbers, which changes if any served likes number changes, e.g. by the repair.
+        """
+        return BlockProducer.get_counter_version(counter='likes_count')
 
     @classmethod
     def get_numbers(cls):
         """
         Get likes numbers for block producers.
         """
-        block_producer_likes_numbers = cls.objects.all().values(
-            'block_producer_id',
-        ).annotate(likes=Count('id'))
+        block_producer_likes_numbers = BlockProducer.objects.filter(
+            likes_count__gt=0,
+        ).values(block_producer_id=F('id'), likes=F('likes_count'))
 
-        return BlockProducerLikeNumberDto.schema().load(block_producer_likes_numbers, many=True)
+        return get_schema(BlockProducerLikeNumberDto).load(block_producer_likes_numbers, many=True)
 
 
 class BlockProducerComment(models.Model):
@@ -343,6 +747,15 @@ class BlockProducerComment(models.Model):
     text = models.CharField(max_length=1000, blank=False)
     created_at = models.DateTimeField(auto_now_add=True)
 
+    class Meta:
+        """
+        Meta.
+        """
+
+        indexes = [
+            models.Index(fields=['block_producer', '-created_at', '-id'], name='block_producer_comment_idx'),
+        ]
+
     def __str__(self):
         """
         Get string representation of an object.
@@ -350,47 +763,80 @@ class BlockProducerComment(models.Model):
         return f'{self.block_producer.name} — {self.user.email} — {self.created_at}'
 
     @classmethod
-    def create(cls, user_email, block_producer_id, text):
-        """
-        Create comment for block producer.
+    def create(cls, user_id, block_producer_id, text):
         """
-        user = User.objects.get(email=user_email)
-        block_producer = BlockProducer.objects.get(id=block_producer_id)
+        Create comment of the user for block producer.
 
-        cls.objects.create(user=user, block_producer=block_producer, text=text)
+        Comments number of the block producer is counted by the database trigger.
+        """
+        cls.objects.create(user_id=user_id, block_producer_id=block_producer_id, text=text)
 
     @classmethod
-    def get_all(cls, block_producer_id):
+    def get_all(cls, block_producer_id, streamed=False):
         """
         Get comments for block producer.
+
+        Comments are fetched together with their users and avatars of their profiles in a single joined query,
+        the oldest first. Comments are returned as serialized data transfer objects built from rows of the query.
+        If they are streamed, they are built lazily from rows fetched by chunks.
         """
-        block_producer = BlockProducer.objects.get(id=block_producer_id)
+        block_producer_comments = cls.objects.filter(
+            block_producer_id=block_producer_id,
+        ).order_by(*BLOCK_PRODUCER_COMMENTS_ORDERING)
 
-        block_producer_comments_as_dicts = cls.objects.filter(block_producer=block_producer).values()
+        rows = block_producer_comments.values_list(*BLOCK_PRODUCER_COMMENT_PROJECTION.lookups)
 
-        for block_producer_comment in block_producer_comments_as_dicts:
+        if streamed:
+            return BLOCK_PRODUCER_COMMENT_PROJECTION.iterate(rows.iterator(chunk_size=STREAMING_CHUNK_SIZE))
 
-            user_identifier = block_producer_comment.get('user_id')
-            user_as_dict = User.objects.filter(id=user_identifier).values().first()
+        return BLOCK_PRODUCER_COMMENT_PROJECTION.project(rows)
 
-            profile = Profile.objects.get(user__id=user_identifier)
+    @classmethod
+    def get_page(cls, block_producer_id, limit=None, cursor=None):
+        """
+        Get page of comments for block producer, the newest first.
+
+        The page begins right after the comment the cursor was built from and is served by the index of block
+        producer's comments by creation time, so its cost depends on neither the depth of the page nor the number
+        of comments. Returns comments and the cursor of the next page.
+        """
+        block_producer_comments = cls.objects.filter(
+            block_producer_id=block_producer_id,
+        ).order_by(*[f'-{field}' for field in BLOCK_PRODUCER_COMMENTS_ORDERING])
+
+        if cursor is not None:
+            cursor_values = decode_cursor(cursor=cursor, parsers=BLOCK_PRODUCER_COMMENTS_CURSOR_PARSERS)
+            block_producer_comments = block_producer_comments.filter(
+                get_descending_keyset_filter(BLOCK_PRODUCER_COMMENTS_ORDERING, cursor_values),
+            )
 
-            del user_as_dict['password']
-            del user_as_dict['created']
-            del user_as_dict['email']
+        if limit is None:
+            limit = DEFAULT_PAGE_SIZE
 
-            block_producer_comment['user'] = user_as_dict
-            block_producer_comment['profile_avatar_url'] = profile.avatar_url
+        lookups = BLOCK_PRODUCER_COMMENT_PROJECTION.lookups
+        rows = list(block_producer_comments.values_list(*lookups)[:limit + 1])
+        next_cursor = None
 
-        return BlockProducerCommentDto.schema().load(block_producer_comments_as_dicts, many=True)
+        if len(rows) > limit:
+            rows = rows[:limit]
+            next_cursor = encode_cursor(*[rows[-1][lookups.index(field)] for field in BLOCK_PRODUCER_COMMENTS_ORDERING])
+
+        return BLOCK_PRODUCER_COMMENT_PROJECTION.project(rows), next_cursor
+
+    @classmethod
+    def get_version(cls):
+        """
+        Get version of comments numbers, which changes if any served comments number changes, e.g. by the repair.
+        """
+        return BlockProducer.get_counter_version(counter='comments_count')
 
     @classmethod
     def get_numbers(cls):
         """
         Get comments numbers for block producers.
         """
-        block_producer_comments_numbers = cls.objects.all().values(
-            'block_producer_id',
-        ).annotate(comments=Count('text'))
+        block_producer_comments_numbers = BlockProducer.objects.filter(
+            comments_count__gt=0,
+        ).values(block_producer_id=F('id'), comments=F('comments_count'))
 
-        return BlockProducerCommentNumberDto.schema().load(block_producer_comments_numbers, many=True)
+        return get_schema(BlockProducerCommentNumberDto).load(block_producer_comments_numbers, many=True)
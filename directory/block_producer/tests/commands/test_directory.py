@@ -0,0 +1,81 @@
+"""
+Provide tests for implementation of commands to generate and benchmark the directory.
+"""
+import json
+from io import StringIO
+
+from django.core.management import call_command
+from django.core.management.base import CommandError
+from django.test import TransactionTestCase
+
+from block_producer.management.commands.benchmark_directory import clear_caches
+from block_producer.models import (
+    BlockProducer,
+    BlockProducerComment,
+    BlockProducerLike,
+)
+from user.models import User
+
+
+class TestDirectoryCommands(TransactionTestCase):
+    """
+    Implements tests for implementation of commands to generate and benchmark the directory.
+
+    Tests are transactional, so they are run after other tests and identifiers of generated rows do not shift
+    identifiers of rows created by other tests.
+    """
+
+    def setUp(self):
+        """
+        Setup.
+        """
+        call_command(
+            'generate_directory',
+            '--users', '3',
+            '--block-producers', '4',
+            '--likes', '2',
+            '--comments', '2',
+            '--seed', '1',
+            stdout=StringIO(),
+        )
+
+    def tearDown(self):
+        """
+        Clear caches filled by benchmarked requests, so they are not served to other tests.
+        """
+        clear_caches()
+
+    def test_generate_directory(self):
+        """
+        Case: generate the directory.
+        Expect: users, block producers with the numbers of likes and comments, likes and comments are created.
+        """
+        assert 3 == User.objects.filter(username__startswith='generated-').count()
+        assert 4 == BlockProducer.objects.count()
+        assert 8 == BlockProducerLike.objects.count()
+        assert 8 == BlockProducerComment.objects.count()
+        assert {(2, 2)} == set(BlockProducer.objects.values_list('likes_count', 'comments_count'))
+
+    def test_benchmark_directory(self):
+        """
+        Case: benchmark the generated directory.
+        Expect: every scenario is reported with its successful status code and numbers of queries.
+        """
+        output = StringIO()
+
+        call_command('benchmark_directory', '--repeats', '1', stdout=output)
+
+        report = json.loads(output.getvalue())
+
+        assert {'users': 3, 'block_producers': 4, 'likes': 8, 'comments': 8} == report.get('dataset')
+        assert 'login' in report.get('scenarios')
+        assert all(200 == scenario.get('status_code') for scenario in report.get('scenarios').values())
+        assert all(scenario.get('queries') > 0 for scenario in report.get('scenarios').values())
+
+    def test_benchmark_directory_with_failed_scenario(self):
+        """
+        Case: benchmark the generated directory with the wrong password, so the login scenario fails.
+        Expect: the command is stopped with the failed scenario error.
+        """
+        with self.assertRaisesMessage(CommandError, 'Scenario login has failed'):
+            call_command('benchmark_directory', '--repeats', '1', '--password', 'wrong-password', stdout=StringIO())
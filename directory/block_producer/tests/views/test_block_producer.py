@@ -4,9 +4,17 @@ Provide tests for implementation of block producer endpoints.
 import json
 from http import HTTPStatus
 
+from django.core.cache import caches
+from django.http import JsonResponse
 from django.test import TestCase
 
+from block_producer.dto.block_producer import (
+    BlockProducerDto,
+    BlockProducerWithStatisticsDto,
+)
 from block_producer.models import BlockProducer
+from block_producer.views.block_producer import SUGGESTIONS_CACHE
+from generic.serialization import serialize
 from user.models import User
 
 BLOCK_PRODUCER_INFO = {
@@ -136,6 +144,33 @@ class TestBlockProducerSingle(TestCase):
         assert expected_result == response.json()
         assert HTTPStatus.OK == response.status_code
 
+    def test_get_block_producer_number_of_queries(self):
+        """
+        Case: get block producer which response is not cached.
+        Expect: block producer with its user is fetched by a single database query, the rest of queries get and
+            store its version and its response in the database cache.
+        """
+        caches['responses'].clear()
+
+        with self.assertNumQueries(13):
+            response = self.client.get('/block-producers/1/', content_type='application/json')
+
+        assert 'Block producer Canada' == response.json().get('result').get('name')
+        assert HTTPStatus.OK == response.status_code
+
+    def test_get_block_producer_by_non_exiting_identifier_number_of_queries(self):
+        """
+        Case: get block producer by non-existing identifier which response is not cached.
+        Expect: block producer is looked up by a single database query, the rest of queries get and store its version
+            and look up its response in the database cache.
+        """
+        caches['responses'].clear()
+
+        with self.assertNumQueries(8):
+            response = self.client.get('/block-producers/3/', content_type='application/json')
+
+        assert HTTPStatus.NOT_FOUND == response.status_code
+
     def test_get_block_producer_by_non_exiting_identifier(self):
         """
         Case: get block producer by non-exiting identifier.
@@ -486,6 +521,50 @@ class TestBlockProducerSearchCollection(TestCase):
         assert expected_result == response.json()
         assert HTTPStatus.OK == response.status_code
 
+    def test_search_block_producers_ordered_by_relevance(self):
+        """
+        Case: search block producers by phrase which is in the name of one and in the description of another.
+        Expect: block producer with the phrase in the name goes first, even though it is older.
+        """
+        user = User.objects.get(username='martin.fowler')
+
+        BlockProducer.objects.create(
+            user=user,
+            name='Block producer Japan',
+            website_url='https://bpjapan.com',
+            short_description='Founded by a team of serial tech entrepreneurs.',
+        )
+
+        BlockProducer.objects.create(
+            user=user,
+            name='Block producer Asia',
+            website_url='https://bpasia.com',
+            short_description='Founded by a team of serial tech entrepreneurs.',
+            full_description='Our team works from Japan and Korea.',
+        )
+
+        response = self.client.get('/block-producers/search/?phrase=japan', content_type='application/json')
+
+        names = [block_producer.get('name') for block_producer in response.json().get('result')]
+
+        assert ['Block producer Japan', 'Block producer Asia'] == names
+        assert HTTPStatus.OK == response.status_code
+
+    def test_search_block_producers_after_update(self):
+        """
+        Case: search block producers by phrase from the updated name.
+        Expect: block producer is found by its new name, and is not found by its old name.
+        """
+        BlockProducer.objects.filter(name='Block producer USA').update(
+            name='Block producer Japan', short_description='Founded by a team of serial tech entrepreneurs.',
+        )
+
+        response_by_new_name = self.client.get('/block-producers/search/?phrase=japan')
+        response_by_old_name = self.client.get('/block-producers/search/?phrase=usa')
+
+        assert 'Block producer Japan' == response_by_new_name.json().get('result')[0].get('name')
+        assert [] == response_by_old_name.json().get('result')
+
     def test_search_block_producers_by_non_existent_phrase(self):
         """
         Case: search block producers by non-existent phrase.
@@ -497,3 +576,1033 @@ class TestBlockProducerSearchCollection(TestCase):
 
         assert expected_result == response.json()
         assert HTTPStatus.OK == response.status_code
+
+
+class TestBlockProducerCollectionQueries(TestCase):
+    """
+    Implements tests for number of database queries of collection block producer endpoint.
+    """
+
+    def setUp(self):
+        """
+        Setup.
+        """
+        for identifier in range(1, 6):
+            user = User.objects.create_user(
+                id=identifier,
+                email=f'martin.fowler.{identifier}@gmail.com',
+                username=f'martin.fowler.{identifier}',
+                password='martin.fowler.1337',
+                is_email_confirmed=True,
+            )
+
+            BlockProducer.objects.create(
+                id=identifier,
+                user=user,
+                name=f'Block producer {identifier}',
+                website_url='https://bpcanada.com',
+                short_description='Founded by a team of serial tech entrepreneurs in Canada.',
+            )
+
+    def test_get_block_producers_number_of_queries(self):
+        """
+        Case: get block producers.
+        Expect: block producers with their users are fetched by a single database query after the query
+            of the version of block producers, the rest of queries get and store the response in the database cache.
+        """
+        with self.assertNumQueries(9):
+            response = self.client.get('/block-producers/', content_type='application/json')
+
+        assert 5 == len(response.json().get('result'))
+        assert HTTPStatus.OK == response.status_code
+
+    def test_search_block_producers_number_of_queries(self):
+        """
+        Case: search block producers by phrase.
+        Expect: found block producers with their users are fetched by a single database query.
+        """
+        with self.assertNumQueries(1):
+            response = self.client.get('/block-producers/search/?phrase=producer', content_type='application/json')
+
+        assert 5 == len(response.json().get('result'))
+        assert HTTPStatus.OK == response.status_code
+
+
+class TestBlockProducerCollectionByIdentifiers(TestCase):
+    """
+    Implements tests for getting block producers by identifiers from collection block producer endpoint.
+    """
+
+    def setUp(self):
+        """
+        Setup.
+        """
+        caches['responses'].clear()
+
+        user = User.objects.create_user(
+            id=1,
+            email='martin.fowler@gmail.com',
+            username='martin.fowler',
+            password='martin.fowler.1337',
+            is_email_confirmed=True,
+        )
+
+        for identifier in range(1, 4):
+            BlockProducer.objects.create(
+                id=identifier,
+                user=user,
+                name=f'Block producer {identifier}',
+                website_url='https://bpcanada.com',
+                short_description='Founded by a team of serial tech entrepreneurs in Canada.',
+                likes_count=identifier,
+            )
+
+    def test_get_block_producers_by_identifiers(self):
+        """
+        Case: get block producers by identifiers including an identifier of a block producer which does not exist.
+        Expect: found block producers keyed by identifiers in the requested order are fetched by a single query
+            after the query of the version, the identifier of the missing block producer is returned as not found.
+        """
+        with self.assertNumQueries(2):
+            response = self.client.get('/block-producers/?ids=3,5,1', content_type='application/json')
+
+        result = response.json().get('result')
+
+        assert ['3', '1'] == list(result.keys())
+        assert 'Block producer 3' == result.get('3').get('name')
+        assert 'martin.fowler' == result.get('1').get('user').get('username')
+        assert [5] == response.json().get('not_found')
+        assert HTTPStatus.OK == response.status_code
+
+    def test_get_block_producers_by_identifiers_as_single_block_producers(self):
+        """
+        Case: get block producers by identifiers.
+        Expect: every block producer is the same as the single block producer with the same identifier.
+        """
+        response = self.client.get('/block-producers/?ids=1,2', content_type='application/json')
+
+        for identifier in ('1', '2'):
+            single_response = self.client.get(f'/block-producers/{identifier}/', content_type='application/json')
+            assert single_response.json().get('result') == response.json().get('result').get(identifier)
+
+    def test_get_block_producers_by_repeated_identifiers(self):
+        """
+        Case: get block producers by identifiers with repeated ones.
+        Expect: every block producer is returned once.
+        """
+        response = self.client.get('/block-producers/?ids=2,2,%202', content_type='application/json')
+
+        assert ['2'] == list(response.json().get('result').keys())
+        assert [] == response.json().get('not_found')
+
+    def test_get_block_producers_by_identifiers_with_counts(self):
+        """
+        Case: get block producers by identifiers with likes and comments numbers.
+        Expect: block producers with the numbers are fetched by a single query.
+        """
+        with self.assertNumQueries(1):
+            response = self.client.get('/block-producers/?ids=2,3&include=counts', content_type='application/json')
+
+        assert {'2': 2, '3': 3} == {
+            identifier: block_producer.get('likes')
+            for identifier, block_producer in response.json().get('result').items()
+        }
+        assert HTTPStatus.OK == response.status_code
+
+    def test_get_block_producers_by_invalid_identifiers(self):
+        """
+        Case: get block producers by identifiers which are not whole numbers.
+        Expect: enter a whole number error message.
+        """
+        response = self.client.get('/block-producers/?ids=1,first', content_type='application/json')
+
+        expected_result = {
+            'errors': {
+                'ids': ['Enter a whole number. first is not an identifier.'],
+            },
+        }
+
+        assert expected_result == response.json()
+        assert HTTPStatus.BAD_REQUEST == response.status_code
+
+    def test_get_block_producers_by_unicode_digits_identifiers(self):
+        """
+        Case: get block producers by identifiers of unicode digits which are not decimal ones.
+        Expect: enter a whole number error message.
+        """
+        response = self.client.get('/block-producers/?ids=1,²', content_type='application/json')
+
+        expected_result = {
+            'errors': {
+                'ids': ['Enter a whole number. ² is not an identifier.'],
+            },
+        }
+
+        assert expected_result == response.json()
+        assert HTTPStatus.BAD_REQUEST == response.status_code
+
+    def test_get_block_producers_by_too_many_identifiers(self):
+        """
+        Case: get block producers by more identifiers than allowed.
+        Expect: identifiers number is exceeded error message.
+        """
+        ids = ','.join(str(identifier) for identifier in range(1, 102))
+
+        response = self.client.get(f'/block-producers/?ids={ids}', content_type='application/json')
+
+        expected_result = {
+            'errors': {
+                'ids': ['Ensure this value has at most 100 identifiers (it has 101).'],
+            },
+        }
+
+        assert expected_result == response.json()
+        assert HTTPStatus.BAD_REQUEST == response.status_code
+
+    def test_get_block_producers_by_identifiers_with_limit(self):
+        """
+        Case: get block producers by identifiers with the limit.
+        Expect: identifiers cannot be combined with pagination error message.
+        """
+        response = self.client.get('/block-producers/?ids=1,2&limit=1', content_type='application/json')
+
+        expected_result = {
+            'errors': {
+                '__all__': ['Identifiers cannot be combined with limit, cursor or stream.'],
+            },
+        }
+
+        assert expected_result == response.json()
+        assert HTTPStatus.BAD_REQUEST == response.status_code
+
+
+class TestBlockProducerCollectionPagination(TestCase):
+    """
+    Implements tests for pagination of collection block producer endpoints.
+    """
+
+    def setUp(self):
+        """
+        Setup.
+        """
+        self.user = User.objects.create_user(
+            id=1,
+            email='martin.fowler@gmail.com',
+            username='martin.fowler',
+            password='martin.fowler.1337',
+            is_email_confirmed=True,
+        )
+
+        for identifier in range(1, 6):
+            BlockProducer.objects.create(
+                id=identifier,
+                user=self.user,
+                name=f'Block producer {identifier}',
+                website_url='https://bpcanada.com',
+                short_description='Founded by a team of serial tech entrepreneurs in Canada.',
+            )
+
+    def get_identifiers(self, url):
+        """
+        Get identifiers of block producers and the cursor of the next page by the url.
+        """
+        response = self.client.get(url, content_type='application/json')
+
+        assert HTTPStatus.OK == response.status_code
+
+        result = response.json()
+        return [block_producer.get('id') for block_producer in result.get('result')], result.get('next')
+
+    def test_get_block_producers_page(self):
+        """
+        Case: get the first page of block producers.
+        Expect: the newest block producers and the cursor of the next page are returned.
+        """
+        identifiers, next_cursor = self.get_identifiers('/block-producers/?limit=2')
+
+        assert [5, 4] == identifiers
+        assert next_cursor is not None
+
+    def test_get_block_producers_pages_with_concurrent_insert(self):
+        """
+        Case: get all pages of block producers while a new block producer is created between the requests.
+        Expect: every existing block producer is returned exactly once, the new one does not shift pages.
+        """
+        first_page, next_cursor = self.get_identifiers('/block-producers/?limit=2')
+
+        BlockProducer.objects.create(
+            id=100,
+            user=self.user,
+            name='Block producer USA',
+            website_url='https://bpusa.com',
+            short_description='Founded by a team of serial tech entrepreneurs in USA.',
+        )
+
+        second_page, next_cursor = self.get_identifiers(f'/block-producers/?limit=2&cursor={next_cursor}')
+        third_page, next_cursor = self.get_identifiers(f'/block-producers/?limit=2&cursor={next_cursor}')
+
+        assert [5, 4] == first_page
+        assert [3, 2] == second_page
+        assert [1] == third_page
+        assert next_cursor is None
+
+    def test_get_block_producers_pages_with_same_creation_time(self):
+        """
+        Case: get pages of block producers created at the same time.
+        Expect: block producers are ordered by identifier, every block producer is returned exactly once.
+        """
+        BlockProducer.objects.update(created_at=BlockProducer.objects.get(id=1).created_at)
+
+        first_page, next_cursor = self.get_identifiers('/block-producers/?limit=3')
+        second_page, next_cursor = self.get_identifiers(f'/block-producers/?limit=3&cursor={next_cursor}')
+
+        assert [5, 4, 3] == first_page
+        assert [2, 1] == second_page
+        assert next_cursor is None
+
+    def test_search_block_producers_pages(self):
+        """
+        Case: search block producers by phrase page by page.
+        Expect: every found block producer is returned exactly once.
+        """
+        first_page, next_cursor = self.get_identifiers('/block-producers/search/?phrase=producer&limit=3')
+        second_page, next_cursor = self.get_identifiers(
+            f'/block-producers/search/?phrase=producer&limit=3&cursor={next_cursor}',
+        )
+
+        assert [5, 4, 3] == first_page
+        assert [2, 1] == second_page
+        assert next_cursor is None
+
+    def test_get_block_producers_pages_projection(self):
+        """
+        Case: get pages of block producers.
+        Expect: response bodies are byte-for-byte identical to serialized block producers data transfer objects.
+        """
+        response = self.client.get('/block-producers/?limit=3', content_type='application/json')
+        next_cursor = response.json().get('next')
+
+        block_producers = [BlockProducer.get(identifier=identifier) for identifier in (5, 4, 3)]
+        expected_result = JsonResponse({'result': serialize(BlockProducerDto, block_producers), 'next': next_cursor})
+
+        assert expected_result.content == response.content
+
+        response = self.client.get(f'/block-producers/?limit=3&cursor={next_cursor}', content_type='application/json')
+
+        block_producers = [BlockProducer.get(identifier=identifier) for identifier in (2, 1)]
+        expected_result = JsonResponse({'result': serialize(BlockProducerDto, block_producers), 'next': None})
+
+        assert expected_result.content == response.content
+
+    def test_search_block_producers_projection(self):
+        """
+        Case: search block producers by phrase.
+        Expect: response body is byte-for-byte identical to serialized block producers data transfer objects.
+        """
+        response = self.client.get('/block-producers/search/?phrase=producer', content_type='application/json')
+
+        block_producers = [
+            BlockProducer.get(identifier=block_producer.get('id')) for block_producer in response.json().get('result')
+        ]
+        expected_result = JsonResponse({'result': serialize(BlockProducerDto, block_producers)})
+
+        assert expected_result.content == response.content
+
+    def test_get_block_producers_streamed(self):
+        """
+        Case: get block producers as a stream.
+        Expect: block producers are fetched while the response is being streamed, only the version of block
+            producers is queried before, the body is identical to the body of the not streamed response.
+        """
+        expected_result = self.client.get('/block-producers/', content_type='application/json').content
+
+        with self.assertNumQueries(1):
+            response = self.client.get('/block-producers/?stream=true', content_type='application/json')
+
+        with self.assertNumQueries(1):
+            content = b''.join(response.streaming_content)
+
+        assert expected_result == content
+        assert [5, 4, 3, 2, 1] == [block_producer.get('id') for block_producer in json.loads(content).get('result')]
+        assert HTTPStatus.OK == response.status_code
+
+    def test_get_block_producers_page_with_stream(self):
+        """
+        Case: get page of block producers as a stream.
+        Expect: the page is not streamed, the cursor of the next page is returned.
+        """
+        response = self.client.get('/block-producers/?stream=true&limit=2', content_type='application/json')
+
+        assert not response.streaming
+        assert response.json().get('next') is not None
+
+    def test_get_block_producers_page_with_invalid_cursor(self):
+        """
+        Case: get page of block producers with invalid cursor.
+        Expect: specified cursor is invalid error message.
+        """
+        expected_result = {
+            'error': 'Specified cursor is invalid.',
+        }
+
+        response = self.client.get('/block-producers/?limit=2&cursor=invalid', content_type='application/json')
+
+        assert expected_result == response.json()
+        assert HTTPStatus.BAD_REQUEST == response.status_code
+
+    def test_get_block_producers_page_with_exceeded_limit(self):
+        """
+        Case: get page of block producers with exceeded limit.
+        Expect: ensure this value is less than or equal to maximum page size error message.
+        """
+        expected_result = {
+            'errors': {
+                'limit': ['Ensure this value is less than or equal to 100.'],
+            },
+        }
+
+        response = self.client.get('/block-producers/?limit=101', content_type='application/json')
+
+        assert expected_result == response.json()
+        assert HTTPStatus.BAD_REQUEST == response.status_code
+
+
+class TestBlockProducerCollectionStatistics(TestCase):
+    """
+    Implements tests for statistics included to collection block producer endpoint.
+    """
+
+    def setUp(self):
+        """
+        Setup.
+        """
+        self.user = User.objects.create_user(
+            id=1,
+            email='martin.fowler@gmail.com',
+            username='martin.fowler',
+            password='martin.fowler.1337',
+            is_email_confirmed=True,
+        )
+
+        for identifier in range(1, 4):
+            BlockProducer.objects.create(
+                id=identifier,
+                user=self.user,
+                name=f'Block producer {identifier}',
+                website_url='https://bpcanada.com',
+                short_description='Founded by a team of serial tech entrepreneurs in Canada.',
+            )
+
+        response = self.client.post('/authentication/token/obtaining/', json.dumps({
+            'username_or_email': 'martin.fowler@gmail.com',
+            'password': 'martin.fowler.1337',
+        }), content_type='application/json')
+
+        self.user_token = response.data.get('token')
+
+        for block_producer_id in (1, 3):
+            self.client.put(
+                f'/block-producers/{block_producer_id}/likes/',
+                HTTP_AUTHORIZATION='JWT ' + self.user_token,
+                content_type='application/json',
+            )
+
+        self.client.put(
+            '/block-producers/3/comments/',
+            json.dumps({'text': 'Great block producer!'}),
+            HTTP_AUTHORIZATION='JWT ' + self.user_token,
+            content_type='application/json',
+        )
+
+    def get_statistics(self, response):
+        """
+        Get statistics of block producers from the response.
+        """
+        assert HTTPStatus.OK == response.status_code
+
+        return [
+            {key: value for key, value in block_producer.items() if key in ('id', 'likes', 'comments', 'is_liked')}
+            for block_producer in response.json().get('result')
+        ]
+
+    def test_get_block_producers_with_statistics(self):
+        """
+        Case: get block producers with likes and comments numbers and likes of the requesting user.
+        Expect: block producers with the statistics are fetched by a single database query.
+        """
+        expected_result = [
+            {'id': 3, 'likes': 1, 'comments': 1, 'is_liked': True},
+            {'id': 2, 'likes': 0, 'comments': 0, 'is_liked': False},
+            {'id': 1, 'likes': 1, 'comments': 0, 'is_liked': True},
+        ]
+
+        with self.assertNumQueries(1):
+            response = self.client.get(
+                '/block-producers/?include=counts,liked_by_me',
+                HTTP_AUTHORIZATION='JWT ' + self.user_token,
+                content_type='application/json',
+            )
+
+        assert expected_result == self.get_statistics(response)
+
+    def test_get_block_producers_with_statistics_projection(self):
+        """
+        Case: get block producers with each combination of the statistics.
+        Expect: response bodies are byte-for-byte identical to serialized block producers data transfer objects.
+        """
+        block_producers = [
+            BlockProducerWithStatisticsDto(
+                **vars(BlockProducer.get(identifier=identifier)), likes=likes, comments=comments, is_liked=is_liked,
+            ) for identifier, likes, comments, is_liked in ((3, 1, 1, True), (2, 0, 0, False), (1, 1, 0, True))
+        ]
+
+        for include, excluded_fields in (
+            ('counts', ('is_liked',)),
+            ('liked_by_me', ('likes', 'comments')),
+            ('counts,liked_by_me', ()),
+        ):
+            expected_result = JsonResponse({
+                'result': serialize(BlockProducerWithStatisticsDto, block_producers, exclude=excluded_fields),
+            })
+
+            response = self.client.get(
+                f'/block-producers/?include={include}',
+                HTTP_AUTHORIZATION='JWT ' + self.user_token,
+                content_type='application/json',
+            )
+
+            assert expected_result.content == response.content
+
+    def test_get_block_producers_page_with_counts(self):
+        """
+        Case: get page of block producers with likes and comments numbers only.
+        Expect: block producers with the numbers and without likes of the requesting user are returned.
+        """
+        expected_result = [
+            {'id': 3, 'likes': 1, 'comments': 1},
+            {'id': 2, 'likes': 0, 'comments': 0},
+        ]
+
+        response = self.client.get('/block-producers/?include=counts&limit=2', content_type='application/json')
+
+        assert expected_result == self.get_statistics(response)
+        assert response.json().get('next') is not None
+
+    def test_get_block_producers_liked_by_anonymous_user(self):
+        """
+        Case: get block producers with likes of the requesting user without authentication.
+        Expect: block producers are returned as not liked.
+        """
+        expected_result = [
+            {'id': 3, 'is_liked': False},
+            {'id': 2, 'is_liked': False},
+            {'id': 1, 'is_liked': False},
+        ]
+
+        response = self.client.get('/block-producers/?include=liked_by_me', content_type='application/json')
+
+        assert expected_result == self.get_statistics(response)
+
+    def test_get_block_producers_with_invalid_statistics(self):
+        """
+        Case: get block producers with statistics which are not available.
+        Expect: select a valid choice error message.
+        """
+        expected_result = {
+            'errors': {
+                'include': ['Select a valid choice. followers is not one of the available choices.'],
+            },
+        }
+
+        response = self.client.get('/block-producers/?include=counts,followers', content_type='application/json')
+
+        assert expected_result == response.json()
+        assert HTTPStatus.BAD_REQUEST == response.status_code
+
+
+class TestBlockProducerResponsesCache(TestCase):
+    """
+    Implements tests for caching of single and collection block producer endpoints responses.
+    """
+
+    def setUp(self):
+        """
+        Setup.
+        """
+        caches['responses'].clear()
+
+        self.user = User.objects.create_user(
+            id=1,
+            email='martin.fowler@gmail.com',
+            username='martin.fowler',
+            password='martin.fowler.1337',
+            is_email_confirmed=True,
+        )
+
+        for identifier in range(1, 3):
+            BlockProducer.objects.create(
+                id=identifier,
+                user=self.user,
+                name=f'Block producer {identifier}',
+                website_url='https://bpcanada.com',
+                short_description='Founded by a team of serial tech entrepreneurs in Canada.',
+            )
+
+        response = self.client.post('/authentication/token/obtaining/', json.dumps({
+            'username_or_email': 'martin.fowler@gmail.com',
+            'password': 'martin.fowler.1337',
+        }), content_type='application/json')
+
+        self.user_token = response.data.get('token')
+
+    def test_get_block_producer_from_cache(self):
+        """
+        Case: get block producer twice.
+        Expect: the second response is got from the database cache by queries of its version and itself only.
+        """
+        expected_result = self.client.get('/block-producers/1/', content_type='application/json').content
+
+        with self.assertNumQueries(2):
+            response = self.client.get('/block-producers/1/', content_type='application/json')
+
+        assert expected_result == response.content
+        assert HTTPStatus.OK == response.status_code
+
+    def test_get_block_producer_after_update(self):
+        """
+        Case: get block producer after it is updated by the owner.
+        Expect: the updated block producer is returned instead of the cached one.
+        """
+        self.client.get('/block-producers/1/', content_type='application/json')
+
+        self.client.post(
+            '/block-producers/1/',
+            json.dumps({'name': 'Block producer Japan'}),
+            HTTP_AUTHORIZATION='JWT ' + self.user_token,
+            content_type='application/json',
+        )
+
+        response = self.client.get('/block-producers/1/', content_type='application/json')
+
+        assert 'Block producer Japan' == response.json().get('result').get('name')
+
+    def test_get_block_producer_after_moderation(self):
+        """
+        Case: get block producer after its status is changed by saving the model, as the admin panel does.
+        Expect: the moderated block producer is returned instead of the cached one.
+        """
+        self.client.get('/block-producers/1/', content_type='application/json')
+
+        block_producer = BlockProducer.objects.get(id=1)
+        block_producer.status = 'active'
+        block_producer.save()
+
+        response = self.client.get('/block-producers/1/', content_type='application/json')
+
+        assert 'active' == response.json().get('result').get('status')
+
+    def test_get_block_producer_after_user_change(self):
+        """
+        Case: get block producer and block producers after e-mail of its user is confirmed and username is changed.
+        Expect: block producers with the changed user are returned instead of the cached ones.
+        """
+        User.objects.filter(id=1).update(is_email_confirmed=False)
+
+        self.client.get('/block-producers/1/', content_type='application/json')
+        self.client.get('/block-producers/', content_type='application/json')
+
+        User.set_email_as_confirmed(email='martin.fowler@gmail.com')
+
+        user = User.objects.get(id=1)
+        user.username = 'kent.beck'
+        user.save()
+
+        block_producer = self.client.get('/block-producers/1/', content_type='application/json').json().get('result')
+        block_producers = self.client.get('/block-producers/', content_type='application/json').json().get('result')
+
+        assert block_producer.get('user').get('is_email_confirmed')
+        assert 'kent.beck' == block_producer.get('user').get('username')
+        assert {'kent.beck'} == {block_producer.get('user').get('username') for block_producer in block_producers}
+
+    def test_save_user_password_keeps_cached_responses(self):
+        """
+        Case: save password of the user of block producer, as its rehashing on authentication does.
+        Expect: the password is saved by a single database query without invalidation of cached responses.
+        """
+        self.client.get('/block-producers/1/', content_type='application/json')
+
+        user = User.objects.get(id=1)
+        user.set_password('martin.fowler.1338')
+
+        with self.assertNumQueries(1):
+            user.save(update_fields=['password'])
+
+        with self.assertNumQueries(2):
+            response = self.client.get('/block-producers/1/', content_type='application/json')
+
+        assert HTTPStatus.OK == response.status_code
+
+    def test_get_block_producers_from_cache(self):
+        """
+        Case: get block producers twice.
+        Expect: the second response is got from the database cache after the query of the version of block producers.
+        """
+        expected_result = self.client.get('/block-producers/?limit=1', content_type='application/json').content
+
+        with self.assertNumQueries(3):
+            response = self.client.get('/block-producers/?limit=1', content_type='application/json')
+
+        assert expected_result == response.content
+        assert HTTPStatus.OK == response.status_code
+
+    def test_get_block_producers_after_creation_and_deletion(self):
+        """
+        Case: get block producers after a block producer is created and another one is deleted.
+        Expect: the actual block producers are returned instead of the cached ones.
+        """
+        self.client.get('/block-producers/', content_type='application/json')
+
+        BlockProducer.objects.create(
+            id=3,
+            user=self.user,
+            name='Block producer 3',
+            website_url='https://bpcanada.com',
+            short_description='Founded by a team of serial tech entrepreneurs in Canada.',
+        )
+        BlockProducer.delete_(identifier=1)
+
+        response = self.client.get('/block-producers/', content_type='application/json')
+
+        assert [3, 2] == [block_producer.get('id') for block_producer in response.json().get('result')]
+
+    def test_get_block_producers_with_statistics_not_from_cache(self):
+        """
+        Case: get block producers with statistics twice.
+        Expect: block producers are fetched from the database both times.
+        """
+        self.client.get('/block-producers/?include=counts', content_type='application/json')
+
+        with self.assertNumQueries(1):
+            self.client.get('/block-producers/?include=counts', content_type='application/json')
+
+
+class TestBlockProducerCollectionConditionalRequests(TestCase):
+    """
+    Implements tests for conditional requests of collection block producer endpoint.
+    """
+
+    def setUp(self):
+        """
+        Setup.
+        """
+        caches['responses'].clear()
+
+        self.user = User.objects.create_user(
+            id=1,
+            email='martin.fowler@gmail.com',
+            username='martin.fowler',
+            password='martin.fowler.1337',
+            is_email_confirmed=True,
+        )
+
+        for identifier in range(1, 3):
+            BlockProducer.objects.create(
+                id=identifier,
+                user=self.user,
+                name=f'Block producer {identifier}',
+                website_url='https://bpcanada.com',
+                short_description='Founded by a team of serial tech entrepreneurs in Canada.',
+            )
+
+        response = self.client.post('/authentication/token/obtaining/', json.dumps({
+            'username_or_email': 'martin.fowler@gmail.com',
+            'password': 'martin.fowler.1337',
+        }), content_type='application/json')
+
+        self.user_token = response.data.get('token')
+
+    def test_get_block_producers_not_modified(self):
+        """
+        Case: get block producers with the entity tag of the previous response.
+        Expect: not modified response without a body is returned after the only query of the version.
+        """
+        etag = self.client.get('/block-producers/', content_type='application/json')['ETag']
+
+        with self.assertNumQueries(1):
+            response = self.client.get('/block-producers/', HTTP_IF_NONE_MATCH=etag, content_type='application/json')
+
+        assert b'' == response.content
+        assert etag == response['ETag']
+        assert HTTPStatus.NOT_MODIFIED == response.status_code
+
+    def test_get_block_producers_modified_after_update(self):
+        """
+        Case: get block producers with the entity tag of the response got before a block producer is updated.
+        Expect: block producers with the new entity tag are returned.
+        """
+        etag = self.client.get('/block-producers/', content_type='application/json')['ETag']
+
+        self.client.post(
+            '/block-producers/1/',
+            json.dumps({'name': 'Block producer Canada'}),
+            HTTP_AUTHORIZATION='JWT ' + self.user_token,
+            content_type='application/json',
+        )
+
+        response = self.client.get('/block-producers/', HTTP_IF_NONE_MATCH=etag, content_type='application/json')
+
+        assert 'Block producer Canada' == response.json().get('result')[1].get('name')
+        assert etag != response['ETag']
+        assert HTTPStatus.OK == response.status_code
+
+    def test_get_block_producers_modified_after_user_change(self):
+        """
+        Case: get block producers with the entity tag of the response got before their user is changed.
+        Expect: block producers with the changed user and the new entity tag are returned.
+        """
+        User.objects.filter(id=1).update(is_email_confirmed=False)
+
+        etag = self.client.get('/block-producers/', content_type='application/json')['ETag']
+
+        User.set_email_as_confirmed(email='martin.fowler@gmail.com')
+
+        response = self.client.get('/block-producers/', HTTP_IF_NONE_MATCH=etag, content_type='application/json')
+
+        assert response.json().get('result')[0].get('user').get('is_email_confirmed')
+        assert etag != response['ETag']
+        assert HTTPStatus.OK == response.status_code
+
+    def test_get_block_producers_modified_after_deletion(self):
+        """
+        Case: get block producers with the entity tag of the response got before a block producer is deleted.
+        Expect: block producers with the new entity tag are returned.
+        """
+        etag = self.client.get('/block-producers/', content_type='application/json')['ETag']
+
+        self.client.delete('/block-producers/2/', HTTP_AUTHORIZATION='JWT ' + self.user_token)
+
+        response = self.client.get('/block-producers/', HTTP_IF_NONE_MATCH=etag, content_type='application/json')
+
+        assert [1] == [block_producer.get('id') for block_producer in response.json().get('result')]
+        assert etag != response['ETag']
+        assert HTTPStatus.OK == response.status_code
+
+    def test_get_block_producers_page_with_etag_of_other_page(self):
+        """
+        Case: get a page of block producers with the entity tag of all block producers.
+        Expect: the page is returned as entity tags differ by the query.
+        """
+        etag = self.client.get('/block-producers/', content_type='application/json')['ETag']
+
+        response = self.client.get(
+            '/block-producers/?limit=1', HTTP_IF_NONE_MATCH=etag, content_type='application/json',
+        )
+
+        assert [2] == [block_producer.get('id') for block_producer in response.json().get('result')]
+        assert HTTPStatus.OK == response.status_code
+
+    def test_get_block_producers_with_statistics_without_etag(self):
+        """
+        Case: get block producers with likes and comments numbers.
+        Expect: response has no entity tag as statistics are not versioned.
+        """
+        response = self.client.get('/block-producers/?include=counts', content_type='application/json')
+
+        assert not response.has_header('ETag')
+        assert HTTPStatus.OK == response.status_code
+
+
+class TestBlockProducerSuggestCollection(TestCase):
+    """
+    Implements tests for implementation of collection suggest block producer endpoint.
+    """
+
+    def setUp(self):
+        """
+        Setup.
+        """
+        SUGGESTIONS_CACHE.clear()
+
+        self.user = User.objects.create_user(
+            id=1,
+            email='martin.fowler@gmail.com',
+            username='martin.fowler',
+            password='martin.fowler.1337',
+            is_email_confirmed=True,
+        )
+
+        BlockProducer.objects.create(
+            id=1,
+            user=self.user,
+            name='Canada',
+            website_url='https://bpcanada.com',
+            location='Toronto, Canada',
+            logo_url='https://bpcanada.com/logo.png',
+            short_description='Founded by a team of serial tech entrepreneurs in Canada.',
+        )
+
+        BlockProducer.objects.create(
+            id=2,
+            user=self.user,
+            name='Block producer Canada',
+            website_url='https://bpcanada.com',
+            location='Vancouver, Canada',
+            logo_url='https://bpcanada.com/logo.png',
+            short_description='Founded by a team of serial tech entrepreneurs in Canada.',
+        )
+
+        BlockProducer.objects.create(
+            id=3,
+            user=self.user,
+            name='Block producer Maple',
+            website_url='https://bpmaple.com',
+            location='Montreal, Canada',
+            logo_url='https://bpmaple.com/logo.png',
+            short_description='Founded by a team of serial tech entrepreneurs in Canada.',
+        )
+
+        BlockProducer.objects.create(
+            id=4,
+            user=self.user,
+            name='Block producer Spain',
+            website_url='https://bpspain.com',
+            location='Madrid, Spain',
+            logo_url='https://bpspain.com/logo.png',
+            short_description='Founded by a team of serial tech entrepreneurs in Spain.',
+        )
+
+    def test_suggest_block_producers(self):
+        """
+        Case: suggest block producers by prefix.
+        Expect: block producers which name or location has a word starting with the prefix are returned, the most
+            similar go first.
+        """
+        expected_result = {
+            'result': [
+                {
+                    'id': 1,
+                    'name': 'Canada',
+                    'logo_url': 'https://bpcanada.com/logo.png',
+                },
+                {
+                    'id': 2,
+                    'name': 'Block producer Canada',
+                    'logo_url': 'https://bpcanada.com/logo.png',
+                },
+                {
+                    'id': 3,
+                    'name': 'Block producer Maple',
+                    'logo_url': 'https://bpmaple.com/logo.png',
+                },
+            ],
+        }
+
+        response = self.client.get('/block-producers/search/suggest/?prefix=cana', content_type='application/json')
+
+        assert expected_result == response.json()
+        assert HTTPStatus.OK == response.status_code
+
+    def test_suggest_block_producers_with_limit(self):
+        """
+        Case: suggest block producers by prefix with limit.
+        Expect: no more than the limit of the most similar block producers are returned.
+        """
+        response = self.client.get(
+            '/block-producers/search/suggest/?prefix=cana&limit=1', content_type='application/json',
+        )
+
+        assert [1] == [block_producer.get('id') for block_producer in response.json().get('result')]
+        assert HTTPStatus.OK == response.status_code
+
+    def test_suggest_block_producers_from_cache(self):
+        """
+        Case: suggest block producers by the same prefix twice.
+        Expect: the second suggestions are served from the cache after the only query of the version of block producers.
+        """
+        self.client.get('/block-producers/search/suggest/?prefix=Spa', content_type='application/json')
+
+        with self.assertNumQueries(1):
+            response = self.client.get('/block-producers/search/suggest/?prefix=spa', content_type='application/json')
+
+        assert [4] == [block_producer.get('id') for block_producer in response.json().get('result')]
+        assert HTTPStatus.OK == response.status_code
+
+    def test_suggest_block_producers_after_creation(self):
+        """
+        Case: suggest block producers by the same prefix before and after a block producer is created.
+        Expect: the created block producer is suggested instead of the cached suggestions.
+        """
+        self.client.get('/block-producers/search/suggest/?prefix=spa', content_type='application/json')
+
+        BlockProducer.objects.create(
+            id=5,
+            user=self.user,
+            name='Spark',
+            website_url='https://bpspark.com',
+            short_description='Founded by a team of serial tech entrepreneurs in Spain.',
+        )
+
+        response = self.client.get('/block-producers/search/suggest/?prefix=spa', content_type='application/json')
+
+        assert [5, 4] == [block_producer.get('id') for block_producer in response.json().get('result')]
+        assert HTTPStatus.OK == response.status_code
+
+    def test_suggest_block_producers_by_infix(self):
+        """
+        Case: suggest block producers by characters which are in the middle of words of names and locations.
+        Expect: no block producers are suggested.
+        """
+        response = self.client.get('/block-producers/search/suggest/?prefix=anada', content_type='application/json')
+
+        assert [] == response.json().get('result')
+        assert HTTPStatus.OK == response.status_code
+
+    def test_suggest_block_producers_starting_with_prefix_first(self):
+        """
+        Case: suggest block producers by prefix which one of names starts with and another one contains.
+        Expect: block producer which name starts with the prefix goes first, even if it is less similar.
+        """
+        BlockProducer.objects.create(
+            id=5,
+            user=self.user,
+            name='Maplewood Blockchain Infrastructure Services',
+            website_url='https://maplewood.com',
+            short_description='Founded by a team of serial tech entrepreneurs in Canada.',
+        )
+
+        response = self.client.get('/block-producers/search/suggest/?prefix=mapl', content_type='application/json')
+
+        assert [5, 3] == [block_producer.get('id') for block_producer in response.json().get('result')]
+        assert HTTPStatus.OK == response.status_code
+
+    def test_suggest_block_producers_by_too_short_prefix(self):
+        """
+        Case: suggest block producers by prefix shorter than 3 characters.
+        Expect: prefix is too short error message.
+        """
+        expected_result = {
+            'errors': {
+                'prefix': ['Ensure this value has at least 3 characters (it has 2).'],
+            },
+        }
+
+        response = self.client.get('/block-producers/search/suggest/?prefix=ca', content_type='application/json')
+
+        assert expected_result == response.json()
+        assert HTTPStatus.BAD_REQUEST == response.status_code
+
+    def test_suggest_block_producers_without_prefix(self):
+        """
+        Case: suggest block producers without prefix.
+        Expect: prefix is required error message.
+        """
+        expected_result = {
+            'errors': {
+                'prefix': ['This field is required.'],
+            },
+        }
+
+        response = self.client.get('/block-producers/search/suggest/', content_type='application/json')
+
+        assert expected_result == response.json()
+        assert HTTPStatus.BAD_REQUEST == response.status_code
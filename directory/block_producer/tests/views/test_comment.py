@@ -2,15 +2,23 @@
 Provide tests for implementation of single block producer comment endpoint.
 """
 import json
+from dataclasses import fields
 from http import HTTPStatus
 
+from django.http import JsonResponse
 from django.test import TestCase
 
+from block_producer.dto.comment import BlockProducerCommentDto
 from block_producer.models import (
     BlockProducer,
     BlockProducerComment,
 )
-from user.models import User
+from generic.serialization import serialize
+from user.dto.user import UserDtoWithoutEmail
+from user.models import (
+    Profile,
+    User,
+)
 
 
 class TestBlockProducerCommentSingle(TestCase):
@@ -129,3 +137,300 @@ class TestBlockProducerCommentSingle(TestCase):
 
         assert expected_result == response.json()
         assert HTTPStatus.BAD_REQUEST == response.status_code
+
+
+class TestBlockProducerCommentCollection(TestCase):
+    """
+    Implements tests for implementation of collection block producer comment endpoint.
+    """
+
+    def setUp(self):
+        """
+        Setup.
+        """
+        for identifier, username in ((1, 'martin.fowler'), (2, 'kent.beck')):
+            user = User.objects.create_user(
+                id=identifier,
+                email=f'{username}@gmail.com',
+                username=username,
+                password=f'{username}.1337',
+                is_email_confirmed=True,
+            )
+
+            Profile.objects.create(user=user, avatar_url=f'https://avatars.com/{username}.png')
+
+        BlockProducer.objects.create(
+            id=1,
+            user_id=1,
+            name='Block producer Canada',
+            website_url='https://bpcanada.com',
+            short_description='Founded by a team of serial tech entrepreneurs in Canada.',
+        )
+
+        for user_id, text in ((1, 'Great block producer!'), (2, 'Still great block producer!'), (1, 'Indeed!')):
+            BlockProducerComment.create(user_id=user_id, block_producer_id=1, text=text)
+
+    def test_get_comments_projection(self):
+        """
+        Case: get block producer's comments.
+        Expect: response body is byte-for-byte identical to serialized comments data transfer objects.
+        """
+        block_producer_comments = [
+            BlockProducerCommentDto(
+                id=comment.id,
+                user_id=comment.user_id,
+                block_producer_id=comment.block_producer_id,
+                user=UserDtoWithoutEmail(**{
+                    field.name: getattr(comment.user, field.name) for field in fields(UserDtoWithoutEmail)
+                }),
+                profile_avatar_url=comment.user.profile.avatar_url,
+                text=comment.text,
+                created_at=comment.created_at,
+            ) for comment in BlockProducerComment.objects.filter(block_producer_id=1).order_by('created_at', 'id')
+        ]
+        expected_result = JsonResponse({'result': serialize(BlockProducerCommentDto, block_producer_comments)})
+
+        with self.assertNumQueries(2):
+            response = self.client.get('/block-producers/1/comments/', content_type='application/json')
+
+        assert 3 == len(response.json().get('result'))
+        assert expected_result.content == response.content
+        assert HTTPStatus.OK == response.status_code
+
+    def test_get_comments_in_single_query(self):
+        """
+        Case: get block producer's comments made by many users.
+        Expect: comments are fetched with their users and profiles avatars by a single query, the oldest first.
+        """
+        for identifier in range(3, 23):
+            user = User.objects.create_user(
+                id=identifier, email=f'user.{identifier}@gmail.com', username=f'user.{identifier}', password='1337',
+            )
+
+            Profile.objects.create(user=user, avatar_url=f'https://avatars.com/{identifier}.png')
+            BlockProducerComment.create(user_id=identifier, block_producer_id=1, text=f'Comment {identifier}.')
+
+        with self.assertNumQueries(1):
+            block_producer_comments = BlockProducerComment.get_all(block_producer_id=1)
+
+        assert 23 == len(block_producer_comments)
+        assert 'Great block producer!' == block_producer_comments[0].get('text')
+        assert 'kent.beck' == block_producer_comments[1].get('user').get('username')
+        assert 'https://avatars.com/kent.beck.png' == block_producer_comments[1].get('profile_avatar_url')
+        assert 'https://avatars.com/22.png' == block_producer_comments[-1].get('profile_avatar_url')
+        assert [comment.get('created_at') for comment in block_producer_comments] == sorted(
+            comment.get('created_at') for comment in block_producer_comments
+        )
+
+    def test_get_comments_streamed(self):
+        """
+        Case: get block producer's comments as a stream.
+        Expect: comments are fetched while the response is being streamed, the body is identical to
+            the body of the not streamed response.
+        """
+        expected_result = self.client.get('/block-producers/1/comments/', content_type='application/json').content
+
+        response = self.client.get('/block-producers/1/comments/?stream=true', content_type='application/json')
+
+        with self.assertNumQueries(1):
+            content = b''.join(response.streaming_content)
+
+        assert expected_result == content
+        assert ['Great block producer!', 'Still great block producer!', 'Indeed!'] == [
+            comment.get('text') for comment in json.loads(content).get('result')
+        ]
+        assert HTTPStatus.OK == response.status_code
+
+    def test_get_comments_pages(self):
+        """
+        Case: get block producer's comments by pages.
+        Expect: comments are returned the newest first with the cursor of the next page and the total number.
+        """
+        response = self.client.get('/block-producers/1/comments/?limit=2', content_type='application/json')
+
+        first_page = response.json()
+
+        assert ['Indeed!', 'Still great block producer!'] == [
+            comment.get('text') for comment in first_page.get('result')
+        ]
+        assert 3 == first_page.get('total')
+        assert first_page.get('next') is not None
+        assert HTTPStatus.OK == response.status_code
+
+        response = self.client.get(
+            f'/block-producers/1/comments/?limit=2&cursor={first_page.get("next")}', content_type='application/json',
+        )
+
+        second_page = response.json()
+
+        assert ['Great block producer!'] == [comment.get('text') for comment in second_page.get('result')]
+        assert 3 == second_page.get('total')
+        assert second_page.get('next') is None
+
+    def test_get_comments_page_in_constant_queries(self):
+        """
+        Case: get the first page of comments of a block producer with many comments.
+        Expect: the page is fetched by the same number of queries as for a block producer with a few comments.
+        """
+        for _ in range(50):
+            BlockProducerComment.create(user_id=2, block_producer_id=1, text='Great block producer!')
+
+        with self.assertNumQueries(2):
+            response = self.client.get('/block-producers/1/comments/?limit=20', content_type='application/json')
+
+        assert 20 == len(response.json().get('result'))
+        assert 53 == response.json().get('total')
+
+    def test_get_comments_page_with_invalid_cursor(self):
+        """
+        Case: get page of block producer's comments with invalid cursor.
+        Expect: specified cursor is invalid error message.
+        """
+        expected_result = {
+            'error': 'Specified cursor is invalid.',
+        }
+
+        response = self.client.get('/block-producers/1/comments/?cursor=invalid', content_type='application/json')
+
+        assert expected_result == response.json()
+        assert HTTPStatus.BAD_REQUEST == response.status_code
+
+    def test_get_comments_page_of_non_existing_block_producer(self):
+        """
+        Case: get page of comments of a non-existing block producer.
+        Expect: block producer with specified identifier does not exist error message.
+        """
+        expected_result = {
+            'error': 'Block producer with specified identifier does not exist.',
+        }
+
+        response = self.client.get('/block-producers/100500/comments/?limit=20', content_type='application/json')
+
+        assert expected_result == response.json()
+        assert HTTPStatus.NOT_FOUND == response.status_code
+
+
+class TestBlockProducerCommentNumberCollection(TestCase):
+    """
+    Implements tests for implementation of collection block producer comments number endpoint.
+    """
+
+    def setUp(self):
+        """
+        Setup.
+        """
+        user = User.objects.create_user(
+            id=1,
+            email='martin.fowler@gmail.com',
+            username='martin.fowler',
+            password='martin.fowler.1337',
+            is_email_confirmed=True,
+        )
+
+        for identifier in range(1, 3):
+            BlockProducer.objects.create(
+                id=identifier,
+                user=user,
+                name=f'Block producer {identifier}',
+                website_url='https://bpcanada.com',
+                short_description='Founded by a team of serial tech entrepreneurs in Canada.',
+            )
+
+        response = self.client.post('/authentication/token/obtaining/', json.dumps({
+            'username_or_email': 'martin.fowler@gmail.com',
+            'password': 'martin.fowler.1337',
+        }), content_type='application/json')
+
+        self.user_token = response.data.get('token')
+
+    def test_get_comments_numbers(self):
+        """
+        Case: get comments numbers after block producer is commented.
+        Expect: numbers of comments of block producers having comments are returned.
+        """
+        for text in ('Great block producer!', 'Still great block producer!'):
+            self.client.put(
+                '/block-producers/2/comments/',
+                json.dumps({'text': text}),
+                HTTP_AUTHORIZATION='JWT ' + self.user_token,
+                content_type='application/json',
+            )
+
+        expected_result = {
+            'result': [
+                {
+                    'block_producer_id': 2,
+                    'comments': 2,
+                },
+            ],
+        }
+
+        with self.assertNumQueries(2):
+            response = self.client.get('/block-producers/comments/numbers/', content_type='application/json')
+
+        assert expected_result == response.json()
+        assert HTTPStatus.OK == response.status_code
+
+    def test_get_comments_numbers_after_deletion(self):
+        """
+        Case: get comments numbers after the commenter is deleted and a comment is deleted by the admin panel.
+        Expect: numbers of comments of block producers exclude the deleted comments.
+        """
+        commenter = User.objects.create_user(
+            id=2,
+            email='kent.beck@gmail.com',
+            username='kent.beck',
+            password='kent.beck.1337',
+            is_email_confirmed=True,
+        )
+
+        BlockProducerComment.create(user_id=1, block_producer_id=1, text='Great block producer!')
+        BlockProducerComment.create(user_id=1, block_producer_id=2, text='Great block producer!')
+        BlockProducerComment.create(user_id=2, block_producer_id=1, text='Still great block producer!')
+        BlockProducerComment.create(user_id=2, block_producer_id=2, text='Still great block producer!')
+
+        commenter.delete()
+        BlockProducerComment.objects.get(user_id=1, block_producer_id=2).delete()
+
+        expected_result = {
+            'result': [
+                {
+                    'block_producer_id': 1,
+                    'comments': 1,
+                },
+            ],
+        }
+
+        response = self.client.get('/block-producers/comments/numbers/', content_type='application/json')
+
+        assert expected_result == response.json()
+        assert HTTPStatus.OK == response.status_code
+
+    def test_get_comments_numbers_not_modified(self):
+        """
+        Case: get comments numbers with the entity tag of the previous response.
+        Expect: not modified response is returned until a block producer is commented.
+        """
+        etag = self.client.get('/block-producers/comments/numbers/', content_type='application/json')['ETag']
+
+        with self.assertNumQueries(1):
+            response = self.client.get(
+                '/block-producers/comments/numbers/', HTTP_IF_NONE_MATCH=etag, content_type='application/json',
+            )
+
+        assert HTTPStatus.NOT_MODIFIED == response.status_code
+
+        self.client.put(
+            '/block-producers/1/comments/',
+            json.dumps({'text': 'Great block producer!'}),
+            HTTP_AUTHORIZATION='JWT ' + self.user_token,
+            content_type='application/json',
+        )
+
+        response = self.client.get(
+            '/block-producers/comments/numbers/', HTTP_IF_NONE_MATCH=etag, content_type='application/json',
+        )
+
+        assert [{'block_producer_id': 1, 'comments': 1}] == response.json().get('result')
+        assert etag != response['ETag']
+        assert HTTPStatus.OK == response.status_code
@@ -2,14 +2,28 @@
 Provide tests for implementation of single block producer like endpoint.
 """
 import json
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import fields
 from http import HTTPStatus
+from io import StringIO
 
-from django.test import TestCase
+from django.core.management import call_command
+from django.db import connection
+from django.http import JsonResponse
+from django.test import (
+    Client,
+    TestCase,
+    TransactionTestCase,
+)
 
+from block_producer.dto.like import BlockProducerLikeDto
 from block_producer.models import (
     BlockProducer,
     BlockProducerLike,
 )
+from generic.jwt import TOKEN_VERSIONS_CACHE
+from generic.serialization import serialize
+from user.dto.user import UserDtoWithoutEmail
 from user.models import User
 
 
@@ -51,7 +65,10 @@ class TestBlockProducerLikeSingle(TestCase):
         Expect: block producer like record is created in database.
         """
         expected_result = {
-            'result': 'Block producer liking has been handled.',
+            'result': {
+                'is_liked': True,
+                'likes': 1,
+            },
         }
 
         response = self.client.put(
@@ -66,13 +83,16 @@ class TestBlockProducerLikeSingle(TestCase):
 
     def test_unlike(self):
         """
-        Case: to like block producer.
+        Case: to like already liked block producer.
         Expect: block producer like record is deleted from database.
         """
         BlockProducerLike.objects.create(user=self.user, block_producer=self.block_producer)
 
         expected_result = {
-            'result': 'Block producer liking has been handled.',
+            'result': {
+                'is_liked': False,
+                'likes': 0,
+            },
         }
 
         response = self.client.put(
@@ -85,6 +105,42 @@ class TestBlockProducerLikeSingle(TestCase):
         assert expected_result == response.json()
         assert HTTPStatus.OK == response.status_code
 
+    def test_like_number_of_queries(self):
+        """
+        Case: to like block producer.
+        Expect: the like is toggled by a single database query besides the token version check.
+        """
+        TOKEN_VERSIONS_CACHE.clear()
+
+        with self.assertNumQueries(2):
+            response = self.client.put(
+                f'/block-producers/{self.block_producer.id}/likes/',
+                HTTP_AUTHORIZATION='JWT ' + self.user_token,
+                content_type='application/json',
+            )
+
+        assert HTTPStatus.OK == response.status_code
+
+    def test_like_with_cached_token_version_number_of_queries(self):
+        """
+        Case: to like block producer again.
+        Expect: the like is toggled by a single database query, the user is not fetched for authentication.
+        """
+        self.client.put(
+            f'/block-producers/{self.block_producer.id}/likes/',
+            HTTP_AUTHORIZATION='JWT ' + self.user_token,
+            content_type='application/json',
+        )
+
+        with self.assertNumQueries(1):
+            response = self.client.put(
+                f'/block-producers/{self.block_producer.id}/likes/',
+                HTTP_AUTHORIZATION='JWT ' + self.user_token,
+                content_type='application/json',
+            )
+
+        assert HTTPStatus.OK == response.status_code
+
     def test_like_non_existing_block_producer(self):
         """
         Case: to like non-exiting block producer.
@@ -104,3 +160,430 @@ class TestBlockProducerLikeSingle(TestCase):
 
         assert expected_result == response.json()
         assert HTTPStatus.NOT_FOUND == response.status_code
+
+
+class TestBlockProducerLikeCollection(TestCase):
+    """
+    Implements tests for implementation of collection block producer likes endpoint.
+    """
+
+    def setUp(self):
+        """
+        Setup.
+        """
+        for identifier, username in ((1, 'martin.fowler'), (2, 'kent.beck')):
+            user = User.objects.create_user(
+                id=identifier,
+                email=f'{username}@gmail.com',
+                username=username,
+                password=f'{username}.1337',
+                is_email_confirmed=True,
+            )
+
+            BlockProducer.objects.create(
+                id=identifier,
+                user=user,
+                name=f'Block producer {identifier}',
+                website_url='https://bpcanada.com',
+                short_description='Founded by a team of serial tech entrepreneurs in Canada.',
+            )
+
+        for user_id, block_producer_id in ((1, 1), (2, 1), (2, 2)):
+            BlockProducerLike.toggle(user_id=user_id, block_producer_id=block_producer_id)
+
+    def test_get_likes_projection(self):
+        """
+        Case: get block producer's likes.
+        Expect: response body is byte-for-byte identical to serialized likes data transfer objects.
+        """
+        block_producer_likes = [
+            BlockProducerLikeDto(
+                id=like.id,
+                user_id=like.user_id,
+                block_producer_id=like.block_producer_id,
+                user=UserDtoWithoutEmail(**{
+                    field.name: getattr(like.user, field.name) for field in fields(UserDtoWithoutEmail)
+                }),
+                created_at=like.created_at,
+            ) for like in BlockProducerLike.objects.filter(block_producer_id=1).order_by('-created_at', '-id')
+        ]
+        expected_result = JsonResponse({'result': serialize(BlockProducerLikeDto, block_producer_likes)})
+
+        with self.assertNumQueries(2):
+            response = self.client.get('/block-producers/1/likes/', content_type='application/json')
+
+        assert 2 == len(response.json().get('result'))
+        assert expected_result.content == response.content
+        assert HTTPStatus.OK == response.status_code
+
+    def test_get_likes_streamed(self):
+        """
+        Case: get block producer's likes as a stream.
+        Expect: likes are fetched while the response is being streamed, the body is identical to
+            the body of the not streamed response.
+        """
+        expected_result = self.client.get('/block-producers/1/likes/', content_type='application/json').content
+
+        response = self.client.get('/block-producers/1/likes/?stream=true', content_type='application/json')
+
+        with self.assertNumQueries(1):
+            content = b''.join(response.streaming_content)
+
+        assert expected_result == content
+        assert [2, 1] == [like.get('user_id') for like in json.loads(content).get('result')]
+        assert HTTPStatus.OK == response.status_code
+
+    def test_get_likes_in_single_query(self):
+        """
+        Case: get block producer's likes made by many users.
+        Expect: likes are fetched with their users by a single query, the newest first.
+        """
+        for identifier in range(3, 23):
+            User.objects.create_user(
+                id=identifier, email=f'user.{identifier}@gmail.com', username=f'user.{identifier}', password='1337',
+            )
+
+            BlockProducerLike.toggle(user_id=identifier, block_producer_id=1)
+
+        with self.assertNumQueries(1):
+            block_producer_likes = BlockProducerLike.get_all(block_producer_id=1)
+
+        assert 22 == len(block_producer_likes)
+        assert 'user.22' == block_producer_likes[0].get('user').get('username')
+        assert 'martin.fowler' == block_producer_likes[-1].get('user').get('username')
+        assert [like.get('created_at') for like in block_producer_likes] == sorted(
+            (like.get('created_at') for like in block_producer_likes), reverse=True,
+        )
+
+    def test_get_likes_with_limit(self):
+        """
+        Case: get the limited number of block producer's likes.
+        Expect: only the newest likes are returned.
+        """
+        response = self.client.get('/block-producers/1/likes/?limit=1', content_type='application/json')
+
+        assert [2] == [like.get('user_id') for like in response.json().get('result')]
+        assert HTTPStatus.OK == response.status_code
+
+    def test_get_likes_of_non_existing_block_producer(self):
+        """
+        Case: get likes of a non-existing block producer.
+        Expect: block producer with specified identifier does not exist error message.
+        """
+        expected_result = {
+            'error': 'Block producer with specified identifier does not exist.',
+        }
+
+        response = self.client.get('/block-producers/100500/likes/', content_type='application/json')
+
+        assert expected_result == response.json()
+        assert HTTPStatus.NOT_FOUND == response.status_code
+
+
+class TestBlockProducerLikeNumberCollection(TestCase):
+    """
+    Implements tests for implementation of collection block producer likes number endpoint.
+    """
+
+    def setUp(self):
+        """
+        Setup.
+        """
+        self.users = [
+            User.objects.create_user(
+                id=identifier,
+                email=f'martin.fowler.{identifier}@gmail.com',
+                username=f'martin.fowler.{identifier}',
+                password='martin.fowler.1337',
+                is_email_confirmed=True,
+            ) for identifier in range(1, 3)
+        ]
+
+        self.block_producers = [
+            BlockProducer.objects.create(
+                id=identifier,
+                user=self.users[0],
+                name=f'Block producer {identifier}',
+                website_url='https://bpcanada.com',
+                short_description='Founded by a team of serial tech entrepreneurs in Canada.',
+            ) for identifier in range(1, 3)
+        ]
+
+        self.user_tokens = []
+
+        for user in self.users:
+            response = self.client.post('/authentication/token/obtaining/', json.dumps({
+                'username_or_email': user.email,
+                'password': 'martin.fowler.1337',
+            }), content_type='application/json')
+
+            self.user_tokens.append(response.data.get('token'))
+
+    def like(self, user_token, block_producer_id):
+        """
+        To like or unlike block producer by the user with the token.
+        """
+        self.client.put(
+            f'/block-producers/{block_producer_id}/likes/',
+            HTTP_AUTHORIZATION='JWT ' + user_token,
+            content_type='application/json',
+        )
+
+    def test_get_likes_numbers(self):
+        """
+        Case: get likes numbers after block producers are liked and unliked.
+        Expect: numbers of likes of block producers having likes are returned.
+        """
+        self.like(user_token=self.user_tokens[0], block_producer_id=1)
+        self.like(user_token=self.user_tokens[1], block_producer_id=1)
+        self.like(user_token=self.user_tokens[0], block_producer_id=2)
+        self.like(user_token=self.user_tokens[0], block_producer_id=2)
+
+        expected_result = {
+            'result': [
+                {
+                    'block_producer_id': 1,
+                    'likes': 2,
+                },
+            ],
+        }
+
+        with self.assertNumQueries(2):
+            response = self.client.get('/block-producers/likes/numbers/', content_type='application/json')
+
+        assert expected_result == response.json()
+        assert HTTPStatus.OK == response.status_code
+
+    def test_get_likes_numbers_after_repair(self):
+        """
+        Case: get likes numbers after the numbers are changed by hand and repaired.
+        Expect: actual numbers of likes of block producers are returned, every number is repaired by a single query.
+        """
+        BlockProducerLike.objects.create(user=self.users[0], block_producer=self.block_producers[1])
+        BlockProducer.objects.filter(id=1).update(likes_count=5)
+        BlockProducer.objects.filter(id=2).update(likes_count=0)
+
+        # Numbers are repaired in a transaction, which is run as a savepoint in tests.
+        with self.assertNumQueries(4):
+            call_command('repair_counters', stdout=StringIO())
+
+        expected_result = {
+            'result': [
+                {
+                    'block_producer_id': 2,
+                    'likes': 1,
+                },
+            ],
+        }
+
+        response = self.client.get('/block-producers/likes/numbers/', content_type='application/json')
+
+        assert expected_result == response.json()
+        assert HTTPStatus.OK == response.status_code
+
+    def test_get_likes_numbers_after_user_deletion(self):
+        """
+        Case: get likes numbers after the user liked block producers is deleted with the likes by the cascade.
+        Expect: numbers of likes of block producers exclude the likes of the deleted user.
+        """
+        self.like(user_token=self.user_tokens[0], block_producer_id=1)
+        self.like(user_token=self.user_tokens[1], block_producer_id=1)
+        self.like(user_token=self.user_tokens[1], block_producer_id=2)
+
+        self.client.delete(
+            '/users/martin.fowler.2/', HTTP_AUTHORIZATION='JWT ' + self.user_tokens[1], content_type='application/json',
+        )
+
+        expected_result = {
+            'result': [
+                {
+                    'block_producer_id': 1,
+                    'likes': 1,
+                },
+            ],
+        }
+
+        response = self.client.get('/block-producers/likes/numbers/', content_type='application/json')
+
+        assert expected_result == response.json()
+        assert HTTPStatus.OK == response.status_code
+
+    def test_get_likes_numbers_after_like_deletion(self):
+        """
+        Case: get likes numbers after the like is deleted by its model, as the admin panel does.
+        Expect: numbers of likes of block producers exclude the deleted like.
+        """
+        self.like(user_token=self.user_tokens[0], block_producer_id=1)
+
+        BlockProducerLike.objects.get(user=self.users[0], block_producer_id=1).delete()
+
+        response = self.client.get('/block-producers/likes/numbers/', content_type='application/json')
+
+        assert {'result': []} == response.json()
+        assert HTTPStatus.OK == response.status_code
+
+    def test_get_likes_numbers_after_like_creation_and_move(self):
+        """
+        Case: get likes numbers after likes are created and moved to another block producer by the admin panel.
+        Expect: numbers of likes of block producers are counted by the database.
+        """
+        like = BlockProducerLike.objects.create(user=self.users[0], block_producer=self.block_producers[0])
+        BlockProducerLike.objects.create(user=self.users[1], block_producer=self.block_producers[0])
+
+        like.block_producer = self.block_producers[1]
+        like.save()
+
+        expected_result = {
+            'result': [
+                {
+                    'block_producer_id': 1,
+                    'likes': 1,
+                },
+                {
+                    'block_producer_id': 2,
+                    'likes': 1,
+                },
+            ],
+        }
+
+        response = self.client.get('/block-producers/likes/numbers/', content_type='application/json')
+
+        assert expected_result == response.json()
+        assert HTTPStatus.OK == response.status_code
+
+    def test_get_likes_numbers_not_modified(self):
+        """
+        Case: get likes numbers with the entity tag of the previous response.
+        Expect: not modified response is returned until a block producer is liked.
+        """
+        self.like(user_token=self.user_tokens[0], block_producer_id=1)
+
+        etag = self.client.get('/block-producers/likes/numbers/', content_type='application/json')['ETag']
+
+        with self.assertNumQueries(1):
+            response = self.client.get(
+                '/block-producers/likes/numbers/', HTTP_IF_NONE_MATCH=etag, content_type='application/json',
+            )
+
+        assert HTTPStatus.NOT_MODIFIED == response.status_code
+
+        self.like(user_token=self.user_tokens[1], block_producer_id=2)
+
+        response = self.client.get(
+            '/block-producers/likes/numbers/', HTTP_IF_NONE_MATCH=etag, content_type='application/json',
+        )
+
+        assert [1, 2] == [number.get('block_producer_id') for number in response.json().get('result')]
+        assert etag != response['ETag']
+        assert HTTPStatus.OK == response.status_code
+
+    def test_get_likes_numbers_modified_after_repair(self):
+        """
+        Case: get likes numbers with the entity tag of the previous response after drifted numbers are repaired.
+        Expect: the repaired numbers with the new entity tag are returned.
+        """
+        self.like(user_token=self.user_tokens[0], block_producer_id=1)
+        BlockProducer.objects.filter(id=1).update(likes_count=5)
+
+        etag = self.client.get('/block-producers/likes/numbers/', content_type='application/json')['ETag']
+
+        call_command('repair_counters', stdout=StringIO())
+
+        response = self.client.get(
+            '/block-producers/likes/numbers/', HTTP_IF_NONE_MATCH=etag, content_type='application/json',
+        )
+
+        assert [1] == [number.get('likes') for number in response.json().get('result')]
+        assert etag != response['ETag']
+        assert HTTPStatus.OK == response.status_code
+
+    def test_get_likes_numbers_modified_after_unlike(self):
+        """
+        Case: get likes numbers with the entity tag of the response got before a block producer is unliked.
+        Expect: actual numbers of likes are returned.
+        """
+        self.like(user_token=self.user_tokens[0], block_producer_id=1)
+
+        etag = self.client.get('/block-producers/likes/numbers/', content_type='application/json')['ETag']
+
+        self.like(user_token=self.user_tokens[0], block_producer_id=1)
+
+        response = self.client.get(
+            '/block-producers/likes/numbers/', HTTP_IF_NONE_MATCH=etag, content_type='application/json',
+        )
+
+        assert {'result': []} == response.json()
+        assert HTTPStatus.OK == response.status_code
+
+
+class TestBlockProducerLikeSingleConcurrency(TransactionTestCase):
+    """
+    Implements tests for concurrent requests to single block producer like endpoint.
+    """
+
+    def setUp(self):
+        """
+        Setup.
+        """
+        self.user_tokens = []
+
+        for identifier in range(1, 9):
+            user = User.objects.create_user(
+                id=identifier,
+                email=f'martin.fowler.{identifier}@gmail.com',
+                username=f'martin.fowler.{identifier}',
+                password='martin.fowler.1337',
+                is_email_confirmed=True,
+            )
+
+            response = self.client.post('/authentication/token/obtaining/', json.dumps({
+                'username_or_email': user.email,
+                'password': 'martin.fowler.1337',
+            }), content_type='application/json')
+
+            self.user_tokens.append(response.data.get('token'))
+
+        self.block_producer = BlockProducer.objects.create(
+            id=1,
+            user=user,
+            name='Block producer Canada',
+            website_url='https://bpcanada.com',
+            short_description='Founded by a team of serial tech entrepreneurs in Canada.',
+        )
+
+    def like(self, user_token):
+        """
+        To like or unlike block producer by the user with the token from a separate thread.
+        """
+        try:
+            response = Client().put(
+                f'/block-producers/{self.block_producer.id}/likes/',
+                HTTP_AUTHORIZATION='JWT ' + user_token,
+                content_type='application/json',
+            )
+
+            return response.status_code
+
+        finally:
+            connection.close()
+
+    def test_like_concurrently(self):
+        """
+        Case: to like block producer by many users and many times by the same user concurrently.
+        Expect: no duplicated likes are created and the likes number equals to the number of likes.
+        """
+        same_user_token = self.user_tokens[0]
+        user_tokens = self.user_tokens[1:] + [same_user_token] * 8
+
+        with ThreadPoolExecutor(max_workers=len(user_tokens)) as executor:
+            status_codes = list(executor.map(self.like, user_tokens))
+
+        likes_number = BlockProducerLike.objects.filter(block_producer=self.block_producer).count()
+        same_user_likes_number = BlockProducerLike.objects.filter(
+            block_producer=self.block_producer, user_id=1,
+        ).count()
+
+        assert {HTTPStatus.OK} == set(status_codes)
+        assert same_user_likes_number in (0, 1)
+        assert 7 + same_user_likes_number == likes_number
+        assert likes_number == BlockProducer.objects.get(id=self.block_producer.id).likes_count
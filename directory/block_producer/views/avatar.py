@@ -6,17 +6,16 @@ from http import HTTPStatus
 from django.http import JsonResponse
 from rest_framework.decorators import authentication_classes
 from rest_framework.views import APIView
-from rest_framework_jwt.authentication import JSONWebTokenAuthentication
 
 from block_producer.domain.errors import BlockProducerWithSpecifiedIdentifierDoesNotExistError
 from block_producer.domain.objects import UpdateBlockProducer
 from block_producer.forms import UploadBlockProducerAvatarForm
 from block_producer.models import BlockProducer
+from generic.jwt import StatelessJSONWebTokenAuthentication
 from services.avatar import (
     Avatar,
     AvatarTypes,
 )
-from user.domain.errors import UserWithSpecifiedEmailAddressDoesNotExistError
 from user.models import User
 
 
@@ -32,12 +31,12 @@ class BlockProducerAvatarSingle(APIView):
         self.user = User()
         self.block_producer = BlockProducer()
 
-    @authentication_classes((JSONWebTokenAuthentication, ))
+    @authentication_classes((StatelessJSONWebTokenAuthentication, ))
     def post(self, request, block_producer_id):
         """
         Upload block producer avatar.
         """
-        user_email = request.user.email
+        user_id = request.user.id
 
         form = UploadBlockProducerAvatarForm(request.POST, request.FILES)
 
@@ -51,18 +50,13 @@ class BlockProducerAvatarSingle(APIView):
         avatar.upload(file_object=file_to_upload)
 
         try:
-            UpdateBlockProducer(
-                user=self.user, block_producer=self.block_producer,
-            ).do(
-                user_email=user_email,
+            UpdateBlockProducer(block_producer=self.block_producer).do(
+                user_id=user_id,
                 block_producer_id=block_producer_id,
                 info={'logo_url': avatar.get_url()},
             )
 
-        except (
-            BlockProducerWithSpecifiedIdentifierDoesNotExistError,
-            UserWithSpecifiedEmailAddressDoesNotExistError,
-        ) as error:
+        except BlockProducerWithSpecifiedIdentifierDoesNotExistError as error:
             return JsonResponse({'error': error.message}, status=HTTPStatus.NOT_FOUND)
 
         return JsonResponse({'result': 'Block producer avatar has been uploaded.'}, status=HTTPStatus.OK)
@@ -4,15 +4,24 @@ Provide implementation of single block producer endpoint.
 import json
 from http import HTTPStatus
 
-from django.http import JsonResponse
+from django.http import (
+    HttpResponse,
+    JsonResponse,
+)
+from django.utils.decorators import method_decorator
+from django.views.decorators.http import condition
 from rest_framework import permissions
 from rest_framework.decorators import (
     authentication_classes,
     permission_classes,
 )
 from rest_framework.views import APIView
-from rest_framework_jwt.authentication import JSONWebTokenAuthentication
 
+from block_producer.cache import (
+    DIRECTORY_VERSION_NAME,
+    RESPONSES_CACHE,
+    get_block_producer_version_name,
+)
 from block_producer.domain.errors import (
     BlockProducerDoesNotExistForSpecifiedUsername,
     BlockProducerWithSpecifiedIdentifierDoesNotExistError,
@@ -22,23 +31,53 @@ from block_producer.domain.objects import (
     DeleteBlockProducer,
     GetBlockProducer,
     GetBlockProducers,
+    GetBlockProducersByIdentifiers,
     GetUserLastBlockProducer,
     SearchBlockProducer,
+    SuggestBlockProducers,
     UpdateBlockProducer,
 )
-from block_producer.dto.block_producer import BlockProducerDto
+from block_producer.dto.block_producer import BlockProducerSuggestionDto
 from block_producer.forms import (
+    INCLUDE_COUNTS,
+    INCLUDE_LIKED_BY_ME,
     CreateBlockProducerForm,
+    GetBlockProducersForm,
+    PaginationForm,
+    SuggestBlockProducersForm,
     UpdateBlockProducerForm,
 )
-from block_producer.models import BlockProducer
-from services.telegram import TelegramBot
-from user.domain.errors import (
-    UserHasNoAuthorityToDeleteThisBlockProducerError,
-    UserWithSpecifiedEmailAddressDoesNotExistError,
+from block_producer.models import (
+    BlockProducer,
+    BlockProducersVersion,
 )
+from generic.cache import LRUCache
+from generic.conditional import make_etag
+from generic.jwt import StatelessJSONWebTokenAuthentication
+from generic.pagination import CursorIsInvalidError
+from generic.serialization import serialize
+from generic.streaming import StreamingJsonResponse
+from services.telegram import TelegramBot
+from user.domain.errors import UserHasNoAuthorityToDeleteThisBlockProducerError
 from user.models import User
 
+DEFAULT_SUGGESTIONS_NUMBER = 10
+
+SUGGESTIONS_CACHE = LRUCache(max_size=1024, time_to_live=60)
+
+
+def get_block_producers_etag(request):
+    """
+    Get entity tag of block producers collection for the query of the request.
+
+    Collections with likes and comments numbers or whether the requesting user liked block producers are not
+    versioned, so they have no entity tag.
+    """
+    if request.GET.get('include'):
+        return None
+
+    return make_etag(request.GET.urlencode(), BlockProducersVersion.get())
+
 
 class BlockProducerSingle(APIView):
     """
@@ -51,12 +90,23 @@ class BlockProducerSingle(APIView):
         """
         self.user = User()
         self.block_producer = BlockProducer()
+        self.responses_cache = RESPONSES_CACHE
 
     @permission_classes((permissions.AllowAny, ))
     def get(self, request, block_producer_id):
         """
         Get block producer.
         """
+        cache_key = self.responses_cache.make_key(
+            key=f'block-producer:{block_producer_id}',
+            version_names=(get_block_producer_version_name(identifier=block_producer_id),),
+        )
+
+        content = self.responses_cache.get(cache_key)
+
+        if content is not None:
+            return HttpResponse(content, content_type='application/json', status=HTTPStatus.OK)
+
         try:
             block_producer = GetBlockProducer(
                 block_producer=self.block_producer,
@@ -67,14 +117,17 @@ class BlockProducerSingle(APIView):
 
         serialized_block_producer = block_producer.to_dict()
 
-        return JsonResponse({'result': serialized_block_producer}, status=HTTPStatus.OK)
+        response = JsonResponse({'result': serialized_block_producer}, status=HTTPStatus.OK)
+        self.responses_cache.set(cache_key, response.content)
 
-    @authentication_classes((JSONWebTokenAuthentication, ))
+        return response
+
+    @authentication_classes((StatelessJSONWebTokenAuthentication, ))
     def post(self, request, block_producer_id):
         """
         Update block producer.
         """
-        user_email = request.user.email
+        user_id = request.user.id
 
         form = UpdateBlockProducerForm(request.data)
 
@@ -84,14 +137,11 @@ class BlockProducerSingle(APIView):
         non_empty_request_data = {key: form.cleaned_data[key] for key in request.data}
 
         try:
-            UpdateBlockProducer(
-                user=self.user, block_producer=self.block_producer,
-            ).do(user_email=user_email, block_producer_id=block_producer_id, info=non_empty_request_data)
-
-        except (
-            BlockProducerWithSpecifiedIdentifierDoesNotExistError,
-            UserWithSpecifiedEmailAddressDoesNotExistError,
-        ) as error:
+            UpdateBlockProducer(block_producer=self.block_producer).do(
+                user_id=user_id, block_producer_id=block_producer_id, info=non_empty_request_data,
+            )
+
+        except BlockProducerWithSpecifiedIdentifierDoesNotExistError as error:
             return JsonResponse({'error': error.message}, status=HTTPStatus.NOT_FOUND)
 
         block_producer = self.get(request=None, block_producer_id=block_producer_id)
@@ -111,13 +161,11 @@ class BlockProducerSingle(APIView):
 
         return JsonResponse({'result': 'Block producer has been updated.'}, status=HTTPStatus.OK)
 
-    @authentication_classes((JSONWebTokenAuthentication,))
+    @authentication_classes((StatelessJSONWebTokenAuthentication,))
     def delete(self, request, block_producer_id):
         """
         Delete block producer.
         """
-        user_email = request.user.email
-
         try:
             response = self.get(request=None, block_producer_id=block_producer_id)
 
@@ -138,13 +186,8 @@ class BlockProducerSingle(APIView):
             )
 
         try:
-            DeleteBlockProducer(user=self.user, block_producer=self.block_producer).do(
-                user_email=user_email, block_producer_id=block_producer_id,
-            )
-        except (
-            BlockProducerWithSpecifiedIdentifierDoesNotExistError,
-            UserWithSpecifiedEmailAddressDoesNotExistError,
-        ) as error:
+            DeleteBlockProducer(block_producer=self.block_producer).do(block_producer_id=block_producer_id)
+        except BlockProducerWithSpecifiedIdentifierDoesNotExistError as error:
             return JsonResponse({'error': error.message}, status=HTTPStatus.NOT_FOUND)
 
         return JsonResponse({'result': 'Block producer has been deleted.'}, status=HTTPStatus.OK)
@@ -161,24 +204,95 @@ class BlockProducerCollection(APIView):
         """
         self.user = User()
         self.block_producer = BlockProducer()
+        self.responses_cache = RESPONSES_CACHE
 
+    @method_decorator(condition(etag_func=get_block_producers_etag))
     @permission_classes((permissions.AllowAny,))
     def get(self, request):
         """
         Get block producers.
+
+        Block producers are returned page by page if the limit or the cursor is specified, or keyed by identifiers
+        if they are specified. Likes and comments numbers and whether the requesting user liked block producers
+        are included if requested.
+        All block producers are streamed if requested. Responses without statistics are cached until
+        any block producer is changed, and are not sent again if the entity tag of the client is actual.
         """
-        block_producers = GetBlockProducers(block_producer=self.block_producer).do()
+        form = GetBlockProducersForm(request.GET)
+
+        if not form.is_valid():
+            return JsonResponse({'errors': form.errors}, status=HTTPStatus.BAD_REQUEST)
+
+        limit = form.cleaned_data.get('limit')
+        cursor = form.cleaned_data.get('cursor') or None
+        include = form.cleaned_data.get('include')
+        streamed = form.cleaned_data.get('stream') and limit is None and cursor is None
+
+        with_counts = INCLUDE_COUNTS in include
+        with_is_liked = INCLUDE_LIKED_BY_ME in include
+        user_id = request.user.id if with_is_liked and request.user.is_authenticated else None
+
+        block_producer_ids = form.cleaned_data.get('ids')
+
+        if block_producer_ids:
+            serialized_block_producers, not_found_block_producer_ids = GetBlockProducersByIdentifiers(
+                block_producer=self.block_producer,
+            ).do(
+                block_producer_ids=block_producer_ids,
+                with_counts=with_counts,
+                with_is_liked=with_is_liked,
+                user_id=user_id,
+            )
+
+            return JsonResponse({
+                'result': serialized_block_producers,
+                'not_found': not_found_block_producer_ids,
+            }, status=HTTPStatus.OK)
+
+        cache_key = None
+
+        if not include and not streamed:
+            cache_key = self.responses_cache.make_key(
+                key=f'block-producers:{limit}:{cursor}', version_names=(DIRECTORY_VERSION_NAME,),
+            )
+
+            content = self.responses_cache.get(cache_key)
+
+            if content is not None:
+                return HttpResponse(content, content_type='application/json', status=HTTPStatus.OK)
 
-        serialized_block_producers = json.loads(BlockProducerDto.schema().dumps(block_producers, many=True))
+        try:
+            serialized_block_producers, next_cursor = GetBlockProducers(block_producer=self.block_producer).do(
+                limit=limit,
+                cursor=cursor,
+                with_counts=with_counts,
+                with_is_liked=with_is_liked,
+                user_id=user_id,
+                streamed=streamed,
+            )
 
-        return JsonResponse({'result': serialized_block_producers}, status=HTTPStatus.OK)
+        except CursorIsInvalidError as error:
+            return JsonResponse({'error': error.message}, status=HTTPStatus.BAD_REQUEST)
 
-    @authentication_classes((JSONWebTokenAuthentication, ))
+        if streamed:
+            return StreamingJsonResponse(serialized_block_producers, status=HTTPStatus.OK)
+
+        if limit is None and cursor is None:
+            response = JsonResponse({'result': serialized_block_producers}, status=HTTPStatus.OK)
+        else:
+            response = JsonResponse({'result': serialized_block_producers, 'next': next_cursor}, status=HTTPStatus.OK)
+
+        if cache_key is not None:
+            self.responses_cache.set(cache_key, response.content)
+
+        return response
+
+    @authentication_classes((StatelessJSONWebTokenAuthentication, ))
     def put(self, request):
         """
         Create a block producer.
         """
-        email = request.user.email
+        user_id = request.user.id
         username = request.user.username
 
         form = CreateBlockProducerForm(data=request.data)
@@ -186,13 +300,7 @@ class BlockProducerCollection(APIView):
         if not form.is_valid():
             return JsonResponse({'errors': form.errors}, status=HTTPStatus.BAD_REQUEST)
 
-        try:
-            CreateBlockProducer(user=self.user, block_producer=self.block_producer).do(
-                user_email=email, info=form.cleaned_data,
-            )
-
-        except UserWithSpecifiedEmailAddressDoesNotExistError as error:
-            return JsonResponse({'error': error.message}, status=HTTPStatus.NOT_FOUND)
+        CreateBlockProducer(block_producer=self.block_producer).do(user_id=user_id, info=form.cleaned_data)
 
         try:
             last_block_producer = GetUserLastBlockProducer(block_producer=self.block_producer).do(username=username)
@@ -227,11 +335,65 @@ class BlockProducerSearchCollection(APIView):
     def get(self, request):
         """
         Search by block producers.
+
+        Found block producers are returned page by page if the limit or the cursor is specified.
         """
         phrase = request.GET.get('phrase')
 
-        block_producers = SearchBlockProducer(block_producer=self.block_producer).do(phrase=phrase)
+        form = PaginationForm(request.GET)
+
+        if not form.is_valid():
+            return JsonResponse({'errors': form.errors}, status=HTTPStatus.BAD_REQUEST)
+
+        limit = form.cleaned_data.get('limit')
+        cursor = form.cleaned_data.get('cursor') or None
+
+        try:
+            serialized_block_producers, next_cursor = SearchBlockProducer(block_producer=self.block_producer).do(
+                phrase=phrase, limit=limit, cursor=cursor,
+            )
+
+        except CursorIsInvalidError as error:
+            return JsonResponse({'error': error.message}, status=HTTPStatus.BAD_REQUEST)
+
+        if limit is None and cursor is None:
+            return JsonResponse({'result': serialized_block_producers}, status=HTTPStatus.OK)
+
+        return JsonResponse({'result': serialized_block_producers, 'next': next_cursor}, status=HTTPStatus.OK)
+
+
+class BlockProducerSuggestCollection(APIView):
+    """
+    Collection suggest block producer endpoint implementation.
+    """
+
+    def __init__(self):
+        """
+        Constructor.
+        """
+        self.block_producer = BlockProducer()
+        self.block_producers_version = BlockProducersVersion()
+        self.suggestions_cache = SUGGESTIONS_CACHE
+
+    @permission_classes((permissions.AllowAny,))
+    def get(self, request):
+        """
+        Suggest block producers by prefix of their name or location.
+        """
+        form = SuggestBlockProducersForm(request.GET)
+
+        if not form.is_valid():
+            return JsonResponse({'errors': form.errors}, status=HTTPStatus.BAD_REQUEST)
+
+        prefix = form.cleaned_data.get('prefix')
+        limit = form.cleaned_data.get('limit') or DEFAULT_SUGGESTIONS_NUMBER
+
+        suggestions = SuggestBlockProducers(
+            block_producer=self.block_producer,
+            block_producers_version=self.block_producers_version,
+            cache=self.suggestions_cache,
+        ).do(prefix=prefix, limit=limit)
 
-        serialized_block_producers = json.loads(BlockProducerDto.schema().dumps(block_producers, many=True))
+        serialized_suggestions = serialize(BlockProducerSuggestionDto, suggestions)
 
-        return JsonResponse({'result': serialized_block_producers}, status=HTTPStatus.OK)
+        return JsonResponse({'result': serialized_suggestions}, status=HTTPStatus.OK)
@@ -1,37 +1,49 @@
 """
 Provide implementation of single block producer comment endpoint.
 """
-import json
 from http import HTTPStatus
 
 from django.http import JsonResponse
+from django.utils.decorators import method_decorator
+from django.views.decorators.http import condition
 from rest_framework import permissions
 from rest_framework.decorators import (
     authentication_classes,
     permission_classes,
 )
 from rest_framework.views import APIView
-from rest_framework_jwt.authentication import JSONWebTokenAuthentication
 
 from block_producer.domain.errors import BlockProducerWithSpecifiedIdentifierDoesNotExistError
 from block_producer.domain.objects import (
     CommentBlockProducer,
     GetBlockProducerComments,
     GetBlockProducerCommentsNumber,
+    GetBlockProducerCommentsPage,
 )
-from block_producer.forms import CommentBlockProducerForm
-from block_producer.dto.comment import (
-    BlockProducerCommentDto,
-    BlockProducerCommentNumberDto,
+from block_producer.forms import (
+    CommentBlockProducerForm,
+    GetBlockProducerCommentsForm,
 )
+from block_producer.dto.comment import BlockProducerCommentNumberDto
 from block_producer.models import (
     BlockProducer,
     BlockProducerComment,
 )
-from user.domain.errors import UserWithSpecifiedEmailAddressDoesNotExistError
+from generic.conditional import make_etag
+from generic.jwt import StatelessJSONWebTokenAuthentication
+from generic.pagination import CursorIsInvalidError
+from generic.serialization import serialize
+from generic.streaming import StreamingJsonResponse
 from user.models import User
 
 
+def get_block_producer_comments_number_etag(request):
+    """
+    Get entity tag of block producers' comments number.
+    """
+    return make_etag(BlockProducerComment.get_version())
+
+
 class BlockProducerCommentCollection(APIView):
     """
     Collection block producer comment endpoint implementation.
@@ -45,12 +57,12 @@ class BlockProducerCommentCollection(APIView):
         self.block_producer = BlockProducer()
         self.block_producer_comment = BlockProducerComment()
 
-    @authentication_classes((JSONWebTokenAuthentication, ))
+    @authentication_classes((StatelessJSONWebTokenAuthentication, ))
     def put(self, request, block_producer_id):
         """
         To comment the block producer.
         """
-        email = request.user.email
+        user_id = request.user.id
         text = request.data.get('text')
 
         form = CommentBlockProducerForm({
@@ -62,14 +74,11 @@ class BlockProducerCommentCollection(APIView):
 
         try:
             CommentBlockProducer(
-                user=self.user, block_producer=self.block_producer, block_producer_comment=self.block_producer_comment,
+                block_producer=self.block_producer, block_producer_comment=self.block_producer_comment,
             ).do(
-                user_email=email, block_producer_id=block_producer_id, text=text,
+                user_id=user_id, block_producer_id=block_producer_id, text=text,
             )
-        except (
-            BlockProducerWithSpecifiedIdentifierDoesNotExistError,
-            UserWithSpecifiedEmailAddressDoesNotExistError,
-        ) as error:
+        except BlockProducerWithSpecifiedIdentifierDoesNotExistError as error:
             return JsonResponse({'error': error.message}, status=HTTPStatus.NOT_FOUND)
 
         return JsonResponse({'result': 'Block producer has been commented.'}, status=HTTPStatus.OK)
@@ -78,15 +87,50 @@ class BlockProducerCommentCollection(APIView):
     def get(self, request, block_producer_id):
         """
         Get block producer's comments.
+
+        All comments are returned or streamed if neither the limit nor the cursor is specified, otherwise the page
+        of comments is returned with the cursor of the next page and the total number of comments.
         """
-        block_producer_comments = GetBlockProducerComments(
-            block_producer=self.block_producer,
-            block_producer_comment=self.block_producer_comment,
-        ).do(block_producer_id=block_producer_id)
+        form = GetBlockProducerCommentsForm(request.GET)
 
-        serialized_block_producer_comments = json.loads(
-            BlockProducerCommentDto.schema().dumps(block_producer_comments, many=True),
-        )
+        if not form.is_valid():
+            return JsonResponse({'errors': form.errors}, status=HTTPStatus.BAD_REQUEST)
+
+        limit = form.cleaned_data.get('limit')
+        cursor = form.cleaned_data.get('cursor') or None
+
+        if limit is not None or cursor is not None:
+            try:
+                serialized_block_producer_comments, next_cursor, comments_number = GetBlockProducerCommentsPage(
+                    block_producer=self.block_producer,
+                    block_producer_comment=self.block_producer_comment,
+                ).do(block_producer_id=block_producer_id, limit=limit, cursor=cursor)
+
+            except BlockProducerWithSpecifiedIdentifierDoesNotExistError as error:
+                return JsonResponse({'error': error.message}, status=HTTPStatus.NOT_FOUND)
+
+            except CursorIsInvalidError as error:
+                return JsonResponse({'error': error.message}, status=HTTPStatus.BAD_REQUEST)
+
+            return JsonResponse({
+                'result': serialized_block_producer_comments,
+                'next': next_cursor,
+                'total': comments_number,
+            }, status=HTTPStatus.OK)
+
+        streamed = form.cleaned_data.get('stream')
+
+        try:
+            serialized_block_producer_comments = GetBlockProducerComments(
+                block_producer=self.block_producer,
+                block_producer_comment=self.block_producer_comment,
+            ).do(block_producer_id=block_producer_id, streamed=streamed)
+
+        except BlockProducerWithSpecifiedIdentifierDoesNotExistError as error:
+            return JsonResponse({'error': error.message}, status=HTTPStatus.NOT_FOUND)
+
+        if streamed:
+            return StreamingJsonResponse(serialized_block_producer_comments, status=HTTPStatus.OK)
 
         return JsonResponse({'result': serialized_block_producer_comments}, status=HTTPStatus.OK)
 
@@ -104,6 +148,7 @@ class BlockProducerCommentNumberCollection(APIView):
         self.block_producer = BlockProducer()
         self.block_producer_comment = BlockProducerComment()
 
+    @method_decorator(condition(etag_func=get_block_producer_comments_number_etag))
     @permission_classes((permissions.AllowAny,))
     def get(self, request):
         """
@@ -114,8 +159,8 @@ class BlockProducerCommentNumberCollection(APIView):
             block_producer_comment=self.block_producer_comment,
         ).do()
 
-        serialized_block_producer_comments_number = json.loads(
-            BlockProducerCommentNumberDto.schema().dumps(block_producer_comments_number, many=True),
+        serialized_block_producer_comments_number = serialize(
+            BlockProducerCommentNumberDto, block_producer_comments_number,
         )
 
         return JsonResponse({'result': serialized_block_producer_comments_number}, status=HTTPStatus.OK)
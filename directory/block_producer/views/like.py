@@ -1,17 +1,17 @@
 """
 Provide implementation of collection block producer like endpoint.
 """
-import json
 from http import HTTPStatus
 
 from django.http import JsonResponse
+from django.utils.decorators import method_decorator
+from django.views.decorators.http import condition
 from rest_framework import permissions
 from rest_framework.decorators import (
     authentication_classes,
     permission_classes,
 )
 from rest_framework.views import APIView
-from rest_framework_jwt.authentication import JSONWebTokenAuthentication
 
 from block_producer.domain.errors import BlockProducerWithSpecifiedIdentifierDoesNotExistError
 from block_producer.domain.objects import (
@@ -19,18 +19,26 @@ from block_producer.domain.objects import (
     GetBlockProducerLikesNumber,
     LikeBlockProducer,
 )
-from block_producer.dto.like import (
-    BlockProducerLikeDto,
-    BlockProducerLikeNumberDto,
-)
+from block_producer.dto.like import BlockProducerLikeNumberDto
+from block_producer.forms import GetBlockProducerLikesForm
 from block_producer.models import (
     BlockProducer,
     BlockProducerLike,
 )
-from user.domain.errors import UserWithSpecifiedEmailAddressDoesNotExistError
+from generic.conditional import make_etag
+from generic.jwt import StatelessJSONWebTokenAuthentication
+from generic.serialization import serialize
+from generic.streaming import StreamingJsonResponse
 from user.models import User
 
 
+def get_block_producer_likes_number_etag(request):
+    """
+    Get entity tag of block producers' likes number.
+    """
+    return make_etag(BlockProducerLike.get_version())
+
+
 class BlockProducerLikeCollection(APIView):
     """
     Collection block producer likes endpoint implementation.
@@ -47,36 +55,47 @@ class BlockProducerLikeCollection(APIView):
     @permission_classes((permissions.AllowAny, ))
     def get(self, request, block_producer_id):
         """
-        Get block producer's likes.
+        Get block producer's likes, the newest first.
+
+        Only the limited number of the newest likes is returned if the limit is specified, otherwise all likes are
+        returned or streamed if requested.
         """
-        block_producer_likes = GetBlockProducerLikes(
-            block_producer=self.block_producer, block_producer_like=self.block_producer_like,
-        ).do(block_producer_id=block_producer_id)
+        form = GetBlockProducerLikesForm(request.GET)
+
+        if not form.is_valid():
+            return JsonResponse({'errors': form.errors}, status=HTTPStatus.BAD_REQUEST)
+
+        limit = form.cleaned_data.get('limit')
+        streamed = form.cleaned_data.get('stream') and limit is None
+
+        try:
+            serialized_block_producer_likes = GetBlockProducerLikes(
+                block_producer=self.block_producer, block_producer_like=self.block_producer_like,
+            ).do(block_producer_id=block_producer_id, limit=limit, streamed=streamed)
+
+        except BlockProducerWithSpecifiedIdentifierDoesNotExistError as error:
+            return JsonResponse({'error': error.message}, status=HTTPStatus.NOT_FOUND)
 
-        serialized_block_producer_likes = json.loads(
-            BlockProducerLikeDto.schema().dumps(block_producer_likes, many=True),
-        )
+        if streamed:
+            return StreamingJsonResponse(serialized_block_producer_likes, status=HTTPStatus.OK)
 
         return JsonResponse({'result': serialized_block_producer_likes}, status=HTTPStatus.OK)
 
-    @authentication_classes((JSONWebTokenAuthentication, ))
+    @authentication_classes((StatelessJSONWebTokenAuthentication, ))
     def put(self, request, block_producer_id):
         """
-        To like the block producer.
+        To like the block producer, or to unlike it if it is already liked.
         """
-        email = request.user.email
+        user_id = request.user.id
 
         try:
-            LikeBlockProducer(
-                user=self.user, block_producer=self.block_producer, block_producer_like=self.block_producer_like,
-            ).do(user_email=email, block_producer_id=block_producer_id)
-        except (
-            BlockProducerWithSpecifiedIdentifierDoesNotExistError,
-            UserWithSpecifiedEmailAddressDoesNotExistError,
-        ) as error:
+            like_state = LikeBlockProducer(block_producer_like=self.block_producer_like).do(
+                user_id=user_id, block_producer_id=block_producer_id,
+            )
+        except BlockProducerWithSpecifiedIdentifierDoesNotExistError as error:
             return JsonResponse({'error': error.message}, status=HTTPStatus.NOT_FOUND)
 
-        return JsonResponse({'result': 'Block producer liking has been handled.'}, status=HTTPStatus.OK)
+        return JsonResponse({'result': like_state.to_dict()}, status=HTTPStatus.OK)
 
 
 class BlockProducerLikeNumberCollection(APIView):
@@ -92,6 +111,7 @@ class BlockProducerLikeNumberCollection(APIView):
         self.block_producer = BlockProducer()
         self.block_producer_like = BlockProducerLike()
 
+    @method_decorator(condition(etag_func=get_block_producer_likes_number_etag))
     @permission_classes((permissions.AllowAny, ))
     def get(self, request):
         """
@@ -102,8 +122,6 @@ class BlockProducerLikeNumberCollection(APIView):
             block_producer_like=self.block_producer_like,
         ).do()
 
-        serialized_block_producer_likes_number = json.loads(
-            BlockProducerLikeNumberDto.schema().dumps(block_producer_likes_number, many=True),
-        )
+        serialized_block_producer_likes_number = serialize(BlockProducerLikeNumberDto, block_producer_likes_number)
 
         return JsonResponse({'result': serialized_block_producer_likes_number}, status=HTTPStatus.OK)
@@ -0,0 +1,172 @@
+"""
+Provide implementation of endpoints budgets of database queries.
+
+Every endpoint is declared with the number of database queries a single request to it may make. Endpoints are
+requested through the test client, so middleware, authentication and serialization are measured too. Measurements
+are reported as JSON with wall time of requests to track the drift between releases.
+"""
+import json
+import re
+import time
+from dataclasses import (
+    asdict,
+    dataclass,
+    field,
+)
+
+from django.db import connection
+from django.test.utils import CaptureQueriesContext
+from django.urls import (
+    URLPattern,
+    URLResolver,
+)
+
+ROUTE_PARAMETER_PATTERN = re.compile(r'<(?:\w+:)?(\w+)>')
+
+VIEW_METHODS = ('get', 'post', 'put', 'patch', 'delete')
+
+
+@dataclass(frozen=True)
+class EndpointBudget:
+    """
+    Budget of a single request to an endpoint.
+
+    The route is the pattern the endpoint is declared with, its parameters are substituted to build the path.
+    Data is sent as JSON unless it is multipart.
+    """
+
+    method: str
+    route: str
+    queries: int
+    parameters: dict = field(default_factory=dict)
+    query: str = ''
+    data: dict = None
+    multipart: bool = False
+    headers: dict = field(default_factory=dict)
+
+    @property
+    def path(self):
+        """
+        Get path of the request with route parameters substituted.
+        """
+        path = ROUTE_PARAMETER_PATTERN.sub(lambda match: str(self.parameters[match.group(1)]), self.route)
+        return f'/{path}?{self.query}' if self.query else f'/{path}'
+
+
+@dataclass(frozen=True)
+class EndpointMeasurement:
+    """
+    Measurement of a single request to an endpoint against its budget.
+    """
+
+    method: str
+    route: str
+    path: str
+    status_code: int
+    queries: int
+    queries_budget: int
+    milliseconds: float
+
+    @property
+    def is_within_budget(self):
+        """
+        Check if the number of queries does not exceed the budget.
+        """
+        return self.queries <= self.queries_budget
+
+
+def get_endpoints(urlpatterns, prefix='', excluded_prefixes=()):
+    """
+    Get methods and routes of endpoints served by class-based views of URL patterns, nested patterns included.
+    """
+    endpoints = []
+
+    for pattern in urlpatterns:
+        route = prefix + str(pattern.pattern)
+
+        if route.startswith(excluded_prefixes):
+            continue
+
+        if isinstance(pattern, URLResolver):
+            endpoints += get_endpoints(pattern.url_patterns, prefix=route, excluded_prefixes=excluded_prefixes)
+            continue
+
+        if not isinstance(pattern, URLPattern):
+            continue
+
+        view_class = getattr(pattern.callback, 'view_class', None) or getattr(pattern.callback, 'cls', None)
+
+        if view_class is None:
+            continue
+
+        endpoints += [(method.upper(), route) for method in VIEW_METHODS if hasattr(view_class, method)]
+
+    return endpoints
+
+
+def request_endpoint(client, method, path, data=None, multipart=False, headers=None):
+    """
+    Request the endpoint and measure the number of database queries and the wall time in milliseconds.
+
+    Streamed responses are consumed, so queries made while streaming are counted as well. Returns the response,
+    the number of queries and the wall time.
+    """
+    request = getattr(client, method.lower())
+
+    kwargs = dict(headers or {})
+
+    if data is not None and multipart:
+        kwargs['data'] = data
+
+    elif data is not None:
+        kwargs.update(data=json.dumps(data), content_type='application/json')
+
+    with CaptureQueriesContext(connection) as context:
+        started_at = time.perf_counter()
+
+        response = request(path, **kwargs)
+
+        if response.streaming:
+            b''.join(response.streaming_content)
+
+        milliseconds = (time.perf_counter() - started_at) * 1000
+
+    return response, len(context.captured_queries), milliseconds
+
+
+def measure(client, budget):
+    """
+    Request the endpoint of the budget and measure it against the budget.
+    """
+    response, queries, milliseconds = request_endpoint(
+        client=client,
+        method=budget.method,
+        path=budget.path,
+        data=budget.data,
+        multipart=budget.multipart,
+        headers=budget.headers,
+    )
+
+    return EndpointMeasurement(
+        method=budget.method,
+        route=budget.route,
+        path=budget.path,
+        status_code=response.status_code,
+        queries=queries,
+        queries_budget=budget.queries,
+        milliseconds=round(milliseconds, 3),
+    )
+
+
+def write_report(measurements, path):
+    """
+    Write measurements to the file by the path as JSON report.
+    """
+    report = {
+        'endpoints': [
+            {**asdict(measurement), 'is_within_budget': measurement.is_within_budget} for measurement in measurements
+        ],
+    }
+
+    with open(path, 'w') as file:
+        json.dump(report, file, indent=4)
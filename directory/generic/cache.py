@@ -0,0 +1,144 @@
+"""
+Provide implementation of caches.
+"""
+import threading
+import time
+from collections import OrderedDict
+
+
+class LRUCache:
+    """
+    Thread-safe least recently used cache with expiration of entries.
+
+    It lives in the memory of a single process, so it is suitable only for data that may be stale for the time to live.
+    """
+
+    def __init__(self, max_size, time_to_live):
+        """
+        Constructor.
+        """
+        self.max_size = max_size
+        self.time_to_live = time_to_live
+
+        self._entries = OrderedDict()
+        self._lock = threading.Lock()
+
+    def get(self, key):
+        """
+        Get value by key, None is returned if there is no value or it is expired.
+        """
+        with self._lock:
+            entry = self._entries.get(key)
+
+            if entry is None:
+                return None
+
+            value, expires_at = entry
+
+            if expires_at <= time.monotonic():
+                del self._entries[key]
+                return None
+
+            self._entries.move_to_end(key)
+            return value
+
+    def set(self, key, value):
+        """
+        Set value by key, the least recently used entry is evicted if the cache is full.
+        """
+        with self._lock:
+            self._entries[key] = (value, time.monotonic() + self.time_to_live)
+            self._entries.move_to_end(key)
+
+            if len(self._entries) > self.max_size:
+                self._entries.popitem(last=False)
+
+    def delete(self, key):
+        """
+        Remove entry by key if it exists.
+        """
+        with self._lock:
+            self._entries.pop(key, None)
+
+    def clear(self):
+        """
+        Remove all entries.
+        """
+        with self._lock:
+            self._entries.clear()
+
+
+class VersionedCache:
+    """
+    Cache of values stored under keys with versions, so bumping a version invalidates all values stored with it.
+
+    Versions are stored in the same cache backend as values, so the cache is shared by processes if the backend is.
+    """
+
+    def __init__(self, cache, time_to_live):
+        """
+        Constructor.
+        """
+        self.cache = cache
+        self.time_to_live = time_to_live
+
+    @staticmethod
+    def _get_version_key(version_name):
+        """
+        Get key the version is stored under.
+        """
+        return f'version:{version_name}'
+
+    @staticmethod
+    def _get_initial_version():
+        """
+        Get version for names without stored versions.
+
+        Versions start from the current time, so values stored with versions of names which versions are evicted
+        are not got again.
+        """
+        return int(time.time() * 1000)
+
+    def make_key(self, key, version_names):
+        """
+        Make key of the value with current versions of specified names.
+        """
+        version_keys = [self._get_version_key(version_name) for version_name in version_names]
+        versions = self.cache.get_many(version_keys)
+
+        for version_key in version_keys:
+            if version_key in versions:
+                continue
+
+            initial_version = self._get_initial_version()
+
+            if self.cache.add(version_key, initial_version, timeout=None):
+                versions[version_key] = initial_version
+            else:
+                versions[version_key] = self.cache.get(version_key)
+
+        return ':'.join([key] + [str(versions[version_key]) for version_key in version_keys])
+
+    def get(self, versioned_key):
+        """
+        Get value by the key made with versions, None is returned if there is no value.
+        """
+        return self.cache.get(versioned_key)
+
+    def set(self, versioned_key, value):
+        """
+        Set value by the key made with versions.
+        """
+        self.cache.set(versioned_key, value, self.time_to_live)
+
+    def bump(self, *version_names):
+        """
+        Bump versions of specified names, values stored with previous versions are not got anymore.
+        """
+        for version_name in version_names:
+            version_key = self._get_version_key(version_name)
+
+            try:
+                self.cache.incr(version_key)
+            except ValueError:
+                self.cache.set(version_key, self._get_initial_version(), timeout=None)
@@ -0,0 +1,11 @@
+"""
+Provide implementation of HTTP conditional requests helpers.
+"""
+import hashlib
+
+
+def make_etag(*version_parts):
+    """
+    Make strong entity tag of a resource from parts of its version.
+    """
+    return hashlib.sha1(':'.join(str(part) for part in version_parts).encode()).hexdigest()
@@ -1,26 +1,53 @@
 """
-Provide implementation of custom JWT serializers.
+Provide implementation of custom JWT serializers and authentication.
 
 References:
     - https://stackoverflow.com/questions/34332074/django-rest-jwt-login-using-username-or-email/46191939#46191939
 """
-from django.contrib.auth import (
-    authenticate,
-    get_user_model,
-)
+from django.contrib.auth import get_user_model
+from django.db.models import Q
 from django.utils.translation import ugettext as _
-from rest_framework import serializers
-from rest_framework_jwt.serializers import JSONWebTokenSerializer
+from rest_framework import (
+    exceptions,
+    serializers,
+)
+from rest_framework_jwt.authentication import JSONWebTokenAuthentication
+from rest_framework_jwt.serializers import (
+    JSONWebTokenSerializer,
+    RefreshJSONWebTokenSerializer,
+    VerifyJSONWebTokenSerializer,
+)
 from rest_framework_jwt.settings import api_settings
 
+from generic.cache import LRUCache
+from generic.jwt_payload import TOKEN_VERSION_CLAIM
+
 User = get_user_model()
 
+# Revoked tokens may be accepted for the time to live by processes which cached the previous token version.
+TOKEN_VERSIONS_CACHE = LRUCache(max_size=10000, time_to_live=30)
+
 jwt_payload_handler = api_settings.JWT_PAYLOAD_HANDLER
 jwt_encode_handler = api_settings.JWT_ENCODE_HANDLER
 jwt_decode_handler = api_settings.JWT_DECODE_HANDLER
 jwt_get_username_from_payload = api_settings.JWT_PAYLOAD_GET_USERNAME_HANDLER
 
 
+def get_user_by_username_or_email(username_or_email):
+    """
+    Get user by e-mail address or username with a single query, None if there is no such user.
+
+    The user with the e-mail address is preferred if another user has the same username.
+    """
+    users = User.objects.filter(Q(email=username_or_email) | Q(username=username_or_email))[:2]
+
+    for user in users:
+        if user.email == username_or_email:
+            return user
+
+    return users[0] if users else None
+
+
 class CustomJWTSerializer(JSONWebTokenSerializer):
     """
     Obtain token with e-mail address or username implementation.
@@ -34,12 +61,10 @@ class CustomJWTSerializer(JSONWebTokenSerializer):
         """
         Validate incoming requests.
         """
+        username_or_email = attrs.get('username_or_email')
         password = attrs.get('password')
 
-        get_user_by_email = User.objects.filter(email=attrs.get('username_or_email')).first()
-        get_user_by_username = User.objects.filter(username=attrs.get('username_or_email')).first()
-
-        user = get_user_by_email or get_user_by_username
+        user = get_user_by_username_or_email(username_or_email=username_or_email)
 
         if user is None:
             msg = _('Account with this email/username does not exists.')
@@ -49,29 +74,141 @@ class CustomJWTSerializer(JSONWebTokenSerializer):
             msg = _('User must confirm registration by email in order to log in.')
             raise serializers.ValidationError(msg)
 
-        credentials = {
-            'username': user.username,
-            'password': password,
-        }
-
-        if not all(credentials.values()):
+        if not password:
             msg = _('Must include "{username_field}" and "password".')
             msg = msg.format(username_field=self.username_field)
             raise serializers.ValidationError(msg)
 
-        user = authenticate(**credentials)
-
-        if not user:
+        if not user.is_active or not user.check_password(password):
             msg = _('Unable to log in with provided credentials.')
             raise serializers.ValidationError(msg)
 
-        if not user.is_active:
-            msg = _('User account is disabled.')
-            raise serializers.ValidationError(msg)
-
         payload = jwt_payload_handler(user)
 
         return {
             'token': jwt_encode_handler(payload),
             'user': user,
         }
+
+
+def get_token_version(user_id):
+    """
+    Get the current token version of the active user by identifier, None if there is no such user.
+
+    Tokens of missing users are revoked, as their versions are None. Versions of deleted users are removed from
+    the cache by the deletion, so only other processes may accept their tokens for the time to live.
+    """
+    token_version = TOKEN_VERSIONS_CACHE.get(user_id)
+
+    if token_version is None:
+        token_version = User.objects.filter(
+            id=user_id, is_active=True,
+        ).values_list('token_version', flat=True).first()
+
+        if token_version is not None:
+            TOKEN_VERSIONS_CACHE.set(user_id, token_version)
+
+    return token_version
+
+
+def is_token_version_actual(payload):
+    """
+    Check if the token with the payload has not been revoked.
+
+    Tokens issued before the versions were introduced are treated as tokens of the initial version.
+    """
+    token_version = get_token_version(user_id=payload.get('user_id'))
+    return token_version is not None and token_version == payload.get(TOKEN_VERSION_CLAIM, 0)
+
+
+class TokenUser:
+    """
+    Authenticated user built from the claims of the token.
+
+    The user is loaded from the database only if an attribute that is not claimed is accessed.
+    """
+
+    is_active = True
+    is_anonymous = False
+    is_authenticated = True
+
+    def __init__(self, payload):
+        """
+        Constructor.
+        """
+        self.id = payload.get('user_id')
+        self.pk = self.id
+        self.username = payload.get('username')
+        self.email = payload.get('email')
+
+        self._user = None
+
+    def __getattr__(self, name):
+        """
+        Get attribute which is not claimed from the user loaded from the database.
+        """
+        if name.startswith('_'):
+            raise AttributeError(name)
+
+        if self._user is None:
+            try:
+                self._user = User.objects.get(id=self.id)
+            except User.DoesNotExist:
+                raise exceptions.AuthenticationFailed(_('User of the token does not exist.'))
+
+        return getattr(self._user, name)
+
+    def __str__(self):
+        """
+        Get string representation of an object.
+        """
+        return self.username
+
+
+class StatelessJSONWebTokenAuthentication(JSONWebTokenAuthentication):
+    """
+    JSON Web Token authentication without loading the user from the database on every request.
+
+    Only the token version of the user is checked, it is cached in the memory of the process.
+    """
+
+    def authenticate_credentials(self, payload):
+        """
+        Get the user from the claims of the token.
+        """
+        if not payload.get('user_id') or not jwt_get_username_from_payload(payload):
+            raise exceptions.AuthenticationFailed(_('Invalid payload.'))
+
+        if not is_token_version_actual(payload):
+            raise exceptions.AuthenticationFailed(_('Token has been revoked.'))
+
+        return TokenUser(payload)
+
+
+class TokenVersionSerializerMixin:
+    """
+    Reject revoked tokens on verification and refreshing implementation.
+    """
+
+    def _check_user(self, payload):
+        """
+        Get the user of the token if the token has not been revoked.
+        """
+        user = super()._check_user(payload)
+
+        if user.token_version != payload.get(TOKEN_VERSION_CLAIM, 0):
+            raise serializers.ValidationError(_('Token has been revoked.'))
+
+        return user
+
+
+class CustomVerifyJWTSerializer(TokenVersionSerializerMixin, VerifyJSONWebTokenSerializer):
+    """
+    Verify token implementation.
+    """
+
+
+class CustomRefreshJWTSerializer(TokenVersionSerializerMixin, RefreshJSONWebTokenSerializer):
+    """
+    Refresh token implementation.
+    """
@@ -0,0 +1,19 @@
+"""
+Provide implementation of custom JWT payload.
+
+It is kept apart from the custom JWT serializers and authentication, because the JWT library imports
+the payload handler specified in the settings while its serializers are being imported.
+"""
+from rest_framework_jwt.utils import jwt_payload_handler as default_jwt_payload_handler
+
+TOKEN_VERSION_CLAIM = 'token_version'
+
+
+def jwt_payload_handler(user):
+    """
+    Get token payload of the user with the version of the token.
+    """
+    payload = default_jwt_payload_handler(user)
+    payload[TOKEN_VERSION_CLAIM] = user.token_version
+
+    return payload
@@ -0,0 +1,66 @@
+"""
+Provide implementation of keyset (cursor) pagination.
+"""
+import base64
+import binascii
+import json
+from datetime import datetime
+
+from django.db.models import Q
+
+DEFAULT_PAGE_SIZE = 20
+MAX_PAGE_SIZE = 100
+
+
+class CursorIsInvalidError(Exception):
+    """
+    Specified cursor is invalid error.
+    """
+
+    def __init__(self):
+        """
+        Constructor.
+        """
+        self.message = 'Specified cursor is invalid.'
+
+
+def encode_cursor(*values):
+    """
+    Encode values of the last fetched row to the opaque cursor.
+    """
+    serializable_values = [value.isoformat() if isinstance(value, datetime) else value for value in values]
+    return base64.urlsafe_b64encode(json.dumps(serializable_values).encode()).decode()
+
+
+def decode_cursor(cursor, parsers):
+    """
+    Decode the opaque cursor to values of the last fetched row.
+
+    Every value is converted with the corresponding parser, the cursor is invalid if any parser fails.
+    """
+    try:
+        values = json.loads(base64.urlsafe_b64decode(cursor.encode()))
+        decoded_values = [parser(value) for parser, value in zip(parsers, values)]
+
+    except (binascii.Error, TypeError, ValueError):
+        raise CursorIsInvalidError
+
+    if len(values) != len(parsers) or None in decoded_values:
+        raise CursorIsInvalidError
+
+    return decoded_values
+
+
+def get_descending_keyset_filter(fields, values):
+    """
+    Get filter of rows going after specified values in descending order by specified fields.
+
+    For fields (a, b) and values (x, y) it is `a < x OR (a = x AND b < y)`.
+    """
+    keyset_filter = Q()
+
+    for index, field in enumerate(fields):
+        equal_values = dict(zip(fields[:index], values[:index]))
+        keyset_filter |= Q(**equal_values, **{f'{field}__lt': values[index]})
+
+    return keyset_filter
@@ -0,0 +1,178 @@
+"""
+Provide implementation of data transfer objects serialization.
+
+Data transfer objects are converted to JSON-compatible dictionaries by converters compiled once per data transfer
+object class, so responses are encoded to JSON by a single pass without building marshmallow schemas per request.
+Values are converted the same way as by the encoder of `dataclasses_json`.
+
+Read-only collections can skip data transfer objects at all, projections build the same dictionaries from query set
+rows fetched as tuples.
+"""
+import dataclasses
+import datetime
+import typing
+from decimal import Decimal
+from enum import Enum
+from functools import lru_cache
+from uuid import UUID
+
+NONE_TYPE = type(None)
+
+PRIMITIVE_TYPES = (str, int, float, bool)
+
+
+def convert_value(value):
+    """
+    Convert a value of a type which is unknown beforehand to a JSON-compatible value.
+    """
+    if value is None or isinstance(value, PRIMITIVE_TYPES):
+        return value
+
+    if isinstance(value, datetime.datetime):
+        return value.timestamp()
+
+    if isinstance(value, (Decimal, UUID)):
+        return str(value)
+
+    if isinstance(value, Enum):
+        return value.value
+
+    if dataclasses.is_dataclass(value):
+        return get_converter(type(value))(value)
+
+    if isinstance(value, dict):
+        return {key: convert_value(item) for key, item in value.items()}
+
+    if isinstance(value, (list, tuple, set, frozenset)):
+        return [convert_value(item) for item in value]
+
+    return value
+
+
+def get_field_converter(field_type):
+    """
+    Get converter of a value of a field by its type, None if the value does not need to be converted.
+    """
+    if field_type in PRIMITIVE_TYPES:
+        return None
+
+    if getattr(field_type, '__origin__', None) is typing.Union:
+        not_none_types = [type_ for type_ in field_type.__args__ if type_ is not NONE_TYPE]
+
+        if len(not_none_types) == 1:
+            converter = get_field_converter(not_none_types[0])
+
+            if converter is None:
+                return None
+
+            return lambda value: None if value is None else converter(value)
+
+    if dataclasses.is_dataclass(field_type):
+        converter = get_converter(field_type)
+        return lambda value: None if value is None else converter(value)
+
+    return convert_value
+
+
+@lru_cache(maxsize=None)
+def get_converter(dto_class, exclude=()):
+    """
+    Get converter of data transfer objects of the class to dictionaries without the excluded fields.
+    """
+    type_hints = typing.get_type_hints(dto_class)
+
+    fields = [
+        (field.name, get_field_converter(type_hints[field.name]))
+        for field in dataclasses.fields(dto_class) if field.name not in exclude
+    ]
+
+    def convert(dto):
+        result = {}
+
+        for name, converter in fields:
+            value = getattr(dto, name)
+            result[name] = value if converter is None else converter(value)
+
+        return result
+
+    return convert
+
+
+def serialize(dto_class, dtos, exclude=()):
+    """
+    Serialize data transfer objects of the class to the list of JSON-compatible dictionaries.
+    """
+    convert = get_converter(dto_class, tuple(sorted(exclude)))
+    return [convert(dto) for dto in dtos]
+
+
+@lru_cache(maxsize=None)
+def get_schema(dto_class):
+    """
+    Get marshmallow schema of data transfer objects of the class, built once per class.
+    """
+    return dto_class.schema()
+
+
+class Projection:
+    """
+    Projection of query set rows to JSON-compatible dictionaries shaped as serialized data transfer objects.
+
+    Rows are fetched as tuples of the lookups of the projection, so no data transfer objects are created. Fields of
+    nested data transfer objects are looked up by the name of the field as the prefix, other lookups can be declared
+    for fields stored under different names.
+    """
+
+    def __init__(self, dto_class, exclude=(), lookups=None, prefix=''):
+        """
+        Constructor.
+        """
+        lookups = lookups or {}
+        type_hints = typing.get_type_hints(dto_class)
+
+        self.lookups = ()
+        self.fields = []
+
+        for field in dataclasses.fields(dto_class):
+            if field.name in exclude:
+                continue
+
+            field_type = type_hints[field.name]
+
+            if dataclasses.is_dataclass(field_type):
+                nested_projection = Projection(field_type, prefix=f'{prefix}{field.name}__')
+                self.fields.append((field.name, len(self.lookups), None, nested_projection))
+                self.lookups += nested_projection.lookups
+                continue
+
+            self.fields.append((field.name, len(self.lookups), get_field_converter(field_type), None))
+            self.lookups += (lookups.get(field.name, f'{prefix}{field.name}'),)
+
+    def project_row(self, row, offset=0):
+        """
+        Project a row, which columns of the projection start from the offset, to a dictionary.
+        """
+        result = {}
+
+        for name, index, converter, nested_projection in self.fields:
+            if nested_projection is not None:
+                result[name] = nested_projection.project_row(row, offset=offset + index)
+                continue
+
+            value = row[offset + index]
+            result[name] = value if converter is None else converter(value)
+
+        return result
+
+    def project(self, rows):
+        """
+        Project rows to the list of dictionaries.
+        """
+        return [self.project_row(row) for row in rows]
+
+    def iterate(self, rows):
+        """
+        Project rows to dictionaries one by one while the rows are being iterated.
+        """
+        for row in rows:
+            yield self.project_row(row)
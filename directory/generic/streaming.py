@@ -0,0 +1,51 @@
+"""
+Provide implementation of streaming JSON responses.
+"""
+from django.core.serializers.json import DjangoJSONEncoder
+from django.http import StreamingHttpResponse
+
+STREAMING_CHUNK_SIZE = 500
+
+
+def stream_result(items, encoder=DjangoJSONEncoder, chunk_size=STREAMING_CHUNK_SIZE):
+    """
+    Encode items to the result envelope by chunks of the specified number of items.
+
+    The envelope is encoded the same way as by the JSON response, so the streamed body is identical to the body
+    of the JSON response with the same result.
+    """
+    json_encoder = encoder()
+
+    chunk = [b'{"result": [']
+    chunk_items_number = 0
+    separator = b''
+
+    for item in items:
+        chunk.append(separator + json_encoder.encode(item).encode())
+        separator = b', '
+        chunk_items_number += 1
+
+        if chunk_items_number == chunk_size:
+            yield b''.join(chunk)
+
+            chunk = []
+            chunk_items_number = 0
+
+    chunk.append(b']}')
+
+    yield b''.join(chunk)
+
+
+class StreamingJsonResponse(StreamingHttpResponse):
+    """
+    JSON response which result is encoded while items are being iterated.
+
+    Items are not held in the memory together, so the first chunk is sent before the last item is fetched.
+    """
+
+    def __init__(self, items, encoder=DjangoJSONEncoder, **kwargs):
+        """
+        Constructor.
+        """
+        kwargs.setdefault('content_type', 'application/json')
+        super().__init__(streaming_content=stream_result(items, encoder=encoder), **kwargs)
@@ -0,0 +1,272 @@
+"""
+Provide tests for database queries budgets of all endpoints.
+"""
+import json
+from unittest.mock import patch
+
+from django.conf import settings
+from django.contrib.auth.hashers import make_password
+from django.core.cache import caches
+from django.core.files.uploadedfile import SimpleUploadedFile
+from django.db import transaction
+from django.test import TestCase
+
+from block_producer.models import (
+    BlockProducer,
+    BlockProducerComment,
+    BlockProducerLike,
+)
+from block_producer.views.block_producer import SUGGESTIONS_CACHE
+from generic.budgets import (
+    EndpointBudget,
+    get_endpoints,
+    measure,
+    write_report,
+)
+from generic.jwt import TOKEN_VERSIONS_CACHE
+from services.models import (
+    EmailConfirmState,
+    PasswordRecoveryState,
+)
+from urls import urlpatterns
+from user.models import (
+    Profile,
+    User,
+)
+
+# Seeded rows have identifiers far from the ones the sequences give to rows created by endpoints.
+SEED_FIRST_IDENTIFIER = 1001
+SEED_SIZE = 20
+SEED_LIKERS_NUMBER = 5
+SEED_COMMENTS_NUMBER = 5
+
+PASSWORD = 'martin.fowler.1337'
+PASSWORD_RECOVERY_IDENTIFIER = '770b420663614db4bac8a7ef0ae7a5a9'
+EMAIL_CONFIRM_IDENTIFIER = '5f0e2bd0f0e84e0d9b1c1a3d8f1e6c2b'
+
+FIRST_USERNAME = f'martin.fowler.{SEED_FIRST_IDENTIFIER}'
+FIRST_USER_EMAIL = f'{FIRST_USERNAME}@gmail.com'
+UNCONFIRMED_USER_EMAIL = 'john.cap@gmail.com'
+
+
+class TestEndpointBudgets(TestCase):
+    """
+    Implements tests for database queries budgets of all endpoints against a seeded directory.
+    """
+
+    @classmethod
+    def setUpTestData(cls):
+        """
+        Seed users with profiles, block producers, likes, comments and pending e-mail states.
+        """
+        password = make_password(PASSWORD)
+
+        identifiers = range(SEED_FIRST_IDENTIFIER, SEED_FIRST_IDENTIFIER + SEED_SIZE)
+
+        users = User.objects.bulk_create([
+            User(
+                id=identifier,
+                email=f'martin.fowler.{identifier}@gmail.com',
+                username=f'martin.fowler.{identifier}',
+                password=password,
+                is_email_confirmed=True,
+            ) for identifier in identifiers
+        ] + [
+            User(
+                id=SEED_FIRST_IDENTIFIER + SEED_SIZE,
+                email=UNCONFIRMED_USER_EMAIL,
+                username='john.cap',
+                password=password,
+                is_email_confirmed=False,
+            ),
+        ])
+
+        Profile.objects.bulk_create([Profile(user=user, first_name='John') for user in users])
+
+        block_producers = BlockProducer.objects.bulk_create([
+            BlockProducer(
+                id=identifier,
+                user=user,
+                name=f'Block producer {identifier}',
+                website_url='https://bpcanada.com',
+                short_description='Founded by a team of serial tech entrepreneurs in Canada.',
+            ) for identifier, user in zip(identifiers, users)
+        ])
+
+        BlockProducerLike.objects.bulk_create([
+            BlockProducerLike(user=user, block_producer=block_producer)
+            for block_producer in block_producers for user in users[:SEED_LIKERS_NUMBER]
+        ])
+
+        BlockProducerComment.objects.bulk_create([
+            BlockProducerComment(user=users[number], block_producer=block_producer, text='Great block producer!')
+            for block_producer in block_producers for number in range(SEED_COMMENTS_NUMBER)
+        ])
+
+        PasswordRecoveryState.objects.create(email=users[0].email, identifier=PASSWORD_RECOVERY_IDENTIFIER)
+        EmailConfirmState.objects.create(email=UNCONFIRMED_USER_EMAIL, identifier=EMAIL_CONFIRM_IDENTIFIER)
+
+    def setUp(self):
+        """
+        Setup.
+        """
+        response = self.client.post('/authentication/token/obtaining/', json.dumps({
+            'username_or_email': FIRST_USER_EMAIL,
+            'password': PASSWORD,
+        }), content_type='application/json')
+
+        self.user_token = response.data.get('token')
+
+    def get_budgets(self):
+        """
+        Get budgets of requests to all endpoints.
+
+        Endpoints are requested as the owner of the first block producer, collections are requested in every
+        shape that is fetched in a different way. Responses are cached in the database, so queries that store
+        cached responses and bump their versions are counted as well.
+        """
+        authorization = {'HTTP_AUTHORIZATION': 'JWT ' + self.user_token}
+        username = {'username': FIRST_USERNAME}
+        block_producer_id = {'block_producer_id': SEED_FIRST_IDENTIFIER}
+
+        return (
+            EndpointBudget(
+                'POST', 'authentication/token/obtaining/', queries=1,
+                data={'username_or_email': FIRST_USER_EMAIL, 'password': PASSWORD},
+            ),
+            EndpointBudget('POST', 'authentication/token/refreshing/', queries=1, data={'token': self.user_token}),
+            EndpointBudget('POST', 'authentication/token/verification/', queries=1, data={'token': self.user_token}),
+            EndpointBudget('GET', 'users/', queries=1, headers=authorization),
+            EndpointBudget(
+                'POST', 'users/<str:username>/password/', queries=3,
+                parameters=username, headers=authorization,
+                data={'old_password': PASSWORD, 'new_password': 'martin.fowler.1338'},
+            ),
+            EndpointBudget('POST', 'users/password/recovery/', queries=3, data={'email': FIRST_USER_EMAIL}),
+            EndpointBudget(
+                'POST', 'users/password/recovery/<user_identifier>/', queries=5,
+                parameters={'user_identifier': PASSWORD_RECOVERY_IDENTIFIER},
+            ),
+            EndpointBudget(
+                'POST', 'users/registration/', queries=4,
+                data={'email': 'martin.fowler@gmail.com', 'username': 'martin.fowler', 'password': PASSWORD},
+            ),
+            EndpointBudget('GET', 'users/<str:username>/', queries=1, parameters=username),
+            EndpointBudget('DELETE', 'users/<str:username>/', queries=26, parameters=username, headers=authorization),
+            EndpointBudget('GET', 'users/<str:username>/profile/', queries=1, parameters=username),
+            EndpointBudget(
+                'POST', 'users/<str:username>/profile/', queries=2,
+                parameters=username, headers=authorization, data={'first_name': 'Martin'},
+            ),
+            EndpointBudget(
+                'POST', 'users/<str:username>/email/', queries=16,
+                parameters=username, headers=authorization, data={'new_email': 'martin.fowler@gmail.com'},
+            ),
+            EndpointBudget('POST', 'users/email/confirm/', queries=3, data={'email': UNCONFIRMED_USER_EMAIL}),
+            EndpointBudget(
+                'POST', 'users/email/confirm/<user_identifier>/', queries=4,
+                parameters={'user_identifier': EMAIL_CONFIRM_IDENTIFIER},
+            ),
+            EndpointBudget(
+                'POST', 'users/<str:username>/avatars/', queries=2,
+                parameters=username, headers=authorization, multipart=True,
+                data={'file': SimpleUploadedFile('avatar.png', b'avatar', content_type='image/png')},
+            ),
+            EndpointBudget('GET', 'block-producers/', queries=14),
+            EndpointBudget('GET', 'block-producers/', queries=14, query='limit=5'),
+            EndpointBudget('GET', 'block-producers/', queries=2, query='stream=true'),
+            EndpointBudget(
+                'GET', 'block-producers/', queries=2,
+                query=f'ids={SEED_FIRST_IDENTIFIER},{SEED_FIRST_IDENTIFIER + 1}',
+            ),
+            EndpointBudget(
+                'GET', 'block-producers/', queries=2,
+                query='include=counts,liked_by_me', headers=authorization,
+            ),
+            EndpointBudget(
+                'PUT', 'block-producers/', queries=18, headers=authorization,
+                data={
+                    'name': 'Block producer Spain',
+                    'website_url': 'https://bpspain.com',
+                    'short_description': 'Founded by a team of serial tech entrepreneurs in Spain.',
+                },
+            ),
+            EndpointBudget('GET', 'block-producers/search/', queries=1, query='phrase=producer'),
+            EndpointBudget('GET', 'block-producers/search/suggest/', queries=2, query='prefix=Block'),
+            EndpointBudget('GET', 'block-producers/<int:block_producer_id>/', queries=13, parameters=block_producer_id),
+            EndpointBudget(
+                'POST', 'block-producers/<int:block_producer_id>/', queries=24,
+                parameters=block_producer_id, headers=authorization, data={'name': 'Block producer Canada'},
+            ),
+            EndpointBudget(
+                'DELETE', 'block-producers/<int:block_producer_id>/', queries=32,
+                parameters=block_producer_id, headers=authorization,
+            ),
+            EndpointBudget(
+                'GET', 'block-producers/<int:block_producer_id>/comments/', queries=2,
+                parameters=block_producer_id,
+            ),
+            EndpointBudget(
+                'GET', 'block-producers/<int:block_producer_id>/comments/', queries=2,
+                parameters=block_producer_id, query='limit=5',
+            ),
+            EndpointBudget(
+                'PUT', 'block-producers/<int:block_producer_id>/comments/', queries=6,
+                parameters=block_producer_id, headers=authorization, data={'text': 'Great block producer!'},
+            ),
+            EndpointBudget('GET', 'block-producers/comments/numbers/', queries=2),
+            EndpointBudget('GET', 'block-producers/likes/numbers/', queries=2),
+            EndpointBudget(
+                'GET', 'block-producers/<int:block_producer_id>/likes/', queries=2,
+                parameters=block_producer_id,
+            ),
+            EndpointBudget(
+                'PUT', 'block-producers/<int:block_producer_id>/likes/', queries=2,
+                parameters=block_producer_id, headers=authorization,
+            ),
+            EndpointBudget(
+                'POST', 'block-producers/<int:block_producer_id>/avatars/', queries=16,
+                parameters=block_producer_id, headers=authorization, multipart=True,
+                data={'file': SimpleUploadedFile('logo.png', b'logo', content_type='image/png')},
+            ),
+        )
+
+    def test_all_endpoints_have_budgets(self):
+        """
+        Case: compare endpoints declared by URL patterns with endpoints having budgets.
+        Expect: every endpoint has a budget and every budget belongs to an existing endpoint.
+        """
+        endpoints = set(get_endpoints(urlpatterns, excluded_prefixes=('admin/',)))
+        budgeted_endpoints = {(budget.method, budget.route) for budget in self.get_budgets()}
+
+        assert set() == endpoints - budgeted_endpoints
+        assert set() == budgeted_endpoints - endpoints
+
+    @patch('services.avatar.boto3')
+    def test_endpoints_within_budgets(self, mock_boto3):
+        """
+        Case: request every endpoint against the seeded directory with cold caches.
+        Expect: no endpoint exceeds its budget of database queries.
+
+        Wall time is only reported, as it depends on the machine, it is compared by the directory benchmark.
+        """
+        mock_boto3.client.return_value.get_bucket_location.return_value = {'LocationConstraint': 'us-west-2'}
+
+        measurements = []
+
+        for budget in self.get_budgets():
+            caches['responses'].clear()
+            TOKEN_VERSIONS_CACHE.clear()
+            SUGGESTIONS_CACHE.clear()
+
+            with transaction.atomic():
+                measurements.append(measure(client=self.client, budget=budget))
+                transaction.set_rollback(True)
+
+        if settings.ENDPOINT_BUDGETS_REPORT_PATH:
+            write_report(measurements, path=settings.ENDPOINT_BUDGETS_REPORT_PATH)
+
+        for measurement in measurements:
+            with self.subTest(method=measurement.method, path=measurement.path):
+                assert measurement.status_code < 500, measurement
+                assert measurement.queries <= measurement.queries_budget, measurement
@@ -3,6 +3,10 @@ Provide configuration for admin panel services tables.
 """
 from django.contrib import admin
 
-from services.models import PasswordRecoveryState
+from services.models import (
+    OutboundEmail,
+    PasswordRecoveryState,
+)
 
 admin.site.register(PasswordRecoveryState)
+admin.site.register(OutboundEmail)
@@ -1,9 +1,57 @@
 """
 Provide implementation of email.
+
+E-mails are not sent while requests are handled, they are queued to the outbox table and sent by the worker
+(`send_emails` command) through the transport configured by `EMAIL_TRANSPORT` setting. Transports send e-mails
+by batches, every batch is sent by a single call to the e-mail service. If the e-mail service rejects a batch,
+it is split to find the rejected e-mails, so only they fail.
 """
+import time
+from dataclasses import dataclass
+from http import HTTPStatus
+
+import requests
 from django.conf import settings
-from sendgrid import SendGridAPIClient
-from sendgrid.helpers.mail import Mail
+from django.db import transaction
+from django.utils.module_loading import import_string
+from sendgrid.helpers.mail import (
+    Content,
+    From,
+    Mail,
+    Personalization,
+    Substitution,
+    To,
+)
+
+from services.models import OutboundEmail
+
+DEFAULT_BATCH_SIZE = 1000
+
+SENDGRID_MAIL_SEND_URL = 'https://api.sendgrid.com/v3/mail/send'
+SENDGRID_TIMEOUT = 30
+
+# Every recipient of a single call is a personalization, messages are substituted to the content by personalizations.
+# Messages exceeding the size of substitutions of a personalization are sent by their own calls.
+SENDGRID_MAX_PERSONALIZATIONS = 1000
+SENDGRID_MAX_SUBSTITUTIONS_SIZE = 10000
+MESSAGE_SUBSTITUTION_TAG = '-message-'
+
+# Statuses of requests rejected by their e-mails, e.g. by invalid recipients, batches are split to find the e-mails.
+REJECTION_STATUS_CODES = (HTTPStatus.BAD_REQUEST, HTTPStatus.UNPROCESSABLE_ENTITY)
+
+
+@dataclass(frozen=True)
+class EmailBatchMetrics:
+    """
+    Metrics of a batch of e-mails sent by a single call to the e-mail service.
+    """
+
+    emails: int
+    calls: int
+    sent: int
+    retried: int
+    failed: int
+    milliseconds: float
 
 
 class Email:
@@ -15,12 +63,211 @@ class Email:
     def send(email_to, subject, message):
         """
         Send e-mail implementation.
+
+        The e-mail is queued to be sent by the worker, so the request does not wait for the e-mail service.
+        """
+        OutboundEmail.enqueue(email_to=email_to, subject=subject, message=message)
+
+
+def get_batches(emails, max_size):
+    """
+    Split e-mails to batches of the maximum size, every e-mail with a too large message is put to its own batch.
+    """
+    batches, batch = [], []
+
+    for email in emails:
+        if len(MESSAGE_SUBSTITUTION_TAG) + len(email.get('message').encode()) > SENDGRID_MAX_SUBSTITUTIONS_SIZE:
+            batches.append([email])
+            continue
+
+        batch.append(email)
+
+        if len(batch) == max_size:
+            batches.append(batch)
+            batch = []
+
+    if batch:
+        batches.append(batch)
+
+    return batches
+
+
+class SendGridTransport:
+    """
+    SendGrid e-mail transport implementation.
+
+    Calls are made through a single HTTP session, so the connection to SendGrid API is reused by calls of the worker.
+    """
+
+    def __init__(self):
+        """
+        Constructor.
+        """
+        self.session = requests.Session()
+        self.session.headers.update({'Authorization': f'Bearer {settings.SENDGRID_API_KEY}'})
+
+    def get_batches(self, emails):
+        """
+        Split e-mails to batches sent by single calls.
+        """
+        return get_batches(emails, max_size=SENDGRID_MAX_PERSONALIZATIONS)
+
+    def send_batch(self, emails):
         """
-        message = Mail(
-            from_email=settings.PROJECT_EMAIL_ADDRESS,
-            to_emails=email_to,
-            subject=subject,
-            html_content=message,
-        )
+        Send the batch of e-mails by a single call to SendGrid API.
+
+        A single e-mail is sent with its message as the content, otherwise every e-mail is a personalization
+        with its own recipient, subject and message substituted to the content.
+        """
+        mail = Mail(from_email=From(settings.PROJECT_EMAIL_ADDRESS))
+
+        if len(emails) == 1:
+            mail.add_content(Content('text/html', emails[0].get('message')))
+        else:
+            mail.add_content(Content('text/html', MESSAGE_SUBSTITUTION_TAG))
+
+        for email in emails:
+            personalization = Personalization()
+            personalization.add_to(To(email.get('email_to')))
+            personalization.subject = email.get('subject')
+
+            if len(emails) > 1:
+                personalization.add_substitution(Substitution(MESSAGE_SUBSTITUTION_TAG, email.get('message')))
+
+            mail.add_personalization(personalization)
+
+        response = self.session.post(SENDGRID_MAIL_SEND_URL, json=mail.get(), timeout=SENDGRID_TIMEOUT)
+        response.raise_for_status()
+
+
+class FakeTransport:
+    """
+    Local e-mail transport implementation, which keeps e-mails in memory instead of sending them.
+
+    Batches are split as by SendGrid transport and kept as calls. Batches with e-mails to the failing addresses
+    are rejected as by the e-mail service, and all batches raise a network error while the transport is unavailable,
+    so failures can be checked without the network.
+    """
+
+    calls = []
+    sent_emails = []
+    failing_addresses = set()
+    unavailable = False
+
+    def get_batches(self, emails):
+        """
+        Split e-mails to batches sent by single calls.
+        """
+        return get_batches(emails, max_size=SENDGRID_MAX_PERSONALIZATIONS)
+
+    def send_batch(self, emails):
+        """
+        Keep the batch of e-mails as a call and its e-mails in the list of sent e-mails.
+        """
+        if self.unavailable:
+            raise requests.ConnectionError('E-mail service is unavailable.')
+
+        for email in emails:
+            if email.get('email_to') in self.failing_addresses:
+                response = requests.Response()
+                response.status_code = HTTPStatus.BAD_REQUEST
+
+                raise requests.HTTPError(f'E-mail to {email.get("email_to")} cannot be sent.', response=response)
+
+        sent_emails = [
+            {'email_to': email.get('email_to'), 'subject': email.get('subject'), 'message': email.get('message')}
+            for email in emails
+        ]
+
+        self.calls.append(sent_emails)
+        self.sent_emails.extend(sent_emails)
+
+
+def get_transport():
+    """
+    Get e-mail transport configured by the settings.
+    """
+    return import_string(settings.EMAIL_TRANSPORT)()
+
+
+def is_rejected(error):
+    """
+    Check if the error is the rejection of the batch by the e-mail service, caused by its e-mails.
+
+    Only invalid requests are rejections, e.g. by an invalid recipient. Other errors, e.g. of the network,
+    of the e-mail service, of authentication or exceeded rate limit, fail the batch regardless of its e-mails.
+    """
+    return isinstance(error, requests.HTTPError) and error.response is not None and \
+        error.response.status_code in REJECTION_STATUS_CODES
+
+
+def send_batch(transport, batch):
+    """
+    Send the batch of e-mails by the transport.
+
+    If the batch is rejected, it is split in halves sent by their own calls until the rejected e-mails are found.
+    Returns sent e-mails, rejected e-mails and failed ones (both with errors) and the number of calls.
+    """
+    try:
+        transport.send_batch(batch)
+
+    except Exception as error:
+        if not is_rejected(error):
+            return [], [], [(batch, repr(error))], 1
+
+        if len(batch) == 1:
+            return [], [(batch, repr(error))], [], 1
+
+        middle = len(batch) // 2
+
+        first_sent, first_rejected, first_failed, first_calls = send_batch(transport, batch[:middle])
+        second_sent, second_rejected, second_failed, second_calls = send_batch(transport, batch[middle:])
+
+        return first_sent + second_sent, first_rejected + second_rejected, first_failed + second_failed, \
+            1 + first_calls + second_calls
+
+    return batch, [], [], 1
+
+
+def send_queued_emails(transport, batch_size=DEFAULT_BATCH_SIZE):
+    """
+    Send queued e-mails which are due to be sent, up to the batch size.
+
+    E-mails are claimed by a short transaction and sent by batches of the transport outside of transactions, so
+    neither locks nor the connection are held while the e-mail service is called. Results of every batch are
+    recorded by another short transaction. Rejected e-mails are failed, if a batch fails otherwise, e.g. by a network
+    error, its e-mails are attempted again later with an exponential backoff. Returns metrics of the batches.
+    """
+    metrics = []
+
+    emails = OutboundEmail.claim_due(limit=batch_size)
+
+    for batch in transport.get_batches(emails):
+        started_at = time.perf_counter()
+
+        sent_emails, rejected_batches, failed_batches, calls_number = send_batch(transport, batch)
+
+        milliseconds = (time.perf_counter() - started_at) * 1000
+
+        with transaction.atomic():
+            if sent_emails:
+                OutboundEmail.mark_as_sent(identifiers=[email.get('id') for email in sent_emails])
+
+            for rejected_batch, error in rejected_batches:
+                OutboundEmail.mark_as_failed(identifiers=[email.get('id') for email in rejected_batch], error=error)
+
+            retried_number = sum(
+                OutboundEmail.mark_as_failed_attempts(emails=failed_batch, error=error)
+                for failed_batch, error in failed_batches
+            )
+
+        metrics.append(EmailBatchMetrics(
+            emails=len(batch),
+            calls=calls_number,
+            sent=len(sent_emails),
+            retried=retried_number,
+            failed=len(batch) - len(sent_emails) - retried_number,
+            milliseconds=round(milliseconds, 3),
+        ))
 
-        SendGridAPIClient(settings.SENDGRID_API_KEY).send(message)
+    return metrics
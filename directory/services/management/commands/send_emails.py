@@ -0,0 +1,62 @@
+"""
+Provide command to send e-mails queued to the outbox.
+"""
+import time
+
+from django.core.management.base import BaseCommand
+
+from services.email import (
+    DEFAULT_BATCH_SIZE,
+    get_transport,
+    send_queued_emails,
+)
+
+DEFAULT_INTERVAL = 5
+
+
+class Command(BaseCommand):
+    """
+    Drain the outbox by batches through the transport configured by `EMAIL_TRANSPORT` setting.
+
+    The transport is created once, so its connection is reused by all calls of the worker. Every batch is reported
+    with the number of its e-mails, the number of calls to the e-mail service and its latency. The outbox is drained
+    while due e-mails remain, then it is polled with the interval. Concurrent workers skip e-mails claimed by each
+    other, so several of them can be run.
+    """
+
+    help = 'Send e-mails queued to the outbox.'
+
+    def add_arguments(self, parser):
+        """
+        Add command arguments.
+        """
+        parser.add_argument('--batch-size', type=int, default=DEFAULT_BATCH_SIZE)
+        parser.add_argument('--interval', type=float, default=DEFAULT_INTERVAL, help='Seconds between polls.')
+        parser.add_argument('--once', action='store_true', help='Drain due e-mails and exit.')
+
+    def handle(self, *args, **options):
+        """
+        Handle the command.
+        """
+        transport = get_transport()
+        batch_size = options.get('batch_size')
+
+        while True:
+            metrics = send_queued_emails(transport=transport, batch_size=batch_size)
+
+            for batch_metrics in metrics:
+                calls = 'a single call' if batch_metrics.calls == 1 else f'{batch_metrics.calls} calls'
+
+                self.stdout.write(
+                    f'Batch of {batch_metrics.emails} e-mails has been handled by {calls} '
+                    f'in {batch_metrics.milliseconds:.1f} ms: {batch_metrics.sent} sent, '
+                    f'{batch_metrics.retried} going to be attempted again, {batch_metrics.failed} failed.',
+                )
+
+            if sum(batch_metrics.emails for batch_metrics in metrics) == batch_size:
+                continue
+
+            if options.get('once'):
+                return
+
+            time.sleep(options.get('interval'))
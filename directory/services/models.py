@@ -1,7 +1,39 @@
 """
-Provide database models for password recovery state.
+Provide database models for password recovery, e-mail confirmation states and outbound e-mails.
 """
-from django.db import models
+from datetime import timedelta
+
+from django.db import (
+    models,
+    transaction,
+)
+from django.utils import timezone
+
+OUTBOUND_EMAIL_STATUS_QUEUED = 'queued'
+OUTBOUND_EMAIL_STATUS_SENT = 'sent'
+OUTBOUND_EMAIL_STATUS_FAILED = 'failed'
+
+OUTBOUND_EMAIL_STATUSES = (
+    (OUTBOUND_EMAIL_STATUS_QUEUED, OUTBOUND_EMAIL_STATUS_QUEUED),
+    (OUTBOUND_EMAIL_STATUS_SENT, OUTBOUND_EMAIL_STATUS_SENT),
+    (OUTBOUND_EMAIL_STATUS_FAILED, OUTBOUND_EMAIL_STATUS_FAILED),
+)
+
+OUTBOUND_EMAIL_MAX_ATTEMPTS = 6
+OUTBOUND_EMAIL_RETRY_DELAY_SECONDS = 30
+OUTBOUND_EMAIL_MAX_RETRY_DELAY_SECONDS = 60 * 60
+
+# Claimed e-mails are not attempted by other workers for the claim time, it exceeds the time to send a batch.
+OUTBOUND_EMAIL_CLAIM_SECONDS = 15 * 60
+
+
+def get_retry_delay(attempts):
+    """
+    Get delay of the next attempt to send e-mail, which grows exponentially by the number of attempts.
+    """
+    return timedelta(
+        seconds=min(OUTBOUND_EMAIL_RETRY_DELAY_SECONDS * 2 ** (attempts - 1), OUTBOUND_EMAIL_MAX_RETRY_DELAY_SECONDS),
+    )
 
 
 class PasswordRecoveryState(models.Model):
@@ -28,40 +60,22 @@ class PasswordRecoveryState(models.Model):
         cls.objects.create(email=email, identifier=identifier)
 
     @classmethod
-    def does_exist(cls, user_identifier):
+    def get(cls, user_identifier):
         """
-        Check if user exists by identifier.
-        """
-        if cls.objects.filter(identifier=user_identifier).exists():
-            return True
-
-        return False
+        Get e-mail and whether password recovery state is active by user identifier.
 
-    @classmethod
-    def get_email(cls, user_identifier):
+        Raises `DoesNotExist` if there is no password recovery state with the identifier.
         """
-        Get email by existing user identifier.
-        """
-        return cls.objects.get(identifier=user_identifier).email
-
-    @classmethod
-    def is_active_(cls, user_identifier):
-        """
-        Check if user exists by identifier.
-        """
-        if cls.objects.get(identifier=user_identifier).is_active:
-            return True
-
-        return False
+        return cls.objects.values_list('email', 'is_active').get(identifier=user_identifier)
 
     @classmethod
     def deactivate(cls, user_identifier):
         """
-        Deactivate password recovery state.
+        Deactivate password recovery state if it is active.
+
+        Returns whether the state has been deactivated, so only one of concurrent recoveries succeeds.
         """
-        password_recovery_state = cls.objects.get(identifier=user_identifier)
-        password_recovery_state.is_active = False
-        password_recovery_state.save()
+        return cls.objects.filter(identifier=user_identifier, is_active=True).update(is_active=False) > 0
 
 
 class EmailConfirmState(models.Model):
@@ -88,28 +102,140 @@ class EmailConfirmState(models.Model):
         cls.objects.create(email=email, identifier=identifier)
 
     @classmethod
-    def does_exist(cls, user_identifier):
+    def get_email(cls, user_identifier):
+        """
+        Get email by user identifier.
+
+        Raises `DoesNotExist` if there is no email confirm state with the identifier.
+        """
+        return cls.objects.values_list('email', flat=True).get(identifier=user_identifier)
+
+    @classmethod
+    def is_active_(cls, user_identifier):
         """
         Check if user exists by identifier.
         """
-        if cls.objects.filter(identifier=user_identifier).exists():
+        if cls.objects.get(identifier=user_identifier).is_active:
             return True
 
         return False
 
+
+class OutboundEmail(models.Model):
+    """
+    Outbound e-mail database model.
+
+    E-mails are queued in the same transaction as the data they are sent about and sent by the worker later,
+    so requests never wait for the e-mail service and e-mails are not lost if it is unavailable.
+    """
+
+    email_to = models.EmailField(blank=False)
+    subject = models.CharField(max_length=255, blank=False)
+    message = models.TextField(blank=False)
+    status = models.CharField(max_length=20, choices=OUTBOUND_EMAIL_STATUSES, default=OUTBOUND_EMAIL_STATUS_QUEUED)
+    attempts = models.PositiveIntegerField(default=0)
+    last_error = models.TextField(blank=True)
+    created_at = models.DateTimeField(auto_now_add=True)
+    next_attempt_at = models.DateTimeField(default=timezone.now)
+    sent_at = models.DateTimeField(null=True, blank=True)
+
+    class Meta:
+        """
+        Meta.
+        """
+
+        indexes = [
+            models.Index(
+                fields=['next_attempt_at'],
+                condition=models.Q(status=OUTBOUND_EMAIL_STATUS_QUEUED),
+                name='outbound_email_queued_idx',
+            ),
+        ]
+
+    def __str__(self):
+        """
+        Get string representation of an object.
+        """
+        return f'{self.created_at} — {self.email_to} — {self.status}'
+
     @classmethod
-    def get_email(cls, user_identifier):
+    def enqueue(cls, email_to, subject, message):
         """
-        Get email by existing user identifier.
+        Queue e-mail to be sent by the worker.
         """
-        return cls.objects.get(identifier=user_identifier).email
+        cls.objects.create(email_to=email_to, subject=subject, message=message)
 
     @classmethod
-    def is_active_(cls, user_identifier):
+    def claim_due(cls, limit):
         """
-        Check if user exists by identifier.
+        Claim queued e-mails which are due to be sent, the oldest first.
+
+        E-mails are locked only by a short transaction, which postpones their next attempt by the claim time, so
+        concurrent workers never send the same e-mail while it is being sent outside of the transaction. E-mails
+        of a worker which has stopped before they are sent are attempted again once the claim time has passed.
+        Returns e-mails as dictionaries with identifiers, addresses, subjects, messages and numbers of attempts.
         """
-        if cls.objects.get(identifier=user_identifier).is_active:
-            return True
+        with transaction.atomic():
+            emails = list(cls.objects.select_for_update(skip_locked=True).filter(
+                status=OUTBOUND_EMAIL_STATUS_QUEUED, next_attempt_at__lte=timezone.now(),
+            ).order_by('next_attempt_at', 'id').values(
+                'id', 'email_to', 'subject', 'message', 'attempts',
+            )[:limit])
 
-        return False
+            if emails:
+                cls.objects.filter(id__in=[email.get('id') for email in emails]).update(
+                    next_attempt_at=timezone.now() + timedelta(seconds=OUTBOUND_EMAIL_CLAIM_SECONDS),
+                )
+
+        return emails
+
+    @classmethod
+    def mark_as_sent(cls, identifiers):
+        """
+        Mark e-mails with specified identifiers as sent by a single query.
+        """
+        cls.objects.filter(id__in=identifiers).update(
+            status=OUTBOUND_EMAIL_STATUS_SENT, attempts=models.F('attempts') + 1, sent_at=timezone.now(),
+        )
+
+    @classmethod
+    def mark_as_failed_attempts(cls, emails, error):
+        """
+        Record failed attempts to send e-mails by a single query.
+
+        The next attempt of every e-mail is delayed exponentially by the number of its attempts, e-mails are failed
+        once they have been attempted the maximum number of times. Returns the number of e-mails going to be
+        attempted again.
+        """
+        now = timezone.now()
+
+        next_attempts_at = [
+            models.When(attempts=attempts, then=models.Value(now + get_retry_delay(attempts=attempts + 1)))
+            for attempts in {email.get('attempts') for email in emails}
+        ]
+
+        cls.objects.filter(id__in=[email.get('id') for email in emails]).update(
+            status=models.Case(
+                models.When(
+                    attempts__gte=OUTBOUND_EMAIL_MAX_ATTEMPTS - 1, then=models.Value(OUTBOUND_EMAIL_STATUS_FAILED),
+                ),
+                default=models.F('status'),
+                output_field=models.CharField(),
+            ),
+            next_attempt_at=models.Case(
+                *next_attempts_at, default=models.F('next_attempt_at'), output_field=models.DateTimeField(),
+            ),
+            attempts=models.F('attempts') + 1,
+            last_error=error,
+        )
+
+        return sum(email.get('attempts') + 1 < OUTBOUND_EMAIL_MAX_ATTEMPTS for email in emails)
+
+    @classmethod
+    def mark_as_failed(cls, identifiers, error):
+        """
+        Mark e-mails with specified identifiers as failed by a single query, they are not attempted anymore.
+        """
+        cls.objects.filter(id__in=identifiers).update(
+            status=OUTBOUND_EMAIL_STATUS_FAILED, attempts=models.F('attempts') + 1, last_error=error,
+        )
@@ -0,0 +1,276 @@
+"""
+Provide tests for implementation of outbound e-mails queue.
+"""
+import json
+from datetime import timedelta
+from http import HTTPStatus
+from io import StringIO
+from unittest.mock import patch
+
+import requests
+from django.core.management import call_command
+from django.test import (
+    TestCase,
+    override_settings,
+)
+from django.utils import timezone
+
+from services.email import (
+    MESSAGE_SUBSTITUTION_TAG,
+    FakeTransport,
+    SendGridTransport,
+)
+from services.models import (
+    OUTBOUND_EMAIL_MAX_ATTEMPTS,
+    OUTBOUND_EMAIL_STATUS_FAILED,
+    OUTBOUND_EMAIL_STATUS_QUEUED,
+    OUTBOUND_EMAIL_STATUS_SENT,
+    OutboundEmail,
+)
+from user.models import User
+
+
+@override_settings(EMAIL_TRANSPORT='services.email.FakeTransport')
+class TestOutboundEmails(TestCase):
+    """
+    Implements tests for implementation of outbound e-mails queue.
+    """
+
+    def setUp(self):
+        """
+        Setup.
+        """
+        self.email = 'martin.fowler@gmail.com'
+
+        User.objects.create_user(
+            email=self.email,
+            username='martin.fowler',
+            password='martin.fowler.1337',
+            is_email_confirmed=True,
+        )
+
+        FakeTransport.calls.clear()
+        FakeTransport.sent_emails.clear()
+        FakeTransport.failing_addresses.clear()
+        FakeTransport.unavailable = False
+
+    def test_request_only_queues_email(self):
+        """
+        Case: send request to recover user password by email.
+        Expect: the e-mail is queued without calling the transport.
+        """
+        with patch.object(FakeTransport, 'send_batch') as mock_transport_send:
+            response = self.client.post('/users/password/recovery/', json.dumps({
+                'email': self.email,
+            }), content_type='application/json')
+
+        outbound_email = OutboundEmail.objects.get(email_to=self.email)
+
+        assert OUTBOUND_EMAIL_STATUS_QUEUED == outbound_email.status
+        assert not mock_transport_send.called
+        assert HTTPStatus.OK == response.status_code
+
+    def test_send_queued_emails(self):
+        """
+        Case: send queued e-mails by the worker.
+        Expect: e-mails are sent through the transport and marked as sent.
+        """
+        self.client.post('/users/password/recovery/', json.dumps({
+            'email': self.email,
+        }), content_type='application/json')
+
+        call_command('send_emails', '--once', stdout=StringIO())
+
+        outbound_email = OutboundEmail.objects.get(email_to=self.email)
+
+        assert [self.email] == [email.get('email_to') for email in FakeTransport.sent_emails]
+        assert OUTBOUND_EMAIL_STATUS_SENT == outbound_email.status
+        assert 1 == outbound_email.attempts
+        assert outbound_email.sent_at is not None
+
+    def test_send_queued_emails_by_batches(self):
+        """
+        Case: send more queued e-mails than the batch size by the worker.
+        Expect: all of the e-mails are sent.
+        """
+        for index in range(5):
+            OutboundEmail.enqueue(email_to=f'user.{index}@gmail.com', subject='Subject', message='Message')
+
+        call_command('send_emails', '--once', '--batch-size', '2', stdout=StringIO())
+
+        assert 5 == len(FakeTransport.sent_emails)
+        assert not OutboundEmail.objects.filter(status=OUTBOUND_EMAIL_STATUS_QUEUED).exists()
+
+    def test_send_queued_emails_by_single_call(self):
+        """
+        Case: send many queued e-mails with different messages by the worker.
+        Expect: e-mails are sent by a single call and marked as sent by a constant number of queries, e-mails with
+            too large messages are sent by their own calls.
+        """
+        for index in range(50):
+            OutboundEmail.enqueue(email_to=f'user.{index}@gmail.com', subject='Subject', message=f'Message {index}')
+
+        OutboundEmail.enqueue(email_to='user.large@gmail.com', subject='Subject', message='M' * 20000)
+
+        output = StringIO()
+
+        # E-mails are claimed by a transaction of two queries, results of every batch are recorded by a transaction
+        # of a single query, transactions are run as savepoints in tests.
+        with self.assertNumQueries(10):
+            call_command('send_emails', '--once', stdout=output)
+
+        assert [1, 50] == [len(call) for call in FakeTransport.calls]
+        assert 'Message 49' == FakeTransport.calls[1][-1].get('message')
+        assert 51 == OutboundEmail.objects.filter(status=OUTBOUND_EMAIL_STATUS_SENT).count()
+        assert 'Batch of 50 e-mails has been handled by a single call' in output.getvalue()
+
+    def test_send_batch_by_sendgrid(self):
+        """
+        Case: send a batch of e-mails through SendGrid transport.
+        Expect: e-mails are sent by a single call of the session as personalizations with substituted messages.
+        """
+        transport = SendGridTransport()
+
+        with patch.object(transport.session, 'post') as mock_post:
+            transport.send_batch([
+                {'email_to': 'martin.fowler@gmail.com', 'subject': 'Subject 1', 'message': 'Message 1'},
+                {'email_to': 'kent.beck@gmail.com', 'subject': 'Subject 2', 'message': 'Message 2'},
+            ])
+
+        body = mock_post.call_args[1].get('json')
+
+        assert 1 == mock_post.call_count
+        assert [{'type': 'text/html', 'value': MESSAGE_SUBSTITUTION_TAG}] == body.get('content')
+        assert {
+            ('martin.fowler@gmail.com', 'Subject 1', 'Message 1'),
+            ('kent.beck@gmail.com', 'Subject 2', 'Message 2'),
+        } == {
+            (
+                personalization.get('to')[0].get('email'),
+                personalization.get('subject'),
+                personalization.get('substitutions').get(MESSAGE_SUBSTITUTION_TAG),
+            ) for personalization in body.get('personalizations')
+        }
+
+    def test_retry_failed_email(self):
+        """
+        Case: send queued e-mail by the worker while the e-mail service is unavailable.
+        Expect: the e-mail is attempted again later with the error recorded.
+        """
+        FakeTransport.unavailable = True
+        OutboundEmail.enqueue(email_to=self.email, subject='Subject', message='Message')
+
+        call_command('send_emails', '--once', stdout=StringIO())
+        call_command('send_emails', '--once', stdout=StringIO())
+
+        outbound_email = OutboundEmail.objects.get(email_to=self.email)
+
+        assert OUTBOUND_EMAIL_STATUS_QUEUED == outbound_email.status
+        assert 1 == outbound_email.attempts
+        assert 'unavailable' in outbound_email.last_error
+        assert outbound_email.next_attempt_at > timezone.now()
+
+        FakeTransport.unavailable = False
+        OutboundEmail.objects.update(next_attempt_at=timezone.now() - timedelta(seconds=1))
+
+        call_command('send_emails', '--once', stdout=StringIO())
+
+        assert OUTBOUND_EMAIL_STATUS_SENT == OutboundEmail.objects.get(email_to=self.email).status
+        assert 1 == len(FakeTransport.sent_emails)
+
+    def test_fail_email_after_max_attempts(self):
+        """
+        Case: send queued e-mail by the worker while the e-mail service is unavailable for the maximum attempts.
+        Expect: the e-mail is failed and not attempted anymore.
+        """
+        FakeTransport.unavailable = True
+        OutboundEmail.enqueue(email_to=self.email, subject='Subject', message='Message')
+
+        for _ in range(OUTBOUND_EMAIL_MAX_ATTEMPTS):
+            OutboundEmail.objects.update(next_attempt_at=timezone.now() - timedelta(seconds=1))
+            call_command('send_emails', '--once', stdout=StringIO())
+
+        outbound_email = OutboundEmail.objects.get(email_to=self.email)
+
+        assert OUTBOUND_EMAIL_STATUS_FAILED == outbound_email.status
+        assert OUTBOUND_EMAIL_MAX_ATTEMPTS == outbound_email.attempts
+
+    def test_retry_failed_batch_by_single_query(self):
+        """
+        Case: send queued e-mails with different numbers of attempts while the e-mail service is unavailable.
+        Expect: the e-mails are attempted again with delays by their attempts and marked by a single query.
+        """
+        FakeTransport.unavailable = True
+
+        for index in range(3):
+            OutboundEmail.enqueue(email_to=f'user.{index}@gmail.com', subject='Subject', message='Message')
+
+        OutboundEmail.objects.filter(email_to='user.2@gmail.com').update(attempts=OUTBOUND_EMAIL_MAX_ATTEMPTS - 1)
+        OutboundEmail.objects.filter(email_to='user.1@gmail.com').update(attempts=2)
+
+        with self.assertNumQueries(7):
+            call_command('send_emails', '--once', stdout=StringIO())
+
+        outbound_emails = {
+            outbound_email.email_to: outbound_email for outbound_email in OutboundEmail.objects.all()
+        }
+
+        assert OUTBOUND_EMAIL_STATUS_FAILED == outbound_emails.get('user.2@gmail.com').status
+        assert OUTBOUND_EMAIL_STATUS_QUEUED == outbound_emails.get('user.1@gmail.com').status
+        assert 3 == outbound_emails.get('user.1@gmail.com').attempts
+        assert 1 == outbound_emails.get('user.0@gmail.com').attempts
+        assert outbound_emails.get('user.1@gmail.com').next_attempt_at > \
+            outbound_emails.get('user.0@gmail.com').next_attempt_at > timezone.now()
+
+    def test_fail_only_rejected_emails_of_batch(self):
+        """
+        Case: send queued e-mails by the worker while the e-mail service rejects e-mails to some of the addresses.
+        Expect: the batch is split, so only the rejected e-mails are failed and others are sent.
+        """
+        FakeTransport.failing_addresses.update({'user.2@gmail.com', 'user.5@gmail.com'})
+
+        for index in range(8):
+            OutboundEmail.enqueue(email_to=f'user.{index}@gmail.com', subject='Subject', message=f'Message {index}')
+
+        output = StringIO()
+
+        call_command('send_emails', '--once', stdout=output)
+
+        failed_emails = OutboundEmail.objects.filter(status=OUTBOUND_EMAIL_STATUS_FAILED)
+
+        assert {'user.2@gmail.com', 'user.5@gmail.com'} == {email.email_to for email in failed_emails}
+        assert 'cannot be sent' in failed_emails[0].last_error
+        assert 6 == len(FakeTransport.sent_emails)
+        assert 6 == OutboundEmail.objects.filter(status=OUTBOUND_EMAIL_STATUS_SENT).count()
+        assert '6 sent, 0 going to be attempted again, 2 failed.' in output.getvalue()
+
+    def test_retry_batch_unauthorized_by_email_service(self):
+        """
+        Case: send queued e-mails by the worker while the e-mail service rejects the API key.
+        Expect: the batch is not split and its e-mails are attempted again later instead of being failed.
+        """
+        for index in range(4):
+            OutboundEmail.enqueue(email_to=f'user.{index}@gmail.com', subject='Subject', message='Message')
+
+        response = requests.Response()
+        response.status_code = HTTPStatus.UNAUTHORIZED
+
+        with patch.object(FakeTransport, 'send_batch', side_effect=requests.HTTPError(response=response)) as mock_send:
+            call_command('send_emails', '--once', stdout=StringIO())
+
+        assert 1 == mock_send.call_count
+        assert 4 == OutboundEmail.objects.filter(status=OUTBOUND_EMAIL_STATUS_QUEUED, attempts=1).count()
+
+    def test_claim_emails_while_sending(self):
+        """
+        Case: claim queued e-mails while they are being sent by another worker.
+        Expect: the e-mails are not claimed again until the claim time passes.
+        """
+        OutboundEmail.enqueue(email_to=self.email, subject='Subject', message='Message')
+
+        assert 1 == len(OutboundEmail.claim_due(limit=10))
+        assert [] == OutboundEmail.claim_due(limit=10)
+
+        OutboundEmail.objects.update(next_attempt_at=timezone.now() - timedelta(seconds=1))
+
+        assert 1 == len(OutboundEmail.claim_due(limit=10))
@@ -10,8 +10,14 @@ SECRET_KEY = os.environ.get('SECRET_KEY')
 
 DATABASE_URL = os.environ.get('DATABASE_URL')
 
+RESPONSES_CACHE_BACKEND = os.environ.get('RESPONSES_CACHE_BACKEND', 'django.core.cache.backends.db.DatabaseCache')
+RESPONSES_CACHE_LOCATION = os.environ.get('RESPONSES_CACHE_LOCATION', 'responses_cache')
+
+ENDPOINT_BUDGETS_REPORT_PATH = os.environ.get('ENDPOINT_BUDGETS_REPORT_PATH')
+
 PROJECT_EMAIL_ADDRESS = os.environ.get('PROJECT_EMAIL_ADDRESS')
 SENDGRID_API_KEY = os.environ.get('SENDGRID_API_KEY')
+EMAIL_TRANSPORT = os.environ.get('EMAIL_TRANSPORT', 'services.email.SendGridTransport')
 
 BASE_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
 
@@ -70,7 +76,7 @@ REST_FRAMEWORK = {
         'rest_framework.permissions.AllowAny',
     ),
     'DEFAULT_AUTHENTICATION_CLASSES': (
-        'rest_framework_jwt.authentication.JSONWebTokenAuthentication',
+        'generic.jwt.StatelessJSONWebTokenAuthentication',
     ),
 }
 
@@ -78,6 +84,7 @@ JWT_AUTH = {
     'JWT_SECRET_KEY': SECRET_KEY,
     'JWT_VERIFY_EXPIRATION': False,
     'JWT_ALLOW_REFRESH': True,
+    'JWT_PAYLOAD_HANDLER': 'generic.jwt_payload.jwt_payload_handler',
 }
 
 WSGI_APPLICATION = 'wsgi.application'
@@ -86,6 +93,30 @@ DATABASES = {
     'default': dj_database_url.config(default=DATABASE_URL),
 }
 
+CACHES = {
+    'default': {
+        'BACKEND': 'django.core.cache.backends.locmem.LocMemCache',
+    },
+    'responses': {
+        'BACKEND': RESPONSES_CACHE_BACKEND,
+        'LOCATION': RESPONSES_CACHE_LOCATION,
+    },
+}
+
+# Block producers responses are cached in the database by default, both in development and in production. A cached
+# response is got by primary key lookups of its version and itself instead of joining block producers with their
+# users and serializing them, and both versions and responses are shared by all processes, so a change handled by
+# one of them invalidates responses of the others at once instead of after the time to live. The database cache
+# culls a part of entries when it is full instead of evicting the least recently used ones, the table is created
+# by `createcachetable` on start. Set RESPONSES_CACHE_BACKEND and RESPONSES_CACHE_LOCATION to use another backend.
+if RESPONSES_CACHE_BACKEND in (
+    'django.core.cache.backends.locmem.LocMemCache',
+    'django.core.cache.backends.db.DatabaseCache',
+):
+    CACHES['responses']['OPTIONS'] = {'MAX_ENTRIES': 10000}
+
+RESPONSES_CACHE_TIME_TO_LIVE = 60
+
 AUTH_PASSWORD_VALIDATORS = [
     {
         'NAME': 'django.contrib.auth.password_validation.UserAttributeSimilarityValidator',
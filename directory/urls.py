@@ -8,18 +8,22 @@ from django.urls import (
 )
 from rest_framework_jwt.views import (
     ObtainJSONWebToken,
-    refresh_jwt_token,
-    verify_jwt_token,
+    RefreshJSONWebToken,
+    VerifyJSONWebToken,
 )
 
 from block_producer.endpoints import block_producer_endpoints
-from generic.jwt import CustomJWTSerializer
+from generic.jwt import (
+    CustomJWTSerializer,
+    CustomRefreshJWTSerializer,
+    CustomVerifyJWTSerializer,
+)
 from user.endpoints import user_endpoints
 
 authentication_endpoints = [
     path('token/obtaining/', ObtainJSONWebToken.as_view(serializer_class=CustomJWTSerializer)),
-    path('token/refreshing/', refresh_jwt_token),
-    path('token/verification/', verify_jwt_token),
+    path('token/refreshing/', RefreshJSONWebToken.as_view(serializer_class=CustomRefreshJWTSerializer)),
+    path('token/verification/', VerifyJSONWebToken.as_view(serializer_class=CustomVerifyJWTSerializer)),
 ]
 
 urlpatterns = [
@@ -50,19 +50,16 @@ class ChangeUserPassword:
         """
         self.user = user
 
-    def do(self, email, old_password, new_password):
+    def do(self, user_id, old_password, new_password):
         """
-        Change user password.
+        Change password of the authenticated user.
         """
-        if not self.user.does_exist_by_email(email=email):
-            raise UserWithSpecifiedEmailAddressDoesNotExistError
-
-        is_password_matched = self.user.verify_password(email=email, password=old_password)
+        is_password_matched = self.user.verify_password(user_id=user_id, password=old_password)
 
         if not is_password_matched:
             raise SpecifiedUserPasswordIsIncorrectError
 
-        self.user.set_new_password(email=email, password=new_password)
+        self.user.change_password(user_id=user_id, password=new_password)
 
 
 class ChangeUserEmail:
@@ -80,11 +77,11 @@ class ChangeUserEmail:
         """
         Change user e-mail.
         """
-        if not self.user.does_exist_by_username(username=username):
+        try:
+            self.user.set_new_email(username=username, email=new_email)
+        except self.user.DoesNotExist:
             raise UserWithSpecifiedUsernameDoesNotExistError
 
-        self.user.set_new_email(username=username, email=new_email)
-
 
 class RequestUserPasswordRecovery:
     """
@@ -128,16 +125,14 @@ class RecoverUserPassword:
         """
         Recover user password by user identifier.
         """
-        if not self.password_recovery_state.does_exist(user_identifier=user_identifier):
+        try:
+            email, is_active = self.password_recovery_state.get(user_identifier=user_identifier)
+        except self.password_recovery_state.DoesNotExist:
             raise UserWithSpecifiedIdentifierDoesNotExistError
 
-        if not self.password_recovery_state.is_active_(user_identifier=user_identifier):
+        if not is_active or not self.password_recovery_state.deactivate(user_identifier=user_identifier):
             raise RecoveryPasswordHasBeenAlreadySentError
 
-        self.password_recovery_state.deactivate(user_identifier=user_identifier)
-
-        email = self.password_recovery_state.get_email(user_identifier=user_identifier)
-
         new_password = uuid.uuid4().hex[:12]
 
         self.user.set_new_password(email=email, password=new_password)
@@ -149,21 +144,17 @@ class UpdateUserProfile:
     Update user profile implementation.
     """
 
-    def __init__(self, user, profile):
+    def __init__(self, profile):
         """
         Constructor.
         """
-        self.user = user
         self.profile = profile
 
-    def do(self, username, info):
+    def do(self, user_id, info):
         """
-        Update user profile.
+        Update profile of the authenticated user.
         """
-        if not self.user.does_exist_by_username(username=username):
-            raise UserWithSpecifiedUsernameDoesNotExistError
-
-        self.profile.update(username=username, info=info)
+        self.profile.update(user_id=user_id, info=info)
 
 
 class GetUser:
@@ -181,11 +172,11 @@ class GetUser:
         """
         Get user information by username.
         """
-        if not self.user.does_exist_by_username(username=username):
+        try:
+            return self.user.get(username=username)
+        except self.user.DoesNotExist:
             raise UserWithSpecifiedUsernameDoesNotExistError
 
-        return self.user.get(username=username)
-
 
 class GetUserProfile:
     """
@@ -203,31 +194,32 @@ class GetUserProfile:
         """
         Get user profile information by username.
         """
-        if not self.user.does_exist_by_username(username=username):
+        try:
+            return self.profile.get(username=username)
+        except self.profile.DoesNotExist:
             raise UserWithSpecifiedUsernameDoesNotExistError
 
-        return self.profile.get(username=username)
-
 
 class DeleteUser:
     """
     Delete user implementation.
     """
 
-    def __init__(self, user):
+    def __init__(self, user, token_versions_cache):
         """
         Constructor.
         """
         self.user = user
+        self.token_versions_cache = token_versions_cache
 
-    def do(self, username):
+    def do(self, user_id):
         """
-        Delete user by username.
-        """
-        if not self.user.does_exist_by_username(username=username):
-            raise UserWithSpecifiedUsernameDoesNotExistError
+        Delete the authenticated user.
 
-        return self.user.delete_(username=username)
+        Token version of the user is removed from the cache, so tokens of the user are revoked at once.
+        """
+        self.user.delete_(user_id=user_id)
+        self.token_versions_cache.delete(user_id)
 
 
 class UserRequestEmailConfirm:
@@ -272,10 +264,10 @@ class UserEmailConfirm:
         """
         Confirm registration by user identifier.
         """
-        if not self.email_confirm_state.does_exist(user_identifier=user_identifier):
+        try:
+            email = self.email_confirm_state.get_email(user_identifier=user_identifier)
+        except self.email_confirm_state.DoesNotExist:
             raise UserWithSpecifiedIdentifierDoesNotExistError
 
-        if self.user.is_email_confirmed_(user_identifier=user_identifier):
+        if not self.user.set_email_as_confirmed(email=email):
             raise UserWithSpecifiedIdentifierAlreadyConfirmedError
-
-        self.user.set_email_as_confirmed(user_identifier=user_identifier)
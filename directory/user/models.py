@@ -3,17 +3,31 @@ Provide database models for user.
 """
 from __future__ import unicode_literals
 
+from dataclasses import fields
+
 from django.conf import settings
 from django.contrib.auth.base_user import AbstractBaseUser
-from django.contrib.auth.hashers import check_password
+from django.contrib.auth.hashers import (
+    check_password,
+    make_password,
+)
 from django.contrib.auth.models import PermissionsMixin
 from django.db import models
+from django.db.models import F
+from django.utils import timezone
 from django.utils.translation import ugettext_lazy as _
 
-from services.models import EmailConfirmState
 from user.dto.profile import UserProfileDto
-from user.dto.user import UserDto
+from user.dto.user import (
+    UserDto,
+    UserDtoWithoutEmail,
+)
 from user.managers import UserManager
+from user.signals import users_changed
+
+PROFILE_FIELDS = tuple(field.name for field in fields(UserProfileDto) if field.name != 'user')
+PROFILE_USER_FIELDS = tuple(field.name for field in fields(UserDtoWithoutEmail))
+PROFILE_LOOKUPS = PROFILE_FIELDS + tuple(f'user__{field}' for field in PROFILE_USER_FIELDS)
 
 
 class User(AbstractBaseUser, PermissionsMixin):
@@ -25,11 +39,15 @@ class User(AbstractBaseUser, PermissionsMixin):
     username = models.CharField(unique=True, max_length=25, blank=False)
 
     created = models.DateTimeField(auto_now_add=True)
+    updated_at = models.DateTimeField(auto_now=True)
     is_email_confirmed = models.BooleanField(default=False)
 
     is_active = models.BooleanField(default=True)
     is_staff = models.BooleanField(default=False)
 
+    # Claimed by issued tokens, increased to revoke them when the password or the e-mail address is changed.
+    token_version = models.PositiveIntegerField(default=0, editable=False)
+
     objects = UserManager()
 
     USERNAME_FIELD = 'username'
@@ -86,11 +104,11 @@ class User(AbstractBaseUser, PermissionsMixin):
         return False
 
     @classmethod
-    def verify_password(cls, email, password):
+    def verify_password(cls, user_id, password):
         """
         Check if the user's password is equal to the encrypted user password.
         """
-        encrypted_user_password = cls.objects.get(email=email).password
+        encrypted_user_password = cls.objects.filter(id=user_id).values_list('password', flat=True).get()
         return check_password(password=password, encoded=encrypted_user_password)
 
     @classmethod
@@ -100,54 +118,74 @@ class User(AbstractBaseUser, PermissionsMixin):
         """
         user = cls.objects.get(email=email)
         user.set_password(password)
-        user.save()
+        user.token_version = F('token_version') + 1
+        user.save(update_fields=('password', 'token_version', 'updated_at'))
+
+    @classmethod
+    def change_password(cls, user_id, password):
+        """
+        Set new user password by specified user identifier.
+        """
+        cls.objects.filter(id=user_id).update(
+            password=make_password(password), token_version=F('token_version') + 1, updated_at=timezone.now(),
+        )
 
     @classmethod
     def get(cls, username):
         """
         Get user.
+
+        Raises `DoesNotExist` if there is no user with the username.
         """
         user_as_dict = cls.objects.filter(username=username).values().first()
+
+        if user_as_dict is None:
+            raise cls.DoesNotExist
+
         del user_as_dict['password']
         del user_as_dict['created']
+        del user_as_dict['updated_at']
+        del user_as_dict['token_version']
         return UserDto(**user_as_dict)
 
     @classmethod
-    def delete_(cls, username):
+    def delete_(cls, user_id):
         """
-        Delete user.
+        Delete user by identifier.
         """
-        cls.objects.filter(username=username).delete()
+        cls.objects.filter(id=user_id).delete()
 
     @classmethod
     def set_new_email(cls, username, email):
         """
         Set new user e-mail by specified username.
-        """
-        user = cls.objects.get(username=username)
-        user.email = email
-        user.save()
 
-    @classmethod
-    def is_email_confirmed_(cls, user_identifier):
+        Raises `DoesNotExist` if there is no user with the username.
         """
-        Check if user email confirmed by identifier.
-        """
-        email = EmailConfirmState.get_email(user_identifier=user_identifier)
-        if cls.objects.get(email=email).is_email_confirmed:
-            return True
+        updated_users_number = cls.objects.filter(username=username).update(
+            email=email, token_version=F('token_version') + 1, updated_at=timezone.now(),
+        )
 
-        return False
+        if not updated_users_number:
+            raise cls.DoesNotExist
+
+        users_changed.send(sender=cls, lookups={'username': username})
 
     @classmethod
-    def set_email_as_confirmed(cls, user_identifier):
+    def set_email_as_confirmed(cls, email):
         """
-        Set email as confirmed by identifier.
+        Set email as confirmed by specified e-mail address if it is not confirmed yet.
+
+        Returns whether the email has been confirmed now.
         """
-        email = EmailConfirmState.get_email(user_identifier=user_identifier)
-        user_state = cls.objects.get(email=email)
-        user_state.is_email_confirmed = True
-        user_state.save()
+        is_confirmed = cls.objects.filter(email=email, is_email_confirmed=False).update(
+            is_email_confirmed=True, updated_at=timezone.now(),
+        ) > 0
+
+        if is_confirmed:
+            users_changed.send(sender=cls, lookups={'email': email})
+
+        return is_confirmed
 
 
 class Profile(models.Model):
@@ -172,6 +210,8 @@ class Profile(models.Model):
     telegram_url = models.URLField(max_length=200, blank=True)
     steemit_url = models.URLField(max_length=200, blank=True)
 
+    updated_at = models.DateTimeField(auto_now=True)
+
     def __str__(self):
         """
         Get string representation of an object.
@@ -179,27 +219,26 @@ class Profile(models.Model):
         return self.user.email
 
     @classmethod
-    def update(cls, username, info):
+    def update(cls, user_id, info):
         """
-        Update user profile with specified information.
+        Update profile of the user with specified information.
         """
-        user = User.objects.get(username=username)
-        cls.objects.filter(user=user).update(**info)
+        cls.objects.filter(user_id=user_id).update(**info, updated_at=timezone.now())
 
     @classmethod
     def get(cls, username):
         """
-        Get user profile information by username.
-        """
-        user = User.objects.get(username=username)
-        user_profile_as_dict = cls.objects.filter(user=user).values().first()
+        Get user profile information by username together with the user in a single joined query.
 
-        user_as_dict = User.objects.filter(username=username).values().first()
+        Raises `DoesNotExist` if there is no profile of the user with the username.
+        """
+        user_profile_as_dict = cls.objects.filter(user__username=username).values(*PROFILE_LOOKUPS).first()
 
-        del user_as_dict['password']
-        del user_as_dict['created']
-        del user_as_dict['email']
+        if user_profile_as_dict is None:
+            raise cls.DoesNotExist
 
-        user_profile_as_dict['user'] = user_as_dict
+        user = UserDtoWithoutEmail(**{
+            field: user_profile_as_dict.pop(f'user__{field}') for field in PROFILE_USER_FIELDS
+        })
 
-        return UserProfileDto(**user_profile_as_dict)
+        return UserProfileDto(user=user, **user_profile_as_dict)
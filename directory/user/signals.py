@@ -0,0 +1,7 @@
+"""
+Provide signals of user.
+"""
+from django.dispatch import Signal
+
+# Sent when users are changed by query set updates, which send no model signals. Lookups select the changed users.
+users_changed = Signal(providing_args=['lookups'])
@@ -220,6 +220,29 @@ class TestUserEmailConfirmSingle(TestCase):
         assert expected_result == response.json()
         assert HTTPStatus.OK == response.status_code
 
+    @patch('services.email.Email.send')
+    def test_confirm_user_email_number_of_queries(self, mock_email_send):
+        """
+        Case: confirm user email by user identifier.
+        Expect: email confirm state is read once, the user is confirmed by a single update, block producers
+            of the user are read once to invalidate their cached responses.
+        """
+        mock_email_send.return_value = None
+
+        self.client.post('/users/email/confirm/', json.dumps({
+            'email': self.email,
+        }), content_type='application/json')
+
+        user_identifier = EmailConfirmState.objects.get(email=self.email).identifier
+
+        with self.assertNumQueries(3):
+            response = self.client.post(
+                f'/users/email/confirm/{user_identifier}/', json.dumps({}), content_type='application/json',
+            )
+
+        assert User.objects.get(email=self.email).is_email_confirmed
+        assert HTTPStatus.OK == response.status_code
+
     def test_confirm_user_email_with_non_existent_identifier(self):
         """
         Case: confirm user email with non-existent identifier.
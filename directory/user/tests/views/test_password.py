@@ -7,6 +7,7 @@ from unittest.mock import patch
 
 from django.test import TestCase
 
+from generic.jwt import TOKEN_VERSIONS_CACHE
 from services.models import PasswordRecoveryState
 from user.models import User
 
@@ -51,6 +52,39 @@ class TestUserPasswordSingle(TestCase):
         assert expected_result == response.json()
         assert HTTPStatus.OK == response.status_code
 
+    def test_change_user_password_revokes_token(self):
+        """
+        Case: use the token obtained before the user password is changed.
+        Expect: token has been revoked error message.
+        """
+        TOKEN_VERSIONS_CACHE.clear()
+        self.addCleanup(TOKEN_VERSIONS_CACHE.clear)
+
+        expected_result = {
+            'detail': 'Token has been revoked.',
+        }
+
+        self.client.post('/users/martin.fowler/password/', json.dumps({
+            'old_password': 'martin.fowler.1337',
+            'new_password': 'martin.f.1337',
+        }), HTTP_AUTHORIZATION='JWT ' + self.user_token, content_type='application/json')
+
+        TOKEN_VERSIONS_CACHE.clear()
+
+        response = self.client.post('/users/martin.fowler/password/', json.dumps({
+            'old_password': 'martin.f.1337',
+            'new_password': 'martin.fowler.1337',
+        }), HTTP_AUTHORIZATION='JWT ' + self.user_token, content_type='application/json')
+
+        assert expected_result == response.json()
+        assert HTTPStatus.UNAUTHORIZED == response.status_code
+
+        response = self.client.post('/authentication/token/verification/', json.dumps({
+            'token': self.user_token,
+        }), content_type='application/json')
+
+        assert HTTPStatus.BAD_REQUEST == response.status_code
+
     def test_change_user_password_without_deletion_rights(self):
         """
         Case: changing a user password without deletion rights.
@@ -244,6 +278,29 @@ class TestUserPasswordRecoverSingle(TestCase):
         assert expected_result == response.json()
         assert HTTPStatus.OK == response.status_code
 
+    @patch('services.email.Email.send')
+    def test_recovery_user_password_number_of_queries(self, mock_email_send):
+        """
+        Case: recover user password by user identifier.
+        Expect: password recovery state is read and deactivated once, the user is read and saved once, cached
+            responses with block producers of the user are not invalidated as the password is not embedded into them.
+        """
+        mock_email_send.return_value = None
+
+        self.client.post('/users/password/recovery/', json.dumps({
+            'email': self.email,
+        }), content_type='application/json')
+
+        user_identifier = PasswordRecoveryState.objects.get(email=self.email).identifier
+
+        with self.assertNumQueries(4):
+            response = self.client.post(
+                f'/users/password/recovery/{user_identifier}/', json.dumps({}), content_type='application/json',
+            )
+
+        assert not PasswordRecoveryState.objects.get(email=self.email).is_active
+        assert HTTPStatus.OK == response.status_code
+
     def test_recovery_user_password_with_non_existent_identifier(self):
         """
         Case: recover user password with non-existent identifier.
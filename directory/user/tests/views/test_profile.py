@@ -131,6 +131,16 @@ class TestUserProfileSingle(TestCase):
         assert expected_result == response.json()
         assert HTTPStatus.OK == response.status_code
 
+    def test_get_user_profile_number_of_queries(self):
+        """
+        Case: get user profile.
+        Expect: user profile with its user is fetched by a single database query.
+        """
+        with self.assertNumQueries(1):
+            response = self.client.get(f'/users/{self.username}/profile/', content_type='application/json')
+
+        assert HTTPStatus.OK == response.status_code
+
     def test_get_user_by_non_existing_username(self):
         """
         Case: get user profile by non-existing username.
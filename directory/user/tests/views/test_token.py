@@ -0,0 +1,116 @@
+"""
+Provide tests for implementation of token obtaining endpoint.
+"""
+import json
+from http import HTTPStatus
+
+from django.contrib.auth.hashers import (
+    identify_hasher,
+    make_password,
+)
+from django.test import TestCase
+
+from user.models import User
+
+
+class TestTokenObtaining(TestCase):
+    """
+    Implements tests for implementation of token obtaining endpoint.
+    """
+
+    def setUp(self):
+        """
+        Setup.
+        """
+        self.user = User.objects.create_user(
+            email='martin.fowler@gmail.com',
+            username='martin.fowler',
+            password='martin.fowler.1337',
+            is_email_confirmed=True,
+        )
+
+    def test_obtain_token_by_email(self):
+        """
+        Case: obtain token by e-mail address.
+        Expect: token is returned, the user is fetched and verified by a single database query.
+        """
+        with self.assertNumQueries(1):
+            response = self.client.post('/authentication/token/obtaining/', json.dumps({
+                'username_or_email': 'martin.fowler@gmail.com',
+                'password': 'martin.fowler.1337',
+            }), content_type='application/json')
+
+        assert response.json().get('token')
+        assert HTTPStatus.OK == response.status_code
+
+    def test_obtain_token_by_username(self):
+        """
+        Case: obtain token by username.
+        Expect: token is returned.
+        """
+        response = self.client.post('/authentication/token/obtaining/', json.dumps({
+            'username_or_email': 'martin.fowler',
+            'password': 'martin.fowler.1337',
+        }), content_type='application/json')
+
+        assert response.json().get('token')
+        assert HTTPStatus.OK == response.status_code
+
+    def test_obtain_token_with_incorrect_password(self):
+        """
+        Case: obtain token with incorrect password.
+        Expect: unable to log in with provided credentials error message.
+        """
+        expected_result = {
+            'non_field_errors': [
+                'Unable to log in with provided credentials.',
+            ],
+        }
+
+        response = self.client.post('/authentication/token/obtaining/', json.dumps({
+            'username_or_email': 'martin.fowler',
+            'password': 'martin.fowler.1338',
+        }), content_type='application/json')
+
+        assert expected_result == response.json()
+        assert HTTPStatus.BAD_REQUEST == response.status_code
+
+    def test_obtain_token_by_inactive_user(self):
+        """
+        Case: obtain token by the user which account is disabled.
+        Expect: unable to log in with provided credentials error message.
+        """
+        User.objects.filter(id=self.user.id).update(is_active=False)
+
+        expected_result = {
+            'non_field_errors': [
+                'Unable to log in with provided credentials.',
+            ],
+        }
+
+        response = self.client.post('/authentication/token/obtaining/', json.dumps({
+            'username_or_email': 'martin.fowler',
+            'password': 'martin.fowler.1337',
+        }), content_type='application/json')
+
+        assert expected_result == response.json()
+        assert HTTPStatus.BAD_REQUEST == response.status_code
+
+    def test_obtain_token_rehashes_password(self):
+        """
+        Case: obtain token by the user which password is hashed by an outdated hasher.
+        Expect: token is returned, the password is hashed by the default hasher.
+        """
+        User.objects.filter(id=self.user.id).update(
+            password=make_password('martin.fowler.1337', hasher='pbkdf2_sha1'),
+        )
+
+        response = self.client.post('/authentication/token/obtaining/', json.dumps({
+            'username_or_email': 'martin.fowler',
+            'password': 'martin.fowler.1337',
+        }), content_type='application/json')
+
+        password = User.objects.get(id=self.user.id).password
+
+        assert 'pbkdf2_sha256' == identify_hasher(password).algorithm
+        assert HTTPStatus.OK == response.status_code
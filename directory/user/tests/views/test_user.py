@@ -5,7 +5,9 @@ import json
 from http import HTTPStatus
 
 from django.test import TestCase
+from rest_framework.exceptions import AuthenticationFailed
 
+from generic.jwt import TokenUser
 from user.models import User
 
 
@@ -56,6 +58,16 @@ class TestUserSingle(TestCase):
         assert expected_result == response.json()
         assert HTTPStatus.OK == response.status_code
 
+    def test_get_user_by_username_number_of_queries(self):
+        """
+        Case: get user.
+        Expect: user is fetched by a single database query.
+        """
+        with self.assertNumQueries(1):
+            response = self.client.get('/users/martin.fowler/', content_type='application/json')
+
+        assert HTTPStatus.OK == response.status_code
+
     def test_get_user_by_non_existing_username(self):
         """
         Case: get user by non-existing username.
@@ -86,6 +98,33 @@ class TestUserSingle(TestCase):
         assert expected_result == response.json()
         assert HTTPStatus.OK == response.status_code
 
+    def test_delete_user_revokes_token(self):
+        """
+        Case: request with the token of the deleted user, which token version has been cached before the deletion.
+        Expect: the token is revoked at once.
+        """
+        self.client.delete(
+            '/users/martin.fowler/', HTTP_AUTHORIZATION='JWT ' + self.user_token, content_type='application/json',
+        )
+
+        response = self.client.delete(
+            '/users/martin.fowler/', HTTP_AUTHORIZATION='JWT ' + self.user_token, content_type='application/json',
+        )
+
+        assert HTTPStatus.UNAUTHORIZED == response.status_code
+
+    def test_get_attribute_of_deleted_token_user(self):
+        """
+        Case: get attribute, which is not claimed by the token, of the token user deleted after authentication.
+        Expect: authentication failed error is raised instead of the user does not exist one.
+        """
+        token_user = TokenUser({'user_id': self.user.id, 'username': 'martin.fowler'})
+
+        User.objects.filter(id=self.user.id).delete()
+
+        with self.assertRaises(AuthenticationFailed):
+            token_user.is_email_confirmed
+
     def test_delete_user_without_deletion_rights(self):
         """
         Case: deleting a user without deletion rights.
@@ -6,8 +6,8 @@ from http import HTTPStatus
 from django.http import JsonResponse
 from rest_framework.decorators import authentication_classes
 from rest_framework.views import APIView
-from rest_framework_jwt.authentication import JSONWebTokenAuthentication
 
+from generic.jwt import StatelessJSONWebTokenAuthentication
 from services.avatar import (
     Avatar,
     AvatarTypes,
@@ -33,7 +33,7 @@ class UserAvatarSingle(APIView):
         self.user = User()
         self.profile = Profile()
 
-    @authentication_classes((JSONWebTokenAuthentication, ))
+    @authentication_classes((StatelessJSONWebTokenAuthentication, ))
     def post(self, request, username):
         """
         Upload user avatar.
@@ -54,8 +54,6 @@ class UserAvatarSingle(APIView):
         avatar = Avatar(name=file_to_upload_name, type_=AvatarTypes.user)
         avatar.upload(file_object=file_to_upload)
 
-        UpdateUserProfile(user=self.user, profile=self.profile).do(
-            username=username, info={'avatar_url': avatar.get_url()},
-        )
+        UpdateUserProfile(profile=self.profile).do(user_id=request.user.id, info={'avatar_url': avatar.get_url()})
 
         return JsonResponse({'result': 'User avatar has been uploaded.'}, status=HTTPStatus.OK)
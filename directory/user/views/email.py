@@ -10,8 +10,8 @@ from rest_framework.decorators import (
 )
 from rest_framework.permissions import AllowAny
 from rest_framework.views import APIView
-from rest_framework_jwt.authentication import JSONWebTokenAuthentication
 
+from generic.jwt import StatelessJSONWebTokenAuthentication
 from services.constants import (
     EmailBody,
     EmailSubject,
@@ -47,7 +47,7 @@ class UserEmailSingle(APIView):
         """
         self.user = User()
 
-    @authentication_classes((JSONWebTokenAuthentication, ))
+    @authentication_classes((StatelessJSONWebTokenAuthentication, ))
     def post(self, request, username):
         """
         Change user e-mail.
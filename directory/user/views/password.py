@@ -10,8 +10,8 @@ from rest_framework.decorators import (
 )
 from rest_framework.permissions import AllowAny
 from rest_framework.views import APIView
-from rest_framework_jwt.authentication import JSONWebTokenAuthentication
 
+from generic.jwt import StatelessJSONWebTokenAuthentication
 from services.constants import (
     EmailBody,
     EmailSubject,
@@ -48,7 +48,7 @@ class UserPasswordSingle(APIView):
         """
         self.user = User()
 
-    @authentication_classes((JSONWebTokenAuthentication, ))
+    @authentication_classes((StatelessJSONWebTokenAuthentication, ))
     def post(self, request, username):
         """
         Change user password.
@@ -58,7 +58,7 @@ class UserPasswordSingle(APIView):
                 {'error': UserHasNoAuthorityToChangePasswordForThisUserError().message}, status=HTTPStatus.BAD_REQUEST,
             )
 
-        email = request.user.email
+        user_id = request.user.id
 
         old_password = request.data.get('old_password')
         new_password = request.data.get('new_password')
@@ -72,9 +72,9 @@ class UserPasswordSingle(APIView):
             return JsonResponse({'errors': form.errors}, status=HTTPStatus.BAD_REQUEST)
 
         try:
-            ChangeUserPassword(user=self.user).do(email=email, old_password=old_password, new_password=new_password)
-        except UserWithSpecifiedEmailAddressDoesNotExistError as error:
-            return JsonResponse({'error': error.message}, status=HTTPStatus.NOT_FOUND)
+            ChangeUserPassword(user=self.user).do(
+                user_id=user_id, old_password=old_password, new_password=new_password,
+            )
         except SpecifiedUserPasswordIsIncorrectError as error:
             return JsonResponse({'error': error.message}, status=HTTPStatus.BAD_REQUEST)
 
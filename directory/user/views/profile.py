@@ -10,8 +10,8 @@ from rest_framework.decorators import (
 )
 from rest_framework.permissions import AllowAny
 from rest_framework.views import APIView
-from rest_framework_jwt.authentication import JSONWebTokenAuthentication
 
+from generic.jwt import StatelessJSONWebTokenAuthentication
 from user.domain.errors import (
     UserHasNoAuthorityToUpdateThisUserProfileError,
     UserWithSpecifiedUsernameDoesNotExistError,
@@ -54,7 +54,7 @@ class UserProfileSingle(APIView):
 
         return JsonResponse({'result': serialized_user}, status=HTTPStatus.OK)
 
-    @authentication_classes((JSONWebTokenAuthentication, ))
+    @authentication_classes((StatelessJSONWebTokenAuthentication, ))
     def post(self, request, username):
         """
         Update user profile.
@@ -71,10 +71,6 @@ class UserProfileSingle(APIView):
 
         non_empty_request_data = {key: form.cleaned_data[key] for key in request.data}
 
-        try:
-            UpdateUserProfile(user=self.user, profile=self.profile).do(username=username, info=non_empty_request_data)
-
-        except UserWithSpecifiedUsernameDoesNotExistError as error:
-            return JsonResponse({'error': error.message}, status=HTTPStatus.NOT_FOUND)
+        UpdateUserProfile(profile=self.profile).do(user_id=request.user.id, info=non_empty_request_data)
 
         return JsonResponse({'result': 'User profile has been updated.'}, status=HTTPStatus.OK)
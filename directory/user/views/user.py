@@ -10,8 +10,11 @@ from rest_framework.decorators import (
 )
 from rest_framework.permissions import AllowAny
 from rest_framework.views import APIView
-from rest_framework_jwt.authentication import JSONWebTokenAuthentication
 
+from generic.jwt import (
+    TOKEN_VERSIONS_CACHE,
+    StatelessJSONWebTokenAuthentication,
+)
 from user.domain.errors import (
     UserHasNoAuthorityToDeleteThisAccountError,
     UserWithSpecifiedUsernameDoesNotExistError,
@@ -33,6 +36,7 @@ class UserSingle(APIView):
         Constructor.
         """
         self.user = User()
+        self.token_versions_cache = TOKEN_VERSIONS_CACHE
 
     @permission_classes((AllowAny, ))
     def get(self, request, username):
@@ -47,7 +51,7 @@ class UserSingle(APIView):
         serialized_user = user.to_dict()
         return JsonResponse({'result': serialized_user}, status=HTTPStatus.OK)
 
-    @authentication_classes((JSONWebTokenAuthentication, ))
+    @authentication_classes((StatelessJSONWebTokenAuthentication, ))
     def delete(self, request, username):
         """
         Delete user.
@@ -57,10 +61,7 @@ class UserSingle(APIView):
                 {'error': UserHasNoAuthorityToDeleteThisAccountError().message}, status=HTTPStatus.BAD_REQUEST,
             )
 
-        try:
-            DeleteUser(user=self.user).do(username=username)
-        except UserWithSpecifiedUsernameDoesNotExistError as error:
-            return JsonResponse({'error': error.message}, status=HTTPStatus.NOT_FOUND)
+        DeleteUser(user=self.user, token_versions_cache=self.token_versions_cache).do(user_id=request.user.id)
 
         return JsonResponse({'result': 'User has been deleted.'}, status=HTTPStatus.OK)
 
@@ -70,7 +71,7 @@ class UserFromTokenSingle(APIView):
     Single user from token endpoint implementation.
     """
 
-    @permission_classes((JSONWebTokenAuthentication, ))
+    @permission_classes((StatelessJSONWebTokenAuthentication, ))
     def get(self, request):
         """
         Get user.
@@ -4,6 +4,7 @@ source $(dirname $0)/database-utils.sh
 
 wait_until_postgres_is_started && \
     python directory/manage.py migrate && \
+    python directory/manage.py createcachetable && \
     create_database_fixtures && \
     create_database_super_user
 
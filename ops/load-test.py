@@ -0,0 +1,138 @@
+"""
+Provide load test comparing throughput of the production server with the development server.
+
+Every server is started on its own port with the same environment, warmed up and loaded by concurrent clients
+requesting read endpoints in turn. Throughput and latency percentiles are reported per server.
+
+Run it from the root of the project against a database with data, e.g. generated by `generate_directory` command:
+
+    $ python ops/load-test.py --requests 2000 --concurrency 16
+"""
+import argparse
+import itertools
+import os
+import signal
+import subprocess
+import sys
+import time
+from concurrent.futures import ThreadPoolExecutor
+from statistics import median
+
+import requests
+
+ROOT_DIRECTORY = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+SERVERS = {
+    'runserver': [sys.executable, 'directory/manage.py', 'runserver', '--noreload', '0.0.0.0:{port}'],
+    'gunicorn': ['gunicorn', '--config', 'ops/production/gunicorn.conf.py', '--chdir', 'directory', 'wsgi:application'],
+}
+
+PATHS = (
+    '/block-producers/?limit=20',
+    '/block-producers/1/',
+    '/block-producers/1/comments/',
+    '/block-producers/likes/numbers/',
+    '/block-producers/search/?phrase=validator&limit=20',
+)
+
+
+def wait_until_started(url, timeout=30):
+    """
+    Wait until the server responds to requests.
+    """
+    deadline = time.monotonic() + timeout
+
+    while time.monotonic() < deadline:
+        try:
+            requests.get(url, timeout=1)
+            return
+        except requests.ConnectionError:
+            time.sleep(0.2)
+
+    raise RuntimeError(f'Server at {url} has not started in {timeout} seconds.')
+
+
+def load(base_url, requests_number, concurrency):
+    """
+    Send the number of requests to the paths in turn by concurrent clients.
+
+    Returns throughput in requests per second, latencies in milliseconds and the number of failed requests.
+    """
+    paths = list(itertools.islice(itertools.cycle(PATHS), requests_number))
+    sessions = [requests.Session() for _ in range(concurrency)]
+
+    def request(index):
+        started_at = time.perf_counter()
+        response = sessions[index % concurrency].get(base_url + paths[index], timeout=30)
+        return (time.perf_counter() - started_at) * 1000, response.status_code
+
+    started_at = time.perf_counter()
+
+    with ThreadPoolExecutor(max_workers=concurrency) as executor:
+        results = list(executor.map(request, range(requests_number)))
+
+    duration = time.perf_counter() - started_at
+
+    latencies = sorted(latency for latency, _ in results)
+    failures = sum(1 for _, status_code in results if status_code >= 500)
+
+    return requests_number / duration, latencies, failures
+
+
+def run_server(name, port, requests_number, concurrency):
+    """
+    Start the server, load it and stop it. Returns the report line of the server.
+    """
+    command = [part.format(port=port) for part in SERVERS[name]]
+    environment = dict(os.environ, PORT=str(port))
+
+    process = subprocess.Popen(
+        command, cwd=ROOT_DIRECTORY, env=environment, stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL,
+    )
+
+    base_url = f'http://127.0.0.1:{port}'
+
+    try:
+        wait_until_started(base_url + PATHS[0])
+        load(base_url, requests_number=min(requests_number, 100), concurrency=concurrency)
+
+        throughput, latencies, failures = load(base_url, requests_number=requests_number, concurrency=concurrency)
+
+    finally:
+        process.send_signal(signal.SIGTERM)
+        process.wait(timeout=60)
+
+    p95 = latencies[int(len(latencies) * 0.95) - 1]
+    p99 = latencies[int(len(latencies) * 0.99) - 1]
+
+    return f'{name:<10} {throughput:>12.1f} {median(latencies):>10.1f} {p95:>10.1f} {p99:>10.1f} {failures:>9}'
+
+
+def main():
+    """
+    Load the servers and print the report.
+    """
+    parser = argparse.ArgumentParser(description='Compare throughput of the production and development servers.')
+    parser.add_argument('--requests', type=int, default=2000)
+    parser.add_argument('--concurrency', type=int, default=16)
+    parser.add_argument('--servers', nargs='+', choices=list(SERVERS), default=list(SERVERS))
+    parser.add_argument('--port', type=int, default=8100)
+    arguments = parser.parse_args()
+
+    header = f'{"server":<10} {"requests/s":>12} {"p50, ms":>10} {"p95, ms":>10} {"p99, ms":>10} {"failures":>9}'
+    sys.stdout.write(header + '\n')
+
+    for offset, name in enumerate(arguments.servers):
+        line = run_server(
+            name,
+            port=arguments.port + offset,
+            requests_number=arguments.requests,
+            concurrency=arguments.concurrency,
+        )
+
+        sys.stdout.write(line + '\n')
+        sys.stdout.flush()
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,37 @@
+"""
+Provide configuration of Gunicorn pre-fork server of the production.
+
+Workers are forked from the master process with the application preloaded, so they share its memory copy-on-write.
+Send HUP to the master process to gracefully replace workers, the new workers are forked from the preloaded
+application, so restart the master process to serve new code.
+"""
+import os
+
+bind = f'0.0.0.0:{os.environ.get("PORT", 8000)}'
+
+# Containers report CPU cores of the host rather than their own limits, and every worker keeps its own database
+# connection and memory, so the number of workers is fixed unless it is specified for the instance size.
+workers = int(os.environ.get('WEB_CONCURRENCY', 2))
+threads = int(os.environ.get('GUNICORN_THREADS', 1))
+worker_class = 'gthread' if threads > 1 else 'sync'
+
+preload_app = True
+
+# Workers silent for longer than the timeout are killed and replaced, requests are given the graceful timeout to finish
+# when workers are replaced. Replacing workers after a number of requests limits the growth of their memory.
+timeout = int(os.environ.get('GUNICORN_TIMEOUT', 30))
+graceful_timeout = int(os.environ.get('GUNICORN_GRACEFUL_TIMEOUT', 30))
+keepalive = int(os.environ.get('GUNICORN_KEEPALIVE', 5))
+max_requests = int(os.environ.get('GUNICORN_MAX_REQUESTS', 1000))
+max_requests_jitter = int(os.environ.get('GUNICORN_MAX_REQUESTS_JITTER', 100))
+
+accesslog = '-'
+errorlog = '-'
+
+
+def post_fork(server, worker):
+    """
+    Close database connections inherited from the master process, so workers never share a connection.
+    """
+    from django.db import connections
+    connections.close_all()
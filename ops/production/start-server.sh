@@ -2,8 +2,8 @@
 
 source $(dirname $0)/database-utils.sh
 
-python directory/manage.py migrate && \
+python directory/manage.py migrate && python directory/manage.py createcachetable && \
     if [ "$ENVIRONMENT" = "REVIEW-APP" ]; then create_database_fixtures && create_database_super_user; fi
 
 python directory/manage.py collectstatic --noinput
-python directory/manage.py runserver 0.0.0.0:$PORT
+exec gunicorn --config ops/production/gunicorn.conf.py --chdir directory wsgi:application